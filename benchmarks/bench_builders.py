@@ -0,0 +1,333 @@
+# benchmarks/bench_builders.py
+# Throughput + allocation benchmark for every prompt builder and helper
+#
+# Each case runs one builder at three input scales — an empty form, a typical
+# student submission, and a worst case (20,000-word draft / 50 KB transcript
+# or constraints block) — and records:
+#   ops_per_s        best-of-N throughput of the uncached build (`__wrapped__`)
+#   us_per_op        the same, as microseconds per call
+#   hit_us_per_op    the RECIPES cache-hit path (normalize + hash + lookup),
+#                    for builders served from jt_tools.recipe_cache
+#   peak_alloc_bytes tracemalloc peak above baseline during one build
+#   alloc_ratio      peak_alloc_bytes / out_bytes (transient copies per output byte)
+#   out_bytes        size of the result
+#
+# Results go to a JSON file; --compare flags cases that got slower or
+# allocate more than a baseline file by more than --threshold.
+#
+#   python benchmarks/bench_builders.py [--out bench.json] [--filter grr] [--min-time 0.2] [--repeat 5]
+#   python benchmarks/bench_builders.py --out head.json --compare base.json
+#   python benchmarks/bench_builders.py --head head.json --compare base.json   # no run, files only
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_constraints import CORPUS, build_block  # noqa: E402
+from jt_tools import long_review, templates  # noqa: E402
+from jt_tools.recipe_cache import RECIPES  # noqa: E402
+
+SCALES = ("empty", "typical", "large")
+DRAFT_WORDS = 20_000
+TRANSCRIPT_BYTES = 50 * 1024
+
+_VOCAB = (
+    "the council voted to cut the lunch program after a budget review and parents said "
+    "students would lose access to meals district officials declined to comment on "
+    "whether the memo was shared with principals before the vote according to records "
+    "obtained by the paper"
+).split()
+
+
+# ---------- Inputs ----------
+
+def words(n: int, seed: int = 0) -> str:
+    """n words of newsroom-ish prose in paragraphs of ~120 words."""
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        out.append(rng.choice(_VOCAB))
+        if i % 120 == 119:
+            out.append("\n\n")
+    return " ".join(out)
+
+
+def transcript(n_bytes: int) -> str:
+    """Alternating coach/student turns, cut to n_bytes."""
+    turns, size, i = [], 0, 0
+    while size < n_bytes:
+        who = "Coach" if i % 2 == 0 else "Student"
+        turn = f"{who}: {words(60, seed=i)}"
+        turns.append(turn)
+        size += len(turn) + 2
+        i += 1
+    return "\n\n".join(turns)[:n_bytes]
+
+
+def _prep_args(scale: str) -> dict:
+    if scale == "empty":
+        return dict(level="High School journalist", lens="Standard News Editor", aim="", why_person="",
+                    musts=["", "", ""], pushbacks="", constraints="", recording="", team_up=None, ethics="")
+    if scale == "typical":
+        return dict(
+            level="High School journalist", lens="Skeptical Editor",
+            aim="Understand why the district changed the lunch policy and how it affects students",
+            why_person="They authored the policy memo and can explain the decision",
+            musts=["What changed and why", "The decision timeline", "what changed and why"],
+            pushbacks="'I can't discuss personnel'", constraints=CORPUS[0], recording=CORPUS[0],
+            team_up="classmate on notes", ethics="Avoid naming minors without consent",
+        )
+    big = words(DRAFT_WORDS // 4)
+    return dict(
+        level="Working journalist", lens="Audience Advocate", aim=big, why_person=big,
+        musts=[words(200, seed=s) for s in range(50)] * 2, pushbacks=big,
+        constraints=build_block(TRANSCRIPT_BYTES), recording=big, team_up=big, ethics=big,
+    )
+
+
+def _qr_args(scale: str) -> dict:
+    if scale == "empty":
+        return dict(level="High School journalist")
+    n = 600 if scale == "typical" else DRAFT_WORDS
+    return dict(level="Undergraduate journalist", draft="HED: Lunch program cut\n\n" + words(n),
+                publication="school paper", story_purpose="Why the lunch program was cut",
+                criticized="The principal", unsure="Whether the budget figure is right")
+
+
+def _qr_part_args(scale: str) -> dict:
+    args = _qr_args(scale)
+    draft = args.pop("draft", "")
+    return dict(args, part=draft, index=3, total=12, opening=draft[:800])
+
+
+def _qr_synthesis_args(scale: str) -> dict:
+    args = _qr_args(scale)
+    draft = args.pop("draft", "")
+    n = {"empty": 0, "typical": 4, "large": 40}[scale]
+    return dict(args, total=n, opening=draft[:800], part_notes=tuple(words(150, seed=i) for i in range(n)))
+
+
+def _grr_args(path: str, scale: str) -> dict:
+    fields = templates.GRR_TEMPLATES[path].fields
+    if scale == "empty":
+        return {"level": "High School journalist"}
+    n = 30 if scale == "typical" else DRAFT_WORDS // len(fields)
+    return {"level": "Grad school journalist", **{f: words(n, seed=i) for i, f in enumerate(fields) if f != "level"}}
+
+
+def _pitch_args(scale: str) -> dict:
+    if scale == "empty":
+        return dict(level="High School journalist")
+    n = 150 if scale == "typical" else DRAFT_WORDS
+    return dict(level="Working journalist", pitch_text=words(n), story_type_choice="Event",
+                prior_coverage=words(40, 1), prior_coverage_effect=words(20, 2), target_audience="students",
+                reporting_stage="Just an idea", working_headline="Lunch cut", key_conflict="budget vs. need",
+                sources="memo; board minutes")
+
+
+def _constraints_text(scale: str) -> str:
+    return {"empty": "", "typical": CORPUS[1], "large": build_block(TRANSCRIPT_BYTES)}[scale]
+
+
+def _dedupe_items(scale: str) -> list:
+    if scale == "empty":
+        return []
+    if scale == "typical":
+        return ["What changed", "Timeline", "what changed "]
+    return [words(8, seed=i % 2000) for i in range(DRAFT_WORDS)]
+
+
+def _transcript_text(scale: str) -> str:
+    return {"empty": "", "typical": transcript(4 * 1024), "large": transcript(TRANSCRIPT_BYTES)}[scale]
+
+
+# name -> (builder, scale -> (args, kwargs))
+CASES = {
+    "make_recipe": (templates.make_recipe, lambda s: ((), _prep_args(s))),
+    "infer_time_mode": (templates.infer_time_mode, lambda s: ((_constraints_text(s),), {})),
+    "dedupe_keep_order": (templates.dedupe_keep_order, lambda s: ((_dedupe_items(s),), {})),
+    "quick_review_prompt": (templates.quick_review_prompt, lambda s: ((), _qr_args(s))),
+    "quick_review_part_prompt": (templates.quick_review_part_prompt, lambda s: ((), _qr_part_args(s))),
+    "quick_review_synthesis_prompt": (templates.quick_review_synthesis_prompt, lambda s: ((), _qr_synthesis_args(s))),
+    "split_draft": (lambda draft: list(long_review.split_draft(draft)), lambda s: ((_qr_args(s).get("draft", ""),), {})),
+    "grr_prompt.event": (templates.grr_prompt, lambda s: (("event",), _grr_args("event", s))),
+    "grr_prompt.explore": (templates.grr_prompt, lambda s: (("explore",), _grr_args("explore", s))),
+    "grr_prompt.confirm": (templates.grr_prompt, lambda s: (("confirm",), _grr_args("confirm", s))),
+    "pitch_prompt": (templates.pitch_prompt, lambda s: ((), _pitch_args(s))),
+    "reviewer_prompt": (templates.reviewer_prompt, lambda s: ((_transcript_text(s),), {})),
+}
+
+
+# ---------- Measurement ----------
+
+def _loops_for(call, min_time: float) -> int:
+    """Calls per timing sample so one sample takes at least min_time (like timeit.autorange)."""
+    n = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(n):
+            call()
+        if time.perf_counter() - t0 >= min_time:
+            return n
+        n *= 2
+
+
+def _time(call, min_time: float, repeat: int) -> float:
+    """Best-of-`repeat` seconds per call."""
+    loops = _loops_for(call, min_time)
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            call()
+        best = min(best, (time.perf_counter() - t0) / loops)
+    return best
+
+
+def _peak_alloc(call) -> int:
+    """Peak traced bytes above baseline during one call (result included)."""
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - base
+
+
+def run_case(name: str, scale: str, min_time: float, repeat: int) -> dict:
+    fn, make_args = CASES[name]
+    args, kwargs = make_args(scale)
+    build = getattr(fn, "__wrapped__", fn)
+
+    def call():
+        return build(*args, **kwargs)
+
+    out = call()
+    per_op = _time(call, min_time, repeat)
+    peak = _peak_alloc(call)
+    out_bytes = len(out.encode()) if isinstance(out, str) else len(repr(out).encode())
+    row = {
+        "case": name,
+        "scale": scale,
+        "in_bytes": sum(len(str(v).encode()) for v in (*args, *kwargs.values())),
+        "out_bytes": out_bytes,
+        "ops_per_s": 1.0 / per_op,
+        "us_per_op": per_op * 1e6,
+        "hit_us_per_op": None,
+        "peak_alloc_bytes": peak,
+        "alloc_ratio": peak / max(out_bytes, 1),
+    }
+    if build is not fn:
+        RECIPES.clear()
+        fn(*args, **kwargs)  # prime the entry
+        row["hit_us_per_op"] = _time(lambda: fn(*args, **kwargs), min_time, repeat) * 1e6
+        RECIPES.clear()
+    return row
+
+
+def _git_rev() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ---------- Compare ----------
+
+def compare(base: dict, head: dict, threshold: float) -> list[str]:
+    """Lines describing every case that regressed by more than `threshold` (0.10 = 10%)."""
+    old = {(r["case"], r["scale"]): r for r in base["results"]}
+    regressions = []
+    print(f"\n{'case':<22} {'scale':<8} {'us/op base':>11} {'head':>11} {'Δ':>7} {'peak KB base':>13} {'head':>9} {'Δ':>7}")
+    for r in head["results"]:
+        b = old.get((r["case"], r["scale"]))
+        if b is None:
+            continue
+        dt = r["us_per_op"] / b["us_per_op"] - 1 if b["us_per_op"] else 0.0
+        dm = (r["peak_alloc_bytes"] - b["peak_alloc_bytes"]) / max(b["peak_alloc_bytes"], 1024)
+        flag = ""
+        if dt > threshold:
+            flag += " SLOWER"
+        if dm > threshold:
+            flag += " MORE-ALLOC"
+        print(f"{r['case']:<22} {r['scale']:<8} {b['us_per_op']:>11.1f} {r['us_per_op']:>11.1f} {dt:>+7.0%} "
+              f"{b['peak_alloc_bytes'] / 1024:>13.1f} {r['peak_alloc_bytes'] / 1024:>9.1f} {dm:>+7.0%}{flag}")
+        if flag:
+            regressions.append(f"{r['case']}[{r['scale']}]:{flag} (time {dt:+.0%}, peak alloc {dm:+.0%})")
+    return regressions
+
+
+# ---------- CLI ----------
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--out", help="write results JSON here")
+    ap.add_argument("--filter", default="", help="only cases whose name contains this")
+    ap.add_argument("--scales", default=",".join(SCALES))
+    ap.add_argument("--min-time", type=float, default=0.2, help="seconds per timing sample")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--compare", metavar="BASE.json", help="flag regressions against a previous run")
+    ap.add_argument("--head", metavar="HEAD.json", help="compare this file instead of running")
+    ap.add_argument("--threshold", type=float, default=0.10, help="relative slowdown/alloc growth to flag")
+    args = ap.parse_args(argv)
+
+    if args.head:
+        with open(args.head) as f:
+            head = json.load(f)
+    else:
+        scales = [s for s in args.scales.split(",") if s]
+        results = []
+        print(f"{'case':<22} {'scale':<8} {'in KB':>8} {'ops/s':>11} {'us/op':>10} {'hit us':>8} {'peak KB':>9} {'x out':>7}")
+        for name in CASES:
+            if args.filter not in name:
+                continue
+            for scale in scales:
+                r = run_case(name, scale, args.min_time, args.repeat)
+                results.append(r)
+                hit = f"{r['hit_us_per_op']:.1f}" if r["hit_us_per_op"] is not None else "-"
+                print(f"{name:<22} {scale:<8} {r['in_bytes'] / 1024:>8.1f} {r['ops_per_s']:>11,.0f} "
+                      f"{r['us_per_op']:>10.1f} {hit:>8} {r['peak_alloc_bytes'] / 1024:>9.1f} {r['alloc_ratio']:>7.1f}")
+        head = {
+            "commit": _git_rev(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "min_time": args.min_time,
+            "repeat": args.repeat,
+            "results": results,
+        }
+        if args.out:
+            with open(args.out, "w") as f:
+                json.dump(head, f, indent=1)
+            print(f"\nwrote {len(results)} results to {args.out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            base = json.load(f)
+        print(f"\nbase {base.get('commit')} → head {head.get('commit')}  (threshold {args.threshold:.0%})")
+        regressions = compare(base, head, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s):")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nno regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+# benchmarks/bench_constraints.py
+# Corpus-driven scaling benchmark for jt_tools.constraints.parse_constraints()
+#
+# Builds constraint blocks of increasing size from a corpus of realistic
+# student answers (the kind that get pasted whole into the prep form) and
+# reports time per character. A linear parser keeps ns/char flat as the
+# block grows. The pre-parser regex cascade is kept here for comparison.
+#
+#   python benchmarks/bench_constraints.py [--sizes 1000,10000,100000] [--repeat 5] [--corpus normal]
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jt_tools.constraints import parse_constraints  # noqa: E402
+
+CORPUS = [
+    "10 minutes in hallway after meeting; phone call; Zoom; plan to record on phone + backup",
+    "She gave me 30-45 minutes at her office. I'll take notes and record with a voice memo.",
+    "Phone interview, maybe 20 to 30 mins. He said no recording, so shorthand notes only.",
+    "Quick Q&A at the press gaggle after the council vote — probably five or so min.",
+    "Zoom call, 1 hour blocked off, recording via zoom with permission.",
+    "Half an hour over coffee near campus; in person; notebook plus recorder as backup.",
+    "Doorstep at the district office, under 10 min, informal. Can't record, will take notes.",
+    "FaceTime with the coach after practice. Not sure how long. Otter for transcription.",
+    "We have availability Tuesday between classes (approx. 15 min), face-to-face in room 204.",
+    "Standup interview before the meeting; ten-minute window; recording on my phone.",
+]
+
+
+def legacy_infer_time_mode(constraints_text: str) -> str:
+    """The regex cascade parse_constraints() replaced (pre-parser infer_time_mode)."""
+    t = (constraints_text or "").lower()
+    nums = []
+    for a, b in re.findall(r"\b(\d+)\s*(?:-|–|—|to)?\s*(\d+)?\s*(?:min(?:s|\.|ute)?|m)\b", t):
+        nums.append(int(a))
+        if b:
+            nums.append(int(b))
+    for a in re.findall(r"\b(\d+)\s*[- ]?\s*minute(?:s)?\b", t):
+        nums.append(int(a))
+    if re.search(r"\b(under|≤|<=|~|approx(?:\.|imately)?)\s*10\b.*\bmin", t):
+        nums.append(10)
+    if nums and min(nums) <= 10:
+        return "SHORT"
+    words = {"five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10}
+    if any(re.search(rf"\b{w}\b.*\bmin", t) for w in words):
+        return "SHORT"
+    hints = [
+        "informal", "hallway", "scrum", "gaggle", "doorstep", "standup", "stand-up",
+        "before the meeting", "after the meeting", "quick", "q&a", "press gaggle",
+        "avail", "availability", "door stop",
+    ]
+    if any(h in t for h in hints):
+        return "SHORT"
+    return "NORMAL"
+
+
+# Answers with no SHORT cue: the cascade cannot exit early and runs every pass.
+NORMAL_CORPUS = [c for c in CORPUS if legacy_infer_time_mode(c) == "NORMAL"]
+
+
+def build_block(n_chars: int, corpus=CORPUS) -> str:
+    """Cycle the corpus (one answer per line) until the block reaches n_chars."""
+    lines, total, i = [], 0, 0
+    while total < n_chars:
+        line = corpus[i % len(corpus)]
+        lines.append(line)
+        total += len(line) + 1
+        i += 1
+    return "\n".join(lines)[:n_chars]
+
+
+def best_of(fn, text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--sizes", default="1000,10000,100000,1000000",
+                    help="comma-separated block sizes in characters")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--corpus", choices=["mixed", "normal"], default="mixed",
+                    help="'normal' uses only answers without SHORT cues (no early exit for the cascade)")
+    args = ap.parse_args(argv)
+    corpus = CORPUS if args.corpus == "mixed" else NORMAL_CORPUS
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    # Sanity: the parser agrees with the cascade on every corpus answer.
+    for line in CORPUS:
+        assert parse_constraints(line).mode == legacy_infer_time_mode(line), line
+
+    print(f"{'chars':>10} {'parser ms':>10} {'ns/char':>8} {'legacy ms':>10} {'ns/char':>8}")
+    per_char = []
+    for n in sizes:
+        text = build_block(n, corpus)
+        t_new = best_of(parse_constraints, text, args.repeat)
+        t_old = best_of(legacy_infer_time_mode, text, args.repeat)
+        per_char.append(t_new / n)
+        print(f"{n:>10} {t_new * 1e3:>10.3f} {t_new / n * 1e9:>8.1f} "
+              f"{t_old * 1e3:>10.3f} {t_old / n * 1e9:>8.1f}")
+
+    # Linear scaling => ns/char at the largest size stays close to the smallest.
+    ratio = per_char[-1] / per_char[0]
+    print(f"\nparser ns/char ratio (largest/smallest): {ratio:.2f}  (≈1.0 is linear)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
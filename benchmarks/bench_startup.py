@@ -0,0 +1,95 @@
+# benchmarks/bench_startup.py
+# Cold-start benchmark: time-to-first-portal-render + `-X importtime` breakdown
+#
+# Each sample is a fresh interpreter started with `-X importtime` that renders
+# the portal once through Streamlit's AppTest. The child reports the first
+# script run's wall time and which jt_tools modules were imported by it; the
+# parent parses the importtime lines from stderr.
+#
+#   python benchmarks/bench_startup.py [--samples 5] [--top 15]
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+
+_IMPORTTIME = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def child():
+    t0 = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    t_streamlit = time.perf_counter() - t0
+
+    at = AppTest.from_file(APP, default_timeout=60)
+    t1 = time.perf_counter()
+    at.run()
+    t_render = time.perf_counter() - t1
+    if at.exception:
+        raise SystemExit(f"portal render failed: {at.exception}")
+
+    print(json.dumps({
+        "streamlit_import_s": t_streamlit,
+        "first_render_s": t_render,
+        "jt_modules": sorted(m for m in sys.modules if m.startswith("jt_tools")),
+    }))
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Top-level (depth-0) package -> cumulative import time in µs."""
+    cumulative = {}
+    for line in stderr.splitlines():
+        m = _IMPORTTIME.match(line)
+        if m:
+            cum_us, indent, name = int(m.group(2)), m.group(3), m.group(4)
+            if len(indent) <= 1:  # direct imports of the measured process
+                cumulative[name] = cumulative.get(name, 0) + cum_us
+    return cumulative
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--samples", type=int, default=5)
+    ap.add_argument("--top", type=int, default=15, help="slowest imports to list")
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+    if args.child:
+        child()
+        return 0
+
+    renders, walls, last_imports, jt_modules = [], [], {}, []
+    for _ in range(args.samples):
+        t0 = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", os.path.abspath(__file__), "--child"],
+            capture_output=True, text=True, cwd=ROOT,
+            env={**os.environ, "PYTHONPATH": ROOT},
+        )
+        walls.append(time.perf_counter() - t0)
+        if proc.returncode != 0:
+            print(proc.stderr[-2000:], file=sys.stderr)
+            return proc.returncode
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        renders.append(result["first_render_s"])
+        jt_modules = result["jt_modules"]
+        last_imports = parse_importtime(proc.stderr)
+
+    print(f"samples:                      {args.samples}")
+    print(f"process start → portal (p50): {statistics.median(walls) * 1e3:8.1f} ms")
+    print(f"first portal script run (p50):{statistics.median(renders) * 1e3:8.1f} ms")
+    print(f"jt_tools modules loaded:      {', '.join(jt_modules) or '(none)'}")
+    print(f"\nslowest top-level imports (last sample, cumulative):")
+    for name, us in sorted(last_imports.items(), key=lambda kv: kv[1], reverse=True)[:args.top]:
+        print(f"  {us / 1e3:8.1f} ms  {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+# benchmarks/load_classroom.py
+# Classroom load harness: N simulated students driving app.py through AppTest
+#
+# Every student is a thread with its own AppTest session in this one process,
+# sharing the process-wide caches the way sessions on one Streamlit server do.
+# Each student runs one of the flows below (round-robin), typing realistic-size
+# answers and hitting "Generate" at the same time as everyone else (or spread
+# over --ramp seconds).
+#
+# AppTest installs a process-global mock Runtime for the length of each run,
+# so script runs are serialized here behind one lock. On a real server the
+# (CPU-bound) script threads mostly serialize on the GIL anyway, so
+# "wait + run" is a fair model of what a student sees when the class clicks
+# Generate together.
+#
+# Reported:
+#   per-page p50 / p99 / max script-run time (the page shown after the run)
+#   per-page p50 / p99 latency including the wait for the run lock
+#   script runs per flow (every AppTest.run() a flow needed) and per navigation
+#   flow wall time p50 / p99, failures, and peak process RSS
+#
+#   python benchmarks/load_classroom.py [--users 40] [--flows pitch,grr,quick_review,prep]
+#                                       [--ramp 0] [--think 0] [--json out.json]
+
+import argparse
+import json
+import os
+import random
+import resource
+import statistics
+import sys
+import threading
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from bench_builders import transcript, words  # noqa: E402
+from jt_tools import router  # noqa: E402
+
+_RUN_LOCK = threading.Lock()
+
+
+class Student:
+    """One browser session. Times every script run and tags it with the page it rendered."""
+
+    def __init__(self, think: float, timeout: float):
+        self.at = AppTest.from_file(APP, default_timeout=timeout)
+        self.think = think
+        self.runs: list[tuple[str, float, float]] = []  # (page, run s, wait + run s)
+
+    def _run(self, widget=None):
+        if self.think:
+            time.sleep(random.uniform(0.5, 1.5) * self.think)
+        t_queued = time.perf_counter()
+        with _RUN_LOCK:
+            t0 = time.perf_counter()
+            if widget is None:
+                self.at.run()
+            else:
+                widget.run()
+            t1 = time.perf_counter()
+        if self.at.exception:
+            raise RuntimeError(f"{self._page()}: {self.at.exception[0].value}")
+        self.runs.append((self._page(), t1 - t0, t1 - t_queued))
+
+    def _page(self) -> str:
+        state = self.at.session_state
+        page = state["page"] if "page" in state else "?"
+        if page == "quick_review" and "quick_review_page" in state:
+            page = f"quick_review/{state['quick_review_page']}"
+        return page
+
+    def open(self):
+        self._run()
+
+    def click(self, label: str):
+        for b in self.at.button:
+            if b.label == label:
+                return self._run(b.click())
+        raise KeyError(f"no button {label!r} on {self._page()}")
+
+    def type(self, kind: str, value: str, key: str | None = None, label: str | None = None):
+        """Fill a widget; it is sent with the next click, like a browser form."""
+        widgets = getattr(self.at, kind)
+        if key is not None:
+            widgets(key=key).input(value)
+            return
+        for w in widgets:
+            if w.label == label:
+                w.input(value)
+                return
+        raise KeyError(f"no {kind} {label!r} on {self._page()}")
+
+
+# ---------- Flows ----------
+
+def flow_pitch(s: Student):
+    """portal → questionnaire → recipe → follow_on (reviewer prompt)"""
+    s.open()
+    s.click("Prepare a Story Pitch")
+    s.type("text_area", words(180), key="pitch_pitch_text")
+    s.type("text_area", words(60, seed=1), key="pitch_prior_coverage")
+    s.click("Generate Prompt Recipe")
+    s.click("Continue to Workshop →")
+    s.type("text_area", transcript(8 * 1024), label="Paste 5–15 key turns from your AI coaching session:")
+    s.click("Generate 'Reviewer' Prompt")
+
+
+def flow_grr(s: Student):
+    """portal → GRR choice → event form → recipe"""
+    s.open()
+    s.click("Get Ready to Report")
+    s.click("Event")
+    s.type("text_input", "Board votes on lunch program", key="event_q1_headline")
+    s.type("text_area", words(80, seed=2), key="event_q8_work_done")
+    s.type("text_area", words(80, seed=3), key="event_q11_work_left")
+    s.click("Generate Prompt Recipe")
+
+
+def flow_quick_review(s: Student):
+    """portal → Quick Review questionnaire → recipe"""
+    s.open()
+    s.click("Quick Review")
+    s.type("text_area", "HED: Lunch program cut\n\n" + words(900, seed=4), key="qr_q1_draft")
+    s.type("text_area", "Why the district cut the lunch program", key="qr_q3_story_purpose")
+    s.click("Generate Quick Review Prompt")
+
+
+def flow_prep(s: Student):
+    """portal → interview prep form → coaching recipe"""
+    s.open()
+    s.click("Prepare for an Interview")
+    s.type("text_input", "Jordan Reyes, District Lunch Program Coordinator", label="Name, role/position, affiliation")
+    s.type("text_area", "Why the lunch policy changed", label="In one sentence, what’s the story aim?")
+    s.type("text_input", "What changed and why", label="Must-learn #1")
+    s.type("text_area", "10 minutes in hallway after meeting; record on phone",
+           label="Time/format constraints (and how will the interview be recorded?)")
+    s.click("Generate Coaching Recipe")
+
+
+FLOWS = {"pitch": flow_pitch, "grr": flow_grr, "quick_review": flow_quick_review, "prep": flow_prep}
+
+
+# ---------- Harness ----------
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return 0
+
+
+def _peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _pct(values: list[float], p: float) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(p) - 1]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--users", type=int, default=40)
+    ap.add_argument("--flows", default=",".join(FLOWS), help="comma-separated; assigned round-robin")
+    ap.add_argument("--ramp", type=float, default=0.0, help="spread student start times over this many seconds")
+    ap.add_argument("--think", type=float, default=0.0, help="mean seconds a student pauses before each action")
+    ap.add_argument("--timeout", type=float, default=120.0, help="per script run")
+    ap.add_argument("--json", help="also write the report here")
+    args = ap.parse_args(argv)
+    flows = [f for f in args.flows.split(",") if f]
+
+    # Warm-up: one student per flow, so imports and cold caches don't skew p99.
+    for name in flows:
+        FLOWS[name](Student(0, args.timeout))
+    nav_before = router.nav_stats()
+    rss_before = _rss_bytes()
+
+    lock = threading.Lock()
+    page_times: dict[str, list[float]] = defaultdict(list)
+    page_latency: dict[str, list[float]] = defaultdict(list)
+    flow_runs: dict[str, list[int]] = defaultdict(list)
+    flow_walls: dict[str, list[float]] = defaultdict(list)
+    failures: list[str] = []
+    start = threading.Barrier(args.users)
+
+    rss_peak = rss_before
+    sampling = True
+
+    def sample_rss():
+        nonlocal rss_peak
+        while sampling:
+            rss_peak = max(rss_peak, _rss_bytes())
+            time.sleep(0.05)
+
+    def student(i: int):
+        name = flows[i % len(flows)]
+        s = Student(args.think, args.timeout)
+        start.wait()
+        if args.ramp:
+            time.sleep(random.uniform(0, args.ramp))
+        t0 = time.perf_counter()
+        try:
+            FLOWS[name](s)
+        except Exception as e:
+            with lock:
+                failures.append(f"student {i} ({name}): {e!r}")
+            return
+        wall = time.perf_counter() - t0
+        with lock:
+            for page, elapsed, latency in s.runs:
+                page_times[page].append(elapsed)
+                page_latency[page].append(latency)
+            flow_runs[name].append(len(s.runs))
+            flow_walls[name].append(wall)
+
+    sampler = threading.Thread(target=sample_rss, daemon=True)
+    sampler.start()
+    t0 = time.perf_counter()
+    threads = [threading.Thread(target=student, args=(i,)) for i in range(args.users)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    total = time.perf_counter() - t0
+    sampling = False
+    sampler.join()
+
+    nav_after = router.nav_stats()
+    navs = nav_after["navigations"] - nav_before["navigations"]
+    nav_runs = nav_after["runs"] - nav_before["runs"]
+
+    report = {
+        "users": args.users,
+        "flows": flows,
+        "wall_s": total,
+        "failures": failures,
+        "pages": {
+            page: {
+                "runs": len(ts),
+                "p50_ms": _pct(ts, 50) * 1e3,
+                "p99_ms": _pct(ts, 99) * 1e3,
+                "max_ms": max(ts) * 1e3,
+                "latency_p50_ms": _pct(page_latency[page], 50) * 1e3,
+                "latency_p99_ms": _pct(page_latency[page], 99) * 1e3,
+            }
+            for page, ts in sorted(page_times.items())
+        },
+        "flows_detail": {
+            name: {
+                "completed": len(flow_runs[name]),
+                "runs_per_flow": statistics.mean(flow_runs[name]),
+                "p50_s": _pct(flow_walls[name], 50),
+                "p99_s": _pct(flow_walls[name], 99),
+            }
+            for name in flows if flow_runs[name]
+        },
+        "runs_per_navigation": nav_runs / navs if navs else None,
+        "rss_before_bytes": rss_before,
+        "rss_peak_sampled_bytes": rss_peak,
+        "peak_rss_bytes": _peak_rss_bytes(),
+    }
+
+    print(f"{args.users} students, flows {', '.join(flows)}, ramp {args.ramp:g}s, think {args.think:g}s: "
+          f"{total:.2f}s wall, {len(failures)} failed")
+    print(f"\n{'page':<30} {'runs':>6} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9} {'lat p50':>9} {'lat p99':>9}")
+    for page, r in report["pages"].items():
+        print(f"{page:<30} {r['runs']:>6} {r['p50_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['max_ms']:>9.1f} "
+              f"{r['latency_p50_ms']:>9.1f} {r['latency_p99_ms']:>9.1f}")
+    print(f"\n{'flow':<14} {'done':>5} {'runs/flow':>10} {'p50 s':>8} {'p99 s':>8}")
+    for name, r in report["flows_detail"].items():
+        print(f"{name:<14} {r['completed']:>5} {r['runs_per_flow']:>10.1f} {r['p50_s']:>8.2f} {r['p99_s']:>8.2f}")
+    if navs:
+        print(f"\nscript runs per navigation: {nav_runs / navs:.2f}  ({navs} navigations)")
+    print(f"RSS: {rss_before / 2**20:.1f} MiB before, {rss_peak / 2**20:.1f} MiB peak during run "
+          f"(process max {report['peak_rss_bytes'] / 2**20:.1f} MiB)")
+    for line in failures[:10]:
+        print(f"  FAILED {line}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=1)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+# jt_tools/admin.py
+# JT hidden admin page — profiler dumps and process health
+# Wrapped for router import: render_admin()
+#
+# Reached only with ?jt_admin=<JT_ADMIN_TOKEN> (see app.py); disabled when
+# no token is configured.
+
+import os
+import time
+
+import streamlit as st
+
+from jt_tools import llm, llm_cache, memory, payload, profiling, router, telemetry
+from jt_tools.recipe_cache import RECIPES
+from jt_tools.session_store import store_stats
+
+
+def _reader(path: str):
+    # Read on click only: the page lists up to 50 captures, three files each.
+    def read() -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+    return read
+
+
+def render_admin():
+    st.title("JT Admin")
+    st.caption(f"PID {os.getpid()} • profile dir {profiling.PROFILE_DIR}")
+
+    # ---------- Profiles ----------
+    st.subheader("Captured profiles")
+    st.markdown(
+        f"Profile a session with `?{profiling.QUERY_PARAM}=<token>` (stop with `off`) "
+        "or the whole process with `JT_PROFILE=1`."
+    )
+    if st.session_state.get("_jt_profile"):
+        st.info("Profiling is on for this session.")
+    caps = profiling.captures()
+    if not caps:
+        st.write("No captures yet.")
+    for cap in caps:
+        when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(cap["mtime"]))
+        with st.expander(f"{cap['page']} • {when} • {cap['bytes'] / 1024:.0f} KiB"):
+            cols = st.columns(3)
+            for col, ext, mime in zip(cols, (".txt", ".prof", ".tracemalloc"),
+                                      ("text/plain", "application/octet-stream", "application/octet-stream")):
+                path = cap["files"].get(ext)
+                if path is None:
+                    continue
+                with col:
+                    st.download_button(f"Download {ext}", _reader(path), file_name=os.path.basename(path),
+                                       mime=mime, key=f"dl:{path}")
+            if st.toggle("Show summary", key=f"show:{cap['name']}") and ".txt" in cap["files"]:
+                with open(cap["files"][".txt"], encoding="utf-8") as f:
+                    st.code(f.read(), language="text")
+
+    # ---------- Health ----------
+    st.subheader("Slowest spans (telemetry)")
+    st.dataframe(telemetry.summary()[:25], use_container_width=True)
+    c1, c2 = st.columns(2)
+    with c1:
+        st.markdown("**Memory**")
+        st.json(memory.memory_report(), expanded=False)
+        st.markdown("**Recipe cache**")
+        st.json(RECIPES.stats(), expanded=False)
+    with c2:
+        st.markdown("**Navigation**")
+        st.json(router.nav_stats(), expanded=False)
+        st.markdown("**Runs per completed form**")
+        st.json(router.form_stats(), expanded=False)
+        st.markdown("**Bytes sent per page**")
+        st.json(payload.payload_stats(), expanded=False)
+        st.markdown("**Session store**")
+        st.json(store_stats() or {"enabled": False}, expanded=False)
+        st.markdown("**Model backends**")
+        st.json(llm.backend_stats() if llm.enabled() else {"enabled": False}, expanded=False)
+        st.markdown("**Model reply cache**")
+        reply_cache = llm_cache.cache() if llm.enabled() else None
+        st.json(reply_cache.report() if reply_cache else {"enabled": False}, expanded=False)
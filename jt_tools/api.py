@@ -0,0 +1,296 @@
+# jt_tools/api.py
+# Headless HTTP/JSON prompt API for LMS integrations (no Streamlit)
+#
+# Builds the same prompts as the pages, through the same builders and the
+# same validation (jt_tools.validation), without a script rerun or a
+# websocket per prompt. Two ways to serve it:
+#   python -m jt_tools.api --port 8601 [--workers 4]   stdlib asyncio server
+#   uvicorn jt_tools.api:app --port 8601                ASGI
+#
+#   GET  /healthz                 -> {"ok": true}
+#   GET  /metrics                 -> Prometheus text (jt_tools.telemetry)
+#   POST /v1/prep                 -> {"prompt": ...}
+#   POST /v1/quick_review         -> {"prompt": ...}
+#   POST /v1/pitch                -> {"prompt": ...}
+#   POST /v1/grr/<event|explore|confirm>
+#   POST /v1/reviewer             -> {"prompt": ...}
+#   POST /v1/batch  {"items": [{"tool": "prep", ...}, ...]}
+#                                 -> {"results": [{"prompt": ...} | {"errors": [...]}, ...]}
+# Invalid input is a 422 with {"errors": [...]}, worded as the pages word it.
+# Builders are cached and take microseconds on a hit, so requests are
+# handled inline on the event loop; --workers forks that many processes
+# accepting on the same listening socket to use more cores.
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import time
+
+from jt_tools import telemetry
+from jt_tools.records import GRR_RECORDS, PitchForm
+from jt_tools.templates import grr_prompt, pitch_prompt, quick_review_prompt, reviewer_prompt
+from jt_tools.validation import (
+    LEVELS, PREP_LENSES, prep_recipe, quick_review_fields, validate_grr, validate_level, validate_pitch,
+    validate_prep, validate_quick_review, validate_transcript,
+)
+
+log = logging.getLogger("jt.api")
+
+MAX_BODY = int(os.environ.get("JT_API_MAX_BODY", 1024 * 1024))
+MAX_BATCH = int(os.environ.get("JT_API_MAX_BATCH", 1000))
+KEEPALIVE_S = float(os.environ.get("JT_API_KEEPALIVE_S", "15"))
+
+
+class InvalidInput(Exception):
+    def __init__(self, errors: list[str]):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+def _check(errors: list[str]):
+    if errors:
+        raise InvalidInput(errors)
+
+
+def _fields(body: dict, allowed) -> dict:
+    """String fields from the request body; anything else is a validation error."""
+    errors = [f"Unknown field {k!r}." for k in body if k not in allowed]
+    errors += [f"Field {k!r} must be a string." for k in allowed
+               if k in body and body[k] is not None and not isinstance(body[k], str)]
+    _check(errors)
+    return {k: body[k] for k in allowed if body.get(k) is not None}
+
+
+# ---------- Tools ----------
+
+def build_prep(body: dict) -> str:
+    musts = body.get("musts", [])
+    if not isinstance(musts, list) or not all(isinstance(m, str) for m in musts) or len(musts) > 3:
+        raise InvalidInput(["Field 'musts' must be a list of up to 3 strings."])
+    f = _fields({k: v for k, v in body.items() if k != "musts"},
+                ("level", "lens", "subject", "aim", "why", "pushbacks", "constraints", "ethics", "team_up"))
+    level, lens = f.pop("level", LEVELS[0]), f.pop("lens", PREP_LENSES[0])
+    team_up = f.pop("team_up", None)
+    answers = {k: f.get(k, "") for k in ("subject", "aim", "why", "pushbacks", "constraints", "ethics")}
+    _check(validate_prep(level=level, lens=lens, musts=musts, **answers))
+    return prep_recipe(level=level, lens=lens, musts=musts, team_up=team_up if level.startswith("High School") else None,
+                       **answers)
+
+
+def build_quick_review(body: dict) -> str:
+    f = _fields(body, ("level", "draft", "publication", "story_purpose", "criticized", "unsure"))
+    level = f.pop("level", LEVELS[0])
+    _check(validate_level(level) + validate_quick_review(draft=f.get("draft"), story_purpose=f.get("story_purpose")))
+    return quick_review_prompt(level=level, **quick_review_fields(**f))
+
+
+def build_pitch(body: dict) -> str:
+    f = _fields(body, ("level", *PitchForm.FIELDS))
+    level = f.pop("level", LEVELS[0])
+    _check(validate_level(level) + validate_pitch(pitch_text=f.get("pitch_text")))
+    return pitch_prompt(level=level, **PitchForm(**f).to_dict())
+
+
+def build_grr(path: str, body: dict) -> str:
+    _check(validate_grr(path))
+    f = _fields(body, ("level", *GRR_RECORDS[path].FIELDS))
+    level = f.pop("level", LEVELS[0])
+    _check(validate_level(level))
+    return grr_prompt(path, level=level, **f)
+
+
+def build_reviewer(body: dict) -> str:
+    f = _fields(body, ("transcript",))
+    _check(validate_transcript(f.get("transcript")))
+    return reviewer_prompt(f["transcript"])
+
+
+TOOLS = {
+    "prep": build_prep,
+    "quick_review": build_quick_review,
+    "pitch": build_pitch,
+    "reviewer": build_reviewer,
+    **{f"grr/{path}": (lambda body, path=path: build_grr(path, body)) for path in GRR_RECORDS},
+}
+
+
+def _one(tool: str, body) -> tuple[int, dict]:
+    if not isinstance(body, dict):
+        return 422, {"errors": ["Request body must be a JSON object."]}
+    with telemetry.context(f"api.{tool}", "api"), telemetry.span("api", tool):
+        try:
+            return 200, {"prompt": TOOLS[tool](body)}
+        except InvalidInput as e:
+            return 422, {"errors": e.errors}
+
+
+def _batch(body) -> tuple[int, dict]:
+    items = body.get("items") if isinstance(body, dict) else None
+    if not isinstance(items, list):
+        return 422, {"errors": ["Body must be {\"items\": [...]}."]}
+    if len(items) > MAX_BATCH:
+        return 413, {"errors": [f"At most {MAX_BATCH} items per batch."]}
+    results = []
+    for item in items:
+        item = dict(item) if isinstance(item, dict) else {}
+        tool = item.pop("tool", None)
+        if tool not in TOOLS:
+            results.append({"errors": [f"Unknown tool {tool!r}; expected one of: {', '.join(TOOLS)}."]})
+            continue
+        results.append(_one(tool, item)[1])
+    return 200, {"results": results}
+
+
+def handle(method: str, path: str, raw: bytes) -> tuple[int, str, bytes]:
+    """Route one request. Returns (status, content type, body)."""
+    path = path.split("?", 1)[0].rstrip("/")
+    if method == "GET" and path == "/healthz":
+        status, payload = 200, {"ok": True}
+    elif method == "GET" and path == "/metrics":
+        return 200, "text/plain; version=0.0.4", telemetry.prometheus_text().encode()
+    elif not path.startswith("/v1/"):
+        status, payload = 404, {"errors": [f"No route {path!r}."]}
+    elif method != "POST":
+        status, payload = 405, {"errors": ["Use POST."]}
+    else:
+        tool = path[len("/v1/"):]
+        try:
+            body = json.loads(raw or b"{}")
+        except (ValueError, UnicodeDecodeError) as e:
+            status, payload = 400, {"errors": [f"Body is not valid JSON: {e}"]}
+        else:
+            if tool == "batch":
+                status, payload = _batch(body)
+            elif tool in TOOLS:
+                status, payload = _one(tool, body)
+            else:
+                status, payload = 404, {"errors": [f"No route {path!r}."]}
+    return status, "application/json", json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+# ---------- ASGI ----------
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        while (await receive())["type"] != "lifespan.shutdown":
+            await send({"type": "lifespan.startup.complete"})
+        await send({"type": "lifespan.shutdown.complete"})
+        return
+    if scope["type"] != "http":
+        return
+
+    chunks, size = [], 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+        size += len(message.get("body", b""))
+        if size > MAX_BODY:
+            status, ctype, out = 413, "application/json", b'{"errors":["Request body too large."]}'
+            break
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            status, ctype, out = handle(scope["method"], scope["path"], b"".join(chunks))
+            break
+    await send({"type": "http.response.start", "status": status,
+                "headers": [(b"content-type", ctype.encode()), (b"content-length", str(len(out)).encode())]})
+    await send({"type": "http.response.body", "body": out})
+
+
+# ---------- Stdlib server ----------
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 411: "Length Required",
+            413: "Payload Too Large", 422: "Unprocessable Entity", 500: "Internal Server Error"}
+
+
+def _response(status: int, ctype: str, body: bytes, keep_alive: bool) -> bytes:
+    head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: {ctype}\r\nContent-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+async def _serve_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        while True:
+            try:
+                head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_S)
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                return
+            lines = head.decode("latin-1").split("\r\n")
+            try:
+                method, target, version = lines[0].split(" ", 2)
+            except ValueError:
+                writer.write(_response(400, "text/plain", b"bad request line", False))
+                return
+            headers = {k.strip().lower(): v.strip() for k, _, v in (l.partition(":") for l in lines[1:] if l)}
+            keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+            if "chunked" in headers.get("transfer-encoding", "").lower():
+                writer.write(_response(411, "application/json", b'{"errors":["Send a Content-Length."]}', False))
+                return
+            try:
+                length = int(headers.get("content-length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                writer.write(_response(400, "application/json", b'{"errors":["Bad Content-Length."]}', False))
+                return
+            if length > MAX_BODY:
+                writer.write(_response(413, "application/json", b'{"errors":["Request body too large."]}', False))
+                return
+            raw = await reader.readexactly(length) if length else b""
+            try:
+                status, ctype, body = handle(method, target, raw)
+            except Exception:
+                log.exception("%s %s failed", method, target)
+                status, ctype, body = 500, "application/json", b'{"errors":["Internal error."]}'
+            writer.write(_response(status, ctype, body, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                return
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+def _listen(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(1024)
+    return sock
+
+
+async def serve(sock: socket.socket):
+    server = await asyncio.start_server(_serve_connection, sock=sock)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless JT prompt API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8601)
+    parser.add_argument("--workers", type=int, default=1, help="processes sharing the listening socket (POSIX)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+
+    sock = _listen(args.host, args.port)
+    for _ in range(args.workers - 1):
+        if os.fork() == 0:
+            break  # children share the already-bound socket
+    log.info("pid %d serving on http://%s:%d", os.getpid(), args.host, args.port)
+    t0 = time.time()
+    try:
+        asyncio.run(serve(sock))
+    except KeyboardInterrupt:
+        log.info("pid %d stopped after %.0f s", os.getpid(), time.time() - t0)
+
+
+if __name__ == "__main__":
+    main()
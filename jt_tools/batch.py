@@ -0,0 +1,216 @@
+# jt_tools/batch.py
+# Streaming batch CLI: one prompt per roster row, built on a process pool (no Streamlit)
+#
+#   python -m jt_tools.batch roster.csv --tool prep --out recipes.zip
+#   python -m jt_tools.batch roster.jsonl --tool pitch --out - > prompts.jsonl
+#
+# Each row (CSV header or JSONL object) carries the same fields as the API
+# body for that tool (see jt_tools.api); for prep, CSV rows may spell the
+# musts as must1..must3. An id column (--id-column, default "student")
+# names the output; columns listed with --ignore are dropped. Rows are read
+# lazily and sent to the pool in chunks, with at most a fixed window of chunks
+# in flight, and results are written in input order as they complete. Memory
+# therefore stays flat however long the roster is (a zip also keeps its
+# central directory, roughly 0.6 KB per file, until it is closed). The
+# prompt cache is switched off for the run: every row is different.
+# Output is JSONL ({"row", "id", "prompt"} or {"row", "id", "errors"}) or,
+# for a .zip path, one Markdown file per row plus manifest.jsonl.
+
+import argparse
+import csv
+import itertools
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Iterable, Iterator
+
+from jt_tools.api import TOOLS, InvalidInput
+from jt_tools.recipe_cache import RECIPES
+
+log = logging.getLogger("jt.batch")
+
+CHUNK_ROWS = 64
+WINDOW_PER_WORKER = 4
+
+
+# ---------- Input ----------
+
+def read_rows(path: str, fmt: str | None = None) -> Iterator[dict]:
+    """Yield one dict per CSV row / JSONL line, reading lazily ('-' is stdin)."""
+    fmt = fmt or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+    f = sys.stdin if path == "-" else open(path, newline="" if fmt == "csv" else None, encoding="utf-8-sig")
+    try:
+        if fmt == "csv":
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def _prep_musts(row: dict) -> dict:
+    """CSV rows spell musts as must1..must3 (or one '|'-separated 'musts' cell)."""
+    numbered = [row.pop(k) for k in ("must1", "must2", "must3") if k in row]
+    if isinstance(row.get("musts"), str):
+        numbered += row.pop("musts").split("|")
+    if numbered:
+        row["musts"] = [m for m in numbered if m and m.strip()]
+    return row
+
+
+# ---------- Work (runs in the pool) ----------
+
+def _no_cache():
+    """Roster rows are all different; caching their prompts would only grow the heap."""
+    RECIPES.max_bytes = 0
+
+
+def build_rows(tool: str, rows: list[tuple[int, str, dict]]) -> list[tuple[int, str, str | None, list | None]]:
+    """Build one chunk: (row, id, prompt, errors) per input row."""
+    build = TOOLS[tool]
+    out = []
+    for n, ident, row in rows:
+        if tool == "prep":
+            row = _prep_musts(row)
+        try:
+            out.append((n, ident, build(row), None))
+        except InvalidInput as e:
+            out.append((n, ident, None, e.errors))
+    return out
+
+
+def pipeline(work: Callable[[list], list], items: Iterable, workers: int, chunk: int = CHUNK_ROWS) -> Iterator:
+    """Map `work` over chunks of `items` on a process pool; yield results in order.
+
+    At most workers * WINDOW_PER_WORKER chunks are in flight, so input is
+    only read as fast as the pool drains it.
+    """
+    items = iter(items)
+    chunks = iter(lambda: list(itertools.islice(items, chunk)), [])
+    if workers <= 1:
+        _no_cache()
+        for c in chunks:
+            yield from work(c)
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_no_cache) as pool:
+        pending = deque(pool.submit(work, c) for c in itertools.islice(chunks, workers * WINDOW_PER_WORKER))
+        while pending:
+            done = pending.popleft().result()
+            nxt = next(chunks, None)
+            if nxt is not None:
+                pending.append(pool.submit(work, nxt))
+            yield from done
+
+
+# ---------- Output ----------
+
+def safe_name(ident: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", ident).strip("._") or "row"
+
+
+class JsonlWriter:
+    def __init__(self, path: str):
+        self.f = sys.stdout if path == "-" else open(path, "w", encoding="utf-8")
+
+    def write(self, n: int, ident: str, prompt: str | None, errors: list | None, **extra):
+        rec = {"row": n, "id": ident, **extra, **({"prompt": prompt} if errors is None else {"errors": errors})}
+        self.f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+
+    def close(self):
+        if self.f is sys.stdout:
+            self.f.flush()
+        else:
+            self.f.close()
+
+
+class ZipWriter:
+    """One <id>.md per built prompt, plus manifest.jsonl (spooled to disk, written last)."""
+
+    def __init__(self, path: str, suffix: str = ".md"):
+        self.zf = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+        self.manifest = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self.suffix = suffix
+        self.used: set[str] = set()
+
+    def write(self, n: int, ident: str, prompt: str | None, errors: list | None, **extra):
+        rec = {"row": n, "id": ident, **extra}
+        if errors is None:
+            name = safe_name(ident)
+            if name in self.used:
+                name = f"{name}-{n}"
+            self.used.add(name)
+            rec["file"] = name + self.suffix
+            self.zf.writestr(rec["file"], prompt)
+        else:
+            rec["errors"] = errors
+        self.manifest.write(json.dumps(rec, ensure_ascii=False) + "\n")
+
+    def close(self):
+        self.manifest.seek(0)
+        with self.zf.open("manifest.jsonl", "w") as out:
+            for line in self.manifest:
+                out.write(line.encode("utf-8"))
+        self.manifest.close()
+        self.zf.close()
+
+
+def open_writer(path: str):
+    return ZipWriter(path) if path.endswith(".zip") else JsonlWriter(path)
+
+
+def drain(results: Iterable, writer) -> tuple[int, int]:
+    """Write every result; returns (built, failed)."""
+    built = failed = 0
+    try:
+        for n, ident, prompt, errors, *extra in results:
+            writer.write(n, ident, prompt, errors, **(extra[0] if extra else {}))
+            if errors is None:
+                built += 1
+            else:
+                failed += 1
+    finally:
+        writer.close()
+    return built, failed
+
+
+# ---------- CLI ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build one prompt per roster row.")
+    parser.add_argument("roster", help="CSV or JSONL file, or - for stdin")
+    parser.add_argument("--tool", required=True, choices=sorted(TOOLS))
+    parser.add_argument("--out", default="-", help="JSONL path, .zip path, or - for stdout (default)")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="input format (default: by extension)")
+    parser.add_argument("--id-column", default="student")
+    parser.add_argument("--ignore", action="append", default=[], help="column to drop (repeatable)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s", stream=sys.stderr)
+
+    drop = {args.id_column, *args.ignore}
+
+    def items():
+        for n, row in enumerate(read_rows(args.roster, args.format), 1):
+            ident = str(row.get(args.id_column) or f"row-{n:05d}")
+            yield n, ident, {k: v for k, v in row.items() if k not in drop}
+
+    t0 = time.perf_counter()
+    results = pipeline(partial(build_rows, args.tool), items(), args.workers)
+    built, failed = drain(results, open_writer(args.out))
+    log.info("%d built, %d rejected in %.2f s", built, failed, time.perf_counter() - t0)
+    return 1 if failed and not built else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
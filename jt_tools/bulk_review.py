@@ -0,0 +1,130 @@
+# jt_tools/bulk_review.py
+# Bulk Quick Review: one prompt per draft in a directory or zip (no Streamlit)
+#
+#   python -m jt_tools.bulk_review drafts/ --meta queue.csv --out reviews.zip
+#   python -m jt_tools.bulk_review drafts.zip --meta queue.json --out - > reviews.jsonl
+#
+# Drafts are the .txt/.md files in the directory (recursively) or the zip.
+# The sidecar is CSV, JSON (a list, or an object keyed by file name) or
+# JSONL. Each entry has a "file" column/key naming the draft relative to the
+# input root, plus any of level, publication, story_purpose, criticized and
+# unsure. Drafts without an entry fall back to --level and the page defaults,
+# so they are rejected exactly as the page would reject them (story purpose
+# is required).
+# Only names travel to the pool; each worker reads its own drafts, opening
+# the zip once per process, and builds the prompt with quick_review_prompt(),
+# the same builder _render_recipe() uses. Results stream out through the
+# jt_tools.batch pipeline and writers.
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+import zipfile
+from functools import partial
+from typing import Iterator
+
+from jt_tools.api import TOOLS, InvalidInput
+from jt_tools.batch import open_writer, drain, pipeline
+from jt_tools.validation import LEVELS
+
+log = logging.getLogger("jt.bulk_review")
+
+DRAFT_SUFFIXES = (".txt", ".md", ".markdown")
+META_FIELDS = ("level", "publication", "story_purpose", "criticized", "unsure")
+
+_zips: dict[str, zipfile.ZipFile] = {}  # per worker process
+
+
+# ---------- Input ----------
+
+def list_drafts(root: str) -> Iterator[str]:
+    """Draft names relative to root, in a stable order."""
+    if zipfile.is_zipfile(root):
+        with zipfile.ZipFile(root) as zf:
+            names = [i.filename for i in zf.infolist() if not i.is_dir()]
+    else:
+        names = [os.path.relpath(os.path.join(d, f), root).replace(os.sep, "/")
+                 for d, _, files in os.walk(root) for f in files]
+    for name in sorted(names):
+        base = name.rsplit("/", 1)[-1]
+        if name.lower().endswith(DRAFT_SUFFIXES) and not base.startswith(".") and "__MACOSX/" not in name:
+            yield name
+
+
+def read_draft(root: str, name: str) -> str:
+    if os.path.isdir(root):
+        with open(os.path.join(root, name), encoding="utf-8-sig", errors="replace") as f:
+            return f.read()
+    zf = _zips.get(root)
+    if zf is None:
+        zf = _zips[root] = zipfile.ZipFile(root)
+    return zf.read(name).decode("utf-8-sig", errors="replace")
+
+
+def load_meta(path: str | None) -> dict[str, dict]:
+    """Sidecar entries keyed by draft name."""
+    if not path:
+        return {}
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if path.endswith(".csv"):
+            rows = list(csv.DictReader(f))
+        elif path.endswith((".jsonl", ".ndjson")):
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            data = json.load(f)
+            rows = [{"file": k, **v} for k, v in data.items()] if isinstance(data, dict) else data
+    meta = {}
+    for row in rows:
+        name = (row.get("file") or "").strip()
+        if name:
+            meta[name] = {k: v for k in META_FIELDS if (v := row.get(k)) not in (None, "")}
+    return meta
+
+
+# ---------- Work (runs in the pool) ----------
+
+def review_rows(root: str, level: str, rows: list[tuple[int, str, dict]]) -> list[tuple]:
+    """Read and build one chunk: (n, name, prompt, errors, {"source": name})."""
+    build = TOOLS["quick_review"]
+    out = []
+    for n, name, meta in rows:
+        try:
+            body = {"level": level, **meta, "draft": read_draft(root, name)}
+            out.append((n, name.rsplit(".", 1)[0], build(body), None, {"source": name}))
+        except InvalidInput as e:
+            out.append((n, name.rsplit(".", 1)[0], None, e.errors, {"source": name}))
+        except (OSError, KeyError, zipfile.BadZipFile) as e:
+            out.append((n, name.rsplit(".", 1)[0], None, [f"Could not read draft: {e}"], {"source": name}))
+    return out
+
+
+# ---------- CLI ----------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a Quick Review prompt for every draft in a queue.")
+    parser.add_argument("drafts", help="directory or .zip of .txt/.md drafts")
+    parser.add_argument("--meta", help="sidecar CSV/JSON/JSONL with file, publication, story_purpose, ...")
+    parser.add_argument("--level", default=LEVELS[0], choices=LEVELS, help="level for drafts without one")
+    parser.add_argument("--out", default="-", help="JSONL path, .zip path, or - for stdout (default)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s", stream=sys.stderr)
+
+    meta = load_meta(args.meta)
+    items = ((n, name, meta.pop(name, {})) for n, name in enumerate(list_drafts(args.drafts), 1))
+
+    t0 = time.perf_counter()
+    results = pipeline(partial(review_rows, args.drafts, args.level), items, args.workers, chunk=4)
+    built, failed = drain(results, open_writer(args.out))
+    for name in meta:
+        log.warning("sidecar entry %r matches no draft", name)
+    log.info("%d built, %d rejected in %.2f s", built, failed, time.perf_counter() - t0)
+    return 1 if failed and not built else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+# jt_tools/components
+# Static custom components shared by all JT pages
+#
+# Each component is a folder of static assets declared once per process, so
+# the browser fetches (and caches) the HTML/JS once; per-rerun traffic is only
+# the component's JSON args. prompt_size() shows an assembled prompt's token
+# estimate against each target model (jt_tools.tokens). run_here(),
+# side_by_side() and run_long_review() are plain Streamlit helpers for
+# sending prompts to the model backends (jt_tools.llm).
+
+import time
+from pathlib import Path
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from jt_tools import llm, long_review, tokens
+from jt_tools.router import fragment
+
+_HERE = Path(__file__).parent
+
+_clipboard = components.declare_component("jt_clipboard", path=str(_HERE / "clipboard"))
+_counter = components.declare_component("jt_counter", path=str(_HERE / "counter"))
+
+
+def prompt_panel(
+    text: str,
+    key: str,
+    height: int = 460,
+    copy_label: str = "Copy Full Prompt",
+    filename: str = "prompt.md",
+) -> None:
+    """Read-only prompt viewer with Copy and Download, sent to the browser once.
+
+    Replaces the st.text_area/st.code + copy-iframe pair, which put the prompt
+    on the wire twice (the second time HTML-escaped). Copy and Download work
+    entirely in the browser and never rerun the script.
+    """
+    _clipboard(text=text or "", label=copy_label, height=height, filename=filename, key=key, default=None)
+
+
+def live_counter(label: str, max_chars: int | None = None, key: str | None = None):
+    """Word/character counter for the text area labelled `label`, counted in the browser.
+
+    The component finds the text area by its aria-label (the widget label) and
+    updates on every keystroke, so the count never costs a script rerun.
+    """
+    _counter(label=label, max_chars=max_chars or 0, key=key or f"jt_counter:{label}", default=None)
+
+
+def counted_text_area(label: str, max_chars: int | None = None, **kwargs) -> str:
+    """st.text_area with a live_counter() under it.
+
+    `max_chars` is enforced by the text area itself; the counter shows the
+    limit and turns amber/red as the text approaches it.
+    """
+    value = st.text_area(label, max_chars=max_chars, **kwargs)
+    live_counter(label, max_chars)
+    return value
+
+
+def prompt_size(prompt: str):
+    """Caption with the prompt's estimated size against each target model's window.
+
+    Adds a warning for each model it would not fit once room is left for
+    the reply, and for any that would cost more than the per-prompt budget.
+    """
+    rows = tokens.budget(prompt)
+    marks = {"ok": "", "near": " ⚠️", "cost": " 💲", "over": " ❌"}
+    shares = " · ".join(f"{r['name']} {r['share']:.0%}{marks[r['status']]}" for r in rows)
+    st.caption(f"≈ {tokens.estimate(prompt):,} tokens · share of each model's window: {shares}")
+    for r in rows:
+        if r["status"] == "over":
+            st.warning(
+                f"At about {r['tokens']:,} tokens this prompt is too long for {r['name']}: "
+                f"{r['usable']:,} fit once room is left for the reply, so the model would cut it off. "
+                "Trim the pasted text or use a model with a bigger window."
+            )
+        elif r["status"] == "cost":
+            st.warning(f"Sending this prompt to {r['name']} costs about ${r['cost_usd']:.2f}, "
+                       f"over the ${tokens.BUDGET_USD:.2f} budget per prompt.")
+
+
+def run_here(prompt: str, key: str):
+    """Opt-in "Run here": stream `prompt` to the configured model backend in the page.
+
+    Renders nothing unless a backend is configured (see jt_tools.llm). It is
+    a fragment, so Run and Stop rerun only this box, and the prompt passed in
+    is kept for those reruns even on pages that built it from a form submit.
+    """
+    if llm.enabled():
+        _run_here(prompt, key)
+
+
+@fragment("run_here")
+def _run_here(prompt: str, key: str):
+    backend = llm.default_backend()
+    with st.container(border=True):
+        st.markdown(f"#### ▶ Run here with `{backend.model}`")
+        st.caption(f"Sends the prompt above to {backend.host} and streams the reply into this page.")
+        c1, c2 = st.columns(2)
+        run = c1.button("Run here", key=f"{key}_run", type="primary", use_container_width=True)
+        # Any click reruns this fragment, which stops a reply still streaming.
+        c2.button("Stop", key=f"{key}_stop", use_container_width=True)
+        if not run:
+            return
+        reply = llm.stream(prompt, backend)
+        try:
+            st.write_stream(reply)
+        except llm.LLMError as e:
+            st.error(f"The model call failed: {e}")
+        finally:
+            reply.close()
+
+
+def side_by_side(prompt: str, backends: list | None = None, refresh_s: float = 0.1):
+    """Send `prompt` to every configured backend at once and stream the replies in columns.
+
+    Each column is redrawn at most every `refresh_s` while text arrives, so
+    a fast backend does not flood the browser with one delta per token.
+    """
+    backends = backends or llm.BACKENDS
+    status, boxes = [], []
+    for col, backend in zip(st.columns(len(backends)), backends):
+        with col:
+            st.markdown(f"**{backend.name}** · `{backend.model}`")
+            status.append(st.empty())
+            boxes.append(st.empty())
+            status[-1].caption("Waiting for the first token…")
+    texts = [""] * len(backends)
+    drawn = [0.0] * len(backends)
+    ttft = [None] * len(backends)
+
+    events = llm.fan_out(prompt, backends)
+    try:
+        for i, kind, value in events:
+            if kind == "first":
+                ttft[i] = value
+                status[i].caption(f"First token after {value:.1f} s…")
+            elif kind == "text":
+                texts[i] += value
+                now = time.perf_counter()
+                if now - drawn[i] >= refresh_s:
+                    boxes[i].markdown(texts[i])
+                    drawn[i] = now
+            elif kind == "done":
+                boxes[i].markdown(texts[i])
+                status[i].caption(f"First token {ttft[i] or 0:.1f} s · done in {value:.1f} s")
+            else:
+                boxes[i].markdown(texts[i])
+                status[i].error(f"Failed: {value}")
+    finally:
+        events.close()
+
+
+def run_long_review(plan: long_review.Plan, key: str, refresh_s: float = 0.25):
+    """Opt-in: review every part of a long draft with the default backend, then synthesize.
+
+    Renders nothing unless a backend is configured. Parts run concurrently
+    (see jt_tools.long_review); each shows its status as it goes, and the
+    synthesis streams in below once the last part is back.
+    """
+    if llm.enabled():
+        _run_long_review(plan, key, refresh_s)
+
+
+@fragment("run_long_review")
+def _run_long_review(plan: long_review.Plan, key: str, refresh_s: float):
+    backend = llm.default_backend()
+    n = len(plan.parts)
+    with st.container(border=True):
+        st.markdown(f"#### ▶ Review all {n} parts here with `{backend.model}`")
+        st.caption(f"Sends the {n} part prompts to {backend.host}, up to {long_review.PARALLEL_PARTS} at a time, "
+                   "then the final prompt with their notes.")
+        c1, c2 = st.columns(2)
+        run = c1.button("Review all parts", key=f"{key}_run", type="primary", use_container_width=True)
+        c2.button("Stop", key=f"{key}_stop", use_container_width=True)
+        if not run:
+            return
+        status = [st.empty() for _ in plan.parts]
+        for line in status:
+            line.caption("Waiting…")
+        st.markdown("**Combined review**")
+        box = st.empty()
+        text, drawn = "", 0.0
+        events = long_review.run(plan, backend)
+        try:
+            for stage, i, (kind, value) in events:
+                if stage == "part":
+                    if kind == "first":
+                        status[i].caption(f"Part {i + 1} of {n}: reviewing…")
+                    elif kind == "done":
+                        status[i].caption(f"Part {i + 1} of {n}: done in {value:.1f} s")
+                    elif kind == "error":
+                        status[i].warning(f"Part {i + 1} of {n} failed: {value}")
+                elif kind == "text":
+                    text += value
+                    now = time.perf_counter()
+                    if now - drawn >= refresh_s:
+                        box.markdown(text)
+                        drawn = now
+                elif kind == "error":
+                    box.markdown(text)
+                    st.error(f"The model call failed: {value}")
+            box.markdown(text)
+        finally:
+            events.close()
@@ -0,0 +1,218 @@
+# jt_tools/constraints.py
+# Single-pass parser for the interview "Time/format constraints" field (no Streamlit)
+#
+# The text is tokenized once by a single charset-only regex (findall runs in C),
+# then walked left to right with dict lookups and short phrase look-ahead.
+# This replaces the old cascade of re.findall/re.search passes (one per number
+# pattern, one per number word, one substring scan per hint) and returns
+# structured data instead of just SHORT/NORMAL.
+
+import re
+from typing import NamedTuple
+
+SHORT_MAX_MINUTES = 10
+
+_TOKEN = re.compile(r"\d+|[a-z]+(?:['’][a-z]+)?|<=|[-–—&~≤\n]")
+
+_UNITS = {
+    "m": 1, "min": 1, "mins": 1, "minute": 1, "minutes": 1,
+    "h": 60, "hr": 60, "hrs": 60, "hour": 60, "hours": 60,
+}
+_RANGE_SEPS = {"-", "–", "—", "to"}
+_HYPHENS = {"-", "–", "—"}
+_QUALIFIERS = {"under", "approx", "approximately", "~", "≤", "<="}
+_NEGATIONS = {"no", "not", "can't", "can’t", "cannot", "won't", "won’t", "don't", "don’t"}
+_VIDEO_WORDS = {"zoom", "video", "screen"}
+_RECORD_WORDS = {"record", "recorded", "recording", "recorder"}  # not "records" (public records)
+
+_NUMBER_WORDS = {
+    "five": 5, "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+    "fifteen": 15, "twenty": 20, "thirty": 30, "forty-five": 45, "sixty": 60,
+}
+
+# Informal settings that imply a short interview; some also imply the format.
+_HINTS = {
+    "informal": None, "scrum": None, "gaggle": None, "press gaggle": None,
+    "standup": None, "stand-up": None, "q&a": None,
+    "hallway": "in-person", "doorstep": "in-person", "door stop": "in-person",
+    "before the meeting": "in-person", "after the meeting": "in-person",
+}
+# Hints matched as word prefixes ("quickly", "availability", "available").
+_HINT_PREFIXES = ("quick", "avail")
+
+_FORMATS = {
+    "phone call": "phone", "by phone": "phone", "over the phone": "phone",
+    "phone interview": "phone", "call": "phone", "phone": "phone",
+    "zoom": "video", "video call": "video", "video chat": "video", "facetime": "video",
+    "teams": "video", "skype": "video", "google meet": "video", "webex": "video",
+    "in person": "in-person", "in-person": "in-person", "face to face": "in-person",
+    "face-to-face": "in-person", "office": "in-person", "coffee": "in-person",
+}
+
+NO_RECORDING = "no recording (notes only)"
+VIDEO_RECORDING = "video recording"
+AUDIO_RECORDING = "audio recording"
+NOTES = "notes"
+
+_RECORDING_WORDS = {
+    "voice memo": AUDIO_RECORDING, "recorder": AUDIO_RECORDING, "otter": AUDIO_RECORDING,
+    "notes": NOTES, "note": NOTES, "notebook": NOTES, "shorthand": NOTES,
+}
+
+
+def _phrase_table() -> dict[str, list[tuple[tuple[str, ...], str, object]]]:
+    """First token -> [(remaining tokens, kind, value)], longest phrase first."""
+    table: dict[str, list] = {}
+    for kind, entries in (
+        ("hint", _HINTS), ("fmt", _FORMATS), ("rec", _RECORDING_WORDS), ("word", _NUMBER_WORDS),
+    ):
+        for phrase, value in entries.items():
+            toks = tuple(_TOKEN.findall(phrase))
+            table.setdefault(toks[0], []).append((toks[1:], kind, value))
+    table.setdefault("half", []).append((("an", "hour"), "minutes", 30))
+    table.setdefault("half", []).append((("hour",), "minutes", 30))
+    for options in table.values():
+        options.sort(key=lambda o: len(o[0]), reverse=True)
+    return table
+
+
+_PHRASES = _phrase_table()
+
+
+class ConstraintInfo(NamedTuple):
+    """What the constraints text says about the interview."""
+    min_minutes: int | None
+    max_minutes: int | None
+    format: str | None      # "phone" | "video" | "in-person"
+    recording: str | None   # NO_RECORDING | VIDEO_RECORDING | AUDIO_RECORDING | NOTES
+    informal: bool
+    mode: str               # "SHORT" | "NORMAL"
+
+    @property
+    def time_label(self) -> str | None:
+        if self.min_minutes is None:
+            return None
+        if self.max_minutes == self.min_minutes:
+            return f"{self.min_minutes} minutes"
+        return f"{self.min_minutes}–{self.max_minutes} minutes"
+
+
+def _match_phrase(toks: list[str], i: int, options):
+    for rest, kind, value in options:
+        j = i + 1 + len(rest)
+        if tuple(toks[i + 1:j]) == rest:
+            return j, kind, value
+    return None
+
+
+def parse_constraints(constraints_text: str) -> ConstraintInfo:
+    """Parse duration, format, recording method and SHORT/NORMAL mode in one pass."""
+    toks = _TOKEN.findall((constraints_text or "").lower())
+    n = len(toks)
+
+    minutes: list[int] = []
+    pending: list[int] = []  # number words / "under N" waiting for a "min" or "hour" later on the line
+    fmt = None
+    recording = None
+    informal = False
+
+    def set_recording(value):
+        nonlocal recording
+        # An explicit method beats a bare mention of notes.
+        if recording is None or recording == NOTES:
+            recording = value
+
+    i = 0
+    while i < n:
+        tok = toks[i]
+
+        if tok.isdigit():
+            # N [sep M] unit, or a hyphenated N-unit ("10-minute call")
+            j = i + 1
+            hi = None
+            if j + 1 < n and toks[j] in _RANGE_SEPS and toks[j + 1].isdigit():
+                hi = int(toks[j + 1])
+                j += 2
+            elif j + 1 < n and toks[j] in _HYPHENS and toks[j + 1] in _UNITS:
+                j += 1
+            scale = _UNITS.get(toks[j]) if j < n else None
+            if scale:
+                minutes.append(int(tok) * scale)
+                if hi is not None:
+                    minutes.append(hi * scale)
+                i = j + 1
+            else:
+                i += 1
+            continue
+
+        if tok == "\n":
+            pending.clear()
+            i += 1
+            continue
+
+        if tok in _QUALIFIERS and i + 1 < n and toks[i + 1].isdigit():
+            pending.append(int(toks[i + 1]))
+            i += 2
+            continue
+
+        if tok in _RECORD_WORDS:
+            prev = toks[i - 1] if i else ""
+            prev2 = toks[i - 2] if i > 1 else ""
+            i += 1
+            if prev in _NEGATIONS or (prev == "be" and prev2 in _NEGATIONS):
+                set_recording(NO_RECORDING)
+            elif prev in _VIDEO_WORDS:
+                set_recording(VIDEO_RECORDING)
+            else:
+                # record [via|on|with|in|over] [the|my|a] (zoom|video|phone)
+                j = i
+                if j < n and toks[j] in ("via", "on", "with", "in", "over"):
+                    j += 1
+                if j < n and toks[j] in ("the", "my", "a"):
+                    j += 1
+                target = toks[j] if j < n else ""
+                if target in ("zoom", "video"):
+                    set_recording(VIDEO_RECORDING)
+                    i = j + 1
+                else:
+                    set_recording(AUDIO_RECORDING)
+                    if target == "phone":  # the recording device, not the interview format
+                        i = j + 1
+            continue
+
+        options = _PHRASES.get(tok)
+        hit = _match_phrase(toks, i, options) if options else None
+        if hit is not None:
+            i, kind, value = hit
+            if kind == "hint":
+                informal = True
+                fmt = fmt or value
+            elif kind == "fmt":
+                fmt = fmt or value
+            elif kind == "rec":
+                set_recording(value)
+            elif kind == "word":
+                pending.append(value)
+            elif kind == "minutes":
+                minutes.append(value)
+            continue
+
+        if tok.startswith("min"):
+            minutes.extend(pending)
+            pending.clear()
+        elif _UNITS.get(tok) == 60:
+            minutes.extend(p * 60 for p in pending)
+            pending.clear()
+        elif tok.startswith(_HINT_PREFIXES):
+            informal = True
+        i += 1
+
+    lo = min(minutes) if minutes else None
+    hi = max(minutes) if minutes else None
+    short = informal or (lo is not None and lo <= SHORT_MAX_MINUTES)
+    return ConstraintInfo(lo, hi, fmt, recording, informal, "SHORT" if short else "NORMAL")
+
+
+def infer_time_mode(constraints_text: str) -> str:
+    """Infer SHORT vs NORMAL from constraints text. SHORT for ≤10 minutes or informal/hallway cues."""
+    return parse_constraints(constraints_text).mode
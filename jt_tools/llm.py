@@ -0,0 +1,452 @@
+# jt_tools/llm.py
+# Opt-in "Run here": stream a prompt to an OpenAI-compatible chat endpoint (no Streamlit)
+#
+# Off unless an operator configures a backend:
+#   JT_LLM_BASE_URL=http://localhost:8650/v1  JT_LLM_MODEL=...  JT_LLM_API_KEY=...
+# or several, as JSON (first one is the default for "Run here"):
+#   JT_LLM_BACKENDS='[{"name": "local", "base_url": "...", "model": "...", "api_key_env": "LOCAL_KEY"}]'
+#
+# All sessions share one event loop on a background thread and one pooled
+# async HTTP client: httpx if it is installed, otherwise a small keep-alive
+# HTTP/1.1 client on asyncio streams. stream() bridges a response into a
+# plain iterator for st.write_stream(); fan_out() sends one prompt to several
+# backends at once and interleaves their replies, so the wall time is that of
+# the slowest backend, and run_many() does the same for several prompts.
+# Closing any of these iterators (the user clicked Stop, navigated away or
+# the script was stopped) cancels the request(s).
+# Every call is bounded by a connect, first-token, idle and total timeout.
+# Time to first token and total time go to jt_tools.telemetry as kind "llm";
+# backend_stats() keeps per-backend counts, errors and mean latencies.
+# With JT_LLM_CACHE set, complete replies are kept in jt_tools.llm_cache; a
+# repeated prompt to the same model with the same parameters is streamed
+# back from disk at once.
+# Try it locally against `python -m jt_tools.llm_mock`.
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import queue
+import sqlite3
+import ssl
+import threading
+import time
+from typing import AsyncIterator, Iterator
+from urllib.parse import urlsplit
+
+from jt_tools import llm_cache, telemetry
+
+try:  # optional: a better pooled client when available
+    import httpx
+except ImportError:
+    httpx = None
+
+log = logging.getLogger("jt.llm")
+
+CONNECT_TIMEOUT_S = float(os.environ.get("JT_LLM_CONNECT_TIMEOUT_S", "5"))
+FIRST_TOKEN_TIMEOUT_S = float(os.environ.get("JT_LLM_FIRST_TOKEN_TIMEOUT_S", "60"))
+IDLE_TIMEOUT_S = float(os.environ.get("JT_LLM_IDLE_TIMEOUT_S", "30"))
+TOTAL_TIMEOUT_S = float(os.environ.get("JT_LLM_TOTAL_TIMEOUT_S", "300"))
+MAX_CONNECTIONS = int(os.environ.get("JT_LLM_MAX_CONNECTIONS", "32"))  # per backend host
+CACHED_CHUNK_CHARS = 400  # a cache hit is replayed in pieces this size
+MAX_TOKENS = int(os.environ.get("JT_LLM_MAX_TOKENS", "1500"))
+TEMPERATURE = float(os.environ.get("JT_LLM_TEMPERATURE", "0.7"))
+
+
+class LLMError(Exception):
+    """A model call failed; the message is safe to show to the user."""
+
+
+class Backend:
+    __slots__ = ("name", "base_url", "model", "api_key", "params")
+
+    def __init__(self, name: str, base_url: str, model: str, api_key: str = "", params: dict | None = None):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.model = model
+        self.api_key = api_key
+        self.params = {"max_tokens": MAX_TOKENS, "temperature": TEMPERATURE, **(params or {})}
+
+    @property
+    def host(self) -> str:
+        return urlsplit(self.base_url).netloc
+
+    def __repr__(self):
+        return f"Backend({self.name!r}, {self.base_url!r}, {self.model!r})"
+
+
+def _load_backends() -> list[Backend]:
+    raw = os.environ.get("JT_LLM_BACKENDS", "")
+    if raw:
+        try:
+            return [
+                Backend(b.get("name") or urlsplit(b["base_url"]).netloc, b["base_url"], b["model"],
+                        os.environ.get(b.get("api_key_env", ""), ""), b.get("params"))
+                for b in json.loads(raw)
+            ]
+        except (ValueError, KeyError, TypeError):
+            log.exception("ignoring malformed JT_LLM_BACKENDS")
+            return []
+    url = os.environ.get("JT_LLM_BASE_URL", "")
+    if not url:
+        return []
+    return [Backend(os.environ.get("JT_LLM_NAME", "default"), url, os.environ.get("JT_LLM_MODEL", "default"),
+                    os.environ.get("JT_LLM_API_KEY", ""))]
+
+
+BACKENDS = _load_backends()
+
+
+def enabled() -> bool:
+    return bool(BACKENDS)
+
+
+def default_backend() -> Backend | None:
+    return BACKENDS[0] if BACKENDS else None
+
+
+# ---------- Shared loop ----------
+
+_loop: asyncio.AbstractEventLoop | None = None
+_client = None
+_LOCK = threading.Lock()
+_STATS: dict[str, dict] = {}
+
+
+def loop() -> asyncio.AbstractEventLoop:
+    """The process-wide event loop all model calls run on (started on first use)."""
+    global _loop
+    if _loop is None:
+        with _LOCK:
+            if _loop is None:
+                new = asyncio.new_event_loop()
+                threading.Thread(target=new.run_forever, name="jt-llm-loop", daemon=True).start()
+                _loop = new
+    return _loop
+
+
+def _get_client():
+    """The pooled client; only touched from the loop thread."""
+    global _client
+    if _client is None:
+        if httpx is not None:
+            _client = httpx.AsyncClient(
+                timeout=httpx.Timeout(IDLE_TIMEOUT_S, connect=CONNECT_TIMEOUT_S),
+                limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS),
+            )
+        else:
+            _client = _StreamClient()
+    return _client
+
+
+# ---------- Stdlib client ----------
+
+class _StreamClient:
+    """Keep-alive HTTP/1.1 POST client with a per-host connection pool."""
+
+    def __init__(self):
+        self._idle: dict[tuple, list] = {}
+        self._slots: dict[tuple, asyncio.Semaphore] = {}
+        self._ssl = ssl.create_default_context()
+
+    async def _connect(self, origin, fresh: bool = False):
+        """(reader, writer, reused): an idle pooled connection, or a new one."""
+        scheme, host, port = origin
+        idle = self._idle.setdefault(origin, [])
+        while idle and not fresh:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port, ssl=self._ssl if scheme == "https" else None),
+                CONNECT_TIMEOUT_S,
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise LLMError(f"could not connect to {host}:{port} ({e or type(e).__name__})") from e
+        return reader, writer, False
+
+    async def stream_lines(self, url: str, headers: dict, body: bytes) -> AsyncIterator[bytes]:
+        """POST and yield the response body line by line; raises LLMError on HTTP errors."""
+        parts = urlsplit(url)
+        origin = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        slot = self._slots.setdefault(origin, asyncio.Semaphore(MAX_CONNECTIONS))
+        head = [f"POST {parts.path or '/'} HTTP/1.1", f"Host: {parts.netloc}", f"Content-Length: {len(body)}",
+                *(f"{k}: {v}" for k, v in headers.items())]
+        request = ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+        async with slot:
+            reader, writer, reused = await self._connect(origin)
+            reusable = False
+            try:
+                try:
+                    writer.write(request)
+                    await writer.drain()
+                    status_line = await reader.readline()
+                except ConnectionError:
+                    status_line = b""
+                if not status_line and reused:  # the server dropped the idle connection; retry once
+                    writer.close()
+                    reader, writer, _ = await self._connect(origin, fresh=True)
+                    writer.write(request)
+                    await writer.drain()
+                    status_line = await reader.readline()
+                if not status_line:
+                    raise LLMError("the backend closed the connection")
+                status = int(status_line.split()[1])
+                resp = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    k, _, v = line.decode("latin-1").partition(":")
+                    resp[k.strip().lower()] = v.strip()
+
+                chunks = self._body(reader, resp)
+                if status != 200:
+                    detail = b"".join([c async for c in chunks])[:300].decode("utf-8", "replace")
+                    raise LLMError(f"HTTP {status} from {parts.netloc}: {detail}")
+                buf = b""
+                async for chunk in chunks:
+                    buf += chunk
+                    *lines, buf = buf.split(b"\n")
+                    for line in lines:
+                        yield line
+                if buf:
+                    yield buf
+                reusable = resp.get("connection", "").lower() != "close"
+            finally:
+                if reusable:
+                    self._idle.setdefault(origin, []).append((reader, writer))
+                else:
+                    writer.close()
+
+    @staticmethod
+    async def _body(reader, resp) -> AsyncIterator[bytes]:
+        if "chunked" in resp.get("transfer-encoding", "").lower():
+            while True:
+                size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    await reader.readline()
+                    return
+                yield await reader.readexactly(size)
+                await reader.readexactly(2)
+        elif "content-length" in resp:
+            yield await reader.readexactly(int(resp["content-length"]))
+        else:
+            while chunk := await reader.read(65536):
+                yield chunk
+
+
+async def _lines(backend: Backend, body: bytes) -> AsyncIterator[bytes]:
+    headers = {"Content-Type": "application/json", "Accept": "text/event-stream"}
+    if backend.api_key:
+        headers["Authorization"] = f"Bearer {backend.api_key}"
+    url = f"{backend.base_url}/chat/completions"
+    client = _get_client()
+    if httpx is None:
+        async with contextlib.aclosing(client.stream_lines(url, headers, body)) as lines:
+            async for line in lines:
+                yield line
+        return
+    try:
+        async with client.stream("POST", url, headers=headers, content=body) as resp:
+            if resp.status_code != 200:
+                detail = (await resp.aread())[:300].decode("utf-8", "replace")
+                raise LLMError(f"HTTP {resp.status_code} from {backend.host}: {detail}")
+            async for line in resp.aiter_lines():
+                yield line.encode()
+    except httpx.HTTPError as e:
+        raise LLMError(f"{backend.host}: {type(e).__name__} {e}") from e
+
+
+# ---------- Streaming ----------
+
+async def astream(prompt: str, backend: Backend | None = None, *, cache: bool = True,
+                  **params) -> AsyncIterator[str]:
+    """Yield the assistant's reply to `prompt` as text deltas, as they arrive.
+
+    With `cache` (the default) a reply already in llm_cache is replayed
+    immediately, and a complete new reply is stored there.
+    """
+    backend = backend or default_backend()
+    if backend is None:
+        raise LLMError("no model backend is configured")
+    params = {**backend.params, **params}
+    store = llm_cache.cache() if cache else None
+    if store is not None:
+        t0 = time.perf_counter()
+        ckey = llm_cache.key(prompt, backend.base_url, backend.model, params)
+        try:
+            hit = await asyncio.to_thread(store.get, ckey)
+        except sqlite3.Error:
+            log.exception("reply cache read failed")
+            hit = None
+        if hit is not None:
+            telemetry.record("llm", f"cache_hit.{backend.name}", time.perf_counter() - t0)
+            _count(backend, "cached", None, time.perf_counter() - t0)
+            for i in range(0, len(hit), CACHED_CHUNK_CHARS):
+                yield hit[i:i + CACHED_CHUNK_CHARS]
+            return
+
+    body = json.dumps({
+        "model": backend.model, "stream": True,
+        "messages": [{"role": "user", "content": prompt}],
+        **params,
+    }).encode()
+
+    reply: list[str] = []
+    t0 = time.perf_counter()
+    deadline = t0 + TOTAL_TIMEOUT_S
+    first = None
+    outcome = "ok"
+    lines = _lines(backend, body).__aiter__()
+    try:
+        while True:
+            wait = min(IDLE_TIMEOUT_S if first else FIRST_TOKEN_TIMEOUT_S, deadline - time.perf_counter())
+            try:
+                line = await asyncio.wait_for(anext(lines), max(wait, 0))
+            except StopAsyncIteration:
+                break
+            # Keep reading past [DONE] to the end of the body so the
+            # connection can go back to the pool.
+            if not line.startswith(b"data:") or (data := line[5:].strip()) == b"[DONE]":
+                continue
+            try:
+                choice = json.loads(data)["choices"][0]
+            except (ValueError, KeyError, IndexError) as e:
+                raise LLMError(f"unexpected response from {backend.host}: {data[:200]!r}") from e
+            piece = (choice.get("delta") or {}).get("content") or ""
+            if piece:
+                if first is None:
+                    first = time.perf_counter() - t0
+                    telemetry.record("llm", f"ttft.{backend.name}", first)
+                reply.append(piece)
+                yield piece
+        if store is not None and reply:
+            try:
+                await asyncio.to_thread(store.put, ckey, backend.model, "".join(reply))
+            except sqlite3.Error:
+                log.exception("reply cache write failed")
+    except asyncio.TimeoutError as e:
+        outcome = "timeout"
+        stage = "the first token" if first is None else "more tokens"
+        if time.perf_counter() >= deadline:
+            stage = f"the full reply ({TOTAL_TIMEOUT_S:.0f} s limit)"
+        raise LLMError(f"{backend.host} timed out waiting for {stage}") from e
+    except asyncio.CancelledError:
+        outcome = "cancelled"
+        raise
+    except LLMError:
+        outcome = "error"
+        raise
+    finally:
+        await lines.aclose()
+        total = time.perf_counter() - t0
+        telemetry.record("llm", f"total.{backend.name}", total, outcome=outcome,
+                         ttft_ms=round(first * 1e3, 1) if first is not None else None)
+        _count(backend, outcome, first, total)
+
+
+def _count(backend: Backend, outcome: str, first: float | None, total: float):
+    with _LOCK:
+        s = _STATS.setdefault(backend.name, {
+            "model": backend.model, "requests": 0, "ok": 0, "cached": 0, "error": 0, "timeout": 0, "cancelled": 0,
+            "ttft_s": 0.0, "ttft_n": 0, "total_s": 0.0, "last_error_at": None,
+        })
+        s["requests"] += 1
+        s[outcome] += 1
+        if first is not None:
+            s["ttft_s"] += first
+            s["ttft_n"] += 1
+        if outcome == "ok":
+            s["total_s"] += total
+        elif outcome in ("error", "timeout"):
+            s["last_error_at"] = time.time()
+
+
+def backend_stats() -> dict[str, dict]:
+    """Per backend: request outcomes, mean time to first token and mean time for a full reply."""
+    with _LOCK:
+        stats = {name: dict(s) for name, s in _STATS.items()}
+    for s in stats.values():
+        ttft_s, ttft_n, total_s = s.pop("ttft_s"), s.pop("ttft_n"), s.pop("total_s")
+        s["mean_ttft_ms"] = round(ttft_s / ttft_n * 1e3, 1) if ttft_n else None
+        s["mean_total_ms"] = round(total_s / s["ok"] * 1e3, 1) if s["ok"] else None
+        s["error_rate"] = round((s["error"] + s["timeout"]) / s["requests"], 3)
+    return stats
+
+
+def fan_out(prompt: str, backends: list[Backend] | None = None, **params) -> Iterator[tuple[int, str, object]]:
+    """Send `prompt` to every backend concurrently; yield (index, kind, value) as events arrive.
+
+    kind is "first" (seconds to first token), "text" (a delta), "done"
+    (total seconds) or "error" (an LLMError); each backend ends with exactly
+    one "done" or "error". Closing the iterator cancels whatever is still running.
+    """
+    backends = list(backends or BACKENDS) or [None]
+    return run_many([(prompt, b) for b in backends], label="fan_out", **params)
+
+
+def run_many(calls: list[tuple[str, Backend | None]], limit: int | None = None, label: str = "run_many",
+             **params) -> Iterator[tuple[int, str, object]]:
+    """Run several (prompt, backend) calls concurrently, at most `limit` at a time.
+
+    Yields the same (index, kind, value) events as fan_out(), indexed by call.
+    """
+    events: queue.Queue = queue.Queue()
+
+    async def one(i: int, prompt: str, backend: Backend | None, gate: asyncio.Semaphore | None):
+        async with gate or contextlib.nullcontext():
+            t0 = time.perf_counter()
+            started = False
+            try:
+                async for piece in astream(prompt, backend, **params):
+                    if not started:
+                        events.put((i, "first", time.perf_counter() - t0))
+                        started = True
+                    events.put((i, "text", piece))
+                events.put((i, "done", time.perf_counter() - t0))
+            except asyncio.CancelledError:
+                raise
+            except LLMError as e:
+                events.put((i, "error", e))
+            except Exception as e:  # a bug or an unexpected transport error: log it, show something useful
+                log.exception("model call failed")
+                events.put((i, "error", LLMError(f"{type(e).__name__}: {e}")))
+
+    async def run_all():
+        gate = asyncio.Semaphore(limit) if limit else None
+        await asyncio.gather(*(one(i, p, b, gate) for i, (p, b) in enumerate(calls)))
+
+    def drain():
+        t0 = time.perf_counter()
+        future = asyncio.run_coroutine_threadsafe(run_all(), loop())
+        running = len(calls)
+        waves = -(-len(calls) // limit) if limit else 1
+        try:
+            while running:
+                try:
+                    item = events.get(timeout=(TOTAL_TIMEOUT_S + CONNECT_TIMEOUT_S) * waves)
+                except queue.Empty:
+                    raise LLMError("the model calls did not finish in time") from None
+                if item[1] in ("done", "error"):
+                    running -= 1
+                yield item
+            if len(calls) > 1:
+                telemetry.record("llm", label, time.perf_counter() - t0, calls=len(calls))
+        finally:
+            future.cancel()
+
+    return drain()
+
+
+def stream(prompt: str, backend: Backend | None = None, **params) -> Iterator[str]:
+    """Blocking iterator over one backend's reply, for st.write_stream(); closing it cancels the call."""
+    events = fan_out(prompt, [backend or default_backend()], **params)
+    try:
+        for _, kind, value in events:
+            if kind == "text":
+                yield value
+            elif kind == "error":
+                raise value
+    finally:
+        events.close()
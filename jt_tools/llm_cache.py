@@ -0,0 +1,155 @@
+# jt_tools/llm_cache.py
+# Disk-backed cache of model replies, shared by every worker on the host (no Streamlit)
+#
+# Keyed by a hash of the final prompt text, the backend's endpoint and model,
+# and the sampling parameters, so a re-opened Quick Review or the same
+# classroom recipe is answered from disk instead of the model. Replies are
+# stored zlib-compressed in one WAL-mode SQLite file. The cache keeps drafts
+# on disk, so it is off unless JT_LLM_CACHE names that file; the file is
+# created readable by its owner only. Entries expire after JT_LLM_CACHE_TTL_S,
+# and once the file holds more than JT_LLM_CACHE_MAX_BYTES of replies the
+# least recently used ones are deleted. Last-used times are refreshed at most
+# once a minute per entry, so a hit is a single indexed read.
+# Only complete replies are stored; cancelled or failed calls never are.
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+log = logging.getLogger("jt.llm_cache")
+
+MAX_BYTES = int(os.environ.get("JT_LLM_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+TTL_S = float(os.environ.get("JT_LLM_CACHE_TTL_S", 7 * 24 * 3600))
+TOUCH_EVERY_S = 60.0
+EVICT_EVERY = 50  # check the size budget every N stores
+
+
+def key(prompt: str, base_url: str, model: str, params: dict) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    for part in (base_url, model, json.dumps(params, sort_keys=True, separators=(",", ":")), prompt):
+        h.update(part.encode("utf-8", "surrogatepass"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+class ReplyCache:
+    """One table in a WAL-mode SQLite file; safe to share between worker processes."""
+
+    def __init__(self, path: str, max_bytes: int = MAX_BYTES, ttl_s: float = TTL_S):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl_s = ttl_s
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stores = 0
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        # SQLite gives the -wal and -shm files the database file's mode.
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+        os.chmod(path, 0o600)
+        with self._conn() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS jt_replies ("
+                " key TEXT PRIMARY KEY, model TEXT NOT NULL, reply BLOB NOT NULL, nbytes INTEGER NOT NULL,"
+                " created REAL NOT NULL, used REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS jt_replies_used ON jt_replies (used)")
+        self.evict()
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 connections are per thread.
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=5.0)
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def _bump(self, stat: str, n: int = 1):
+        with self._lock:
+            self.stats[stat] += n
+
+    def get(self, k: str) -> str | None:
+        now = time.time()
+        db = self._conn()
+        row = db.execute(
+            "SELECT reply, used FROM jt_replies WHERE key = ? AND created >= ?", (k, now - self.ttl_s)
+        ).fetchone()
+        if row is None:
+            self._bump("misses")
+            return None
+        if now - row[1] >= TOUCH_EVERY_S:
+            with db:
+                db.execute("UPDATE jt_replies SET used = ? WHERE key = ?", (now, k))
+        self._bump("hits")
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, k: str, model: str, reply: str):
+        blob = zlib.compress(reply.encode("utf-8"), 6)
+        now = time.time()
+        with self._conn() as db:
+            db.execute(
+                "INSERT INTO jt_replies (key, model, reply, nbytes, created, used) VALUES (?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET reply = excluded.reply, nbytes = excluded.nbytes,"
+                " created = excluded.created, used = excluded.used",
+                (k, model, blob, len(blob), now, now),
+            )
+        self._bump("stores")
+        with self._lock:
+            self._stores += 1
+            due = self._stores % EVICT_EVERY == 0
+        if due:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones until under max_bytes."""
+        removed = 0
+        with self._conn() as db:
+            removed += db.execute("DELETE FROM jt_replies WHERE created < ?", (time.time() - self.ttl_s,)).rowcount
+            total = db.execute("SELECT COALESCE(SUM(nbytes), 0) FROM jt_replies").fetchone()[0]
+            if total > self.max_bytes:
+                # Walk oldest-first and cut where the running total drops under the budget.
+                excess, cutoff = total - self.max_bytes, None
+                for used, nbytes in db.execute("SELECT used, nbytes FROM jt_replies ORDER BY used"):
+                    excess -= nbytes
+                    cutoff = used
+                    if excess <= 0:
+                        break
+                removed += db.execute("DELETE FROM jt_replies WHERE used <= ?", (cutoff,)).rowcount
+        if removed:
+            self._bump("evictions", removed)
+            log.info("evicted %d cached replies", removed)
+        return removed
+
+    def report(self) -> dict:
+        entries, nbytes = self._conn().execute("SELECT COUNT(*), COALESCE(SUM(nbytes), 0) FROM jt_replies").fetchone()
+        with self._lock:
+            stats = dict(self.stats)
+        return {"path": self.path, "entries": entries, "bytes": nbytes, "max_bytes": self.max_bytes,
+                "ttl_s": self.ttl_s, **stats}
+
+
+_cache: ReplyCache | None = None
+_opened = False
+_OPEN_LOCK = threading.Lock()
+
+
+def cache() -> ReplyCache | None:
+    """The process's reply cache, opened on first use; None when disabled."""
+    global _cache, _opened
+    if not _opened:
+        with _OPEN_LOCK:
+            if not _opened:
+                path = os.environ.get("JT_LLM_CACHE", "")
+                if path not in ("", "off"):
+                    try:
+                        _cache = ReplyCache(path)
+                    except (OSError, sqlite3.Error):
+                        log.exception("cannot open reply cache %s; caching disabled", path)
+                _opened = True
+    return _cache
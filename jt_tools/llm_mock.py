@@ -0,0 +1,118 @@
+# jt_tools/llm_mock.py
+# Local mock of an OpenAI-compatible streaming chat endpoint, for trying "Run here"
+#
+#   python -m jt_tools.llm_mock --port 8650 --ttft-ms 300 --tokens-per-s 40
+#   JT_LLM_BASE_URL=http://127.0.0.1:8650/v1 streamlit run app.py
+#
+# POST /v1/chat/completions with "stream": true answers with server-sent
+# events over a chunked, keep-alive response: one delta per word after
+# --ttft-ms, then "data: [DONE]". Without "stream" it returns a single JSON
+# completion. --fail-rate makes that share of requests answer HTTP 500.
+# The reply text names the mock and the prompt size, so side-by-side output
+# from several mocks is easy to tell apart.
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import time
+
+log = logging.getLogger("jt.llm_mock")
+
+WORDS = ("Good", "start.", "Who", "is", "most", "affected,", "and", "how", "do", "you", "know?",
+         "What", "would", "a", "skeptical", "reader", "ask", "first?")
+
+
+def _reply(name: str, prompt: str, n: int) -> list[str]:
+    head = f"[{name}] Read a {len(prompt):,}-character prompt."
+    return [head] + [f" {WORDS[i % len(WORDS)]}" for i in range(n)]
+
+
+def _chunk(data: bytes) -> bytes:
+    return b"%x\r\n%s\r\n" % (len(data), data)
+
+
+def _sse(obj) -> bytes:
+    return _chunk(b"data: " + json.dumps(obj).encode() + b"\n\n")
+
+
+async def _respond(writer, args, body: dict):
+    prompt = "".join(m.get("content", "") for m in body.get("messages", []))
+    model = body.get("model", "mock")
+    pieces = _reply(args.name, prompt, args.tokens)
+    cid = f"chatcmpl-mock-{random.getrandbits(32):08x}"
+
+    if args.fail_rate and random.random() < args.fail_rate:
+        err = json.dumps({"error": {"message": "mock failure", "type": "server_error"}}).encode()
+        writer.write(b"HTTP/1.1 500 Internal Server Error\r\nContent-Type: application/json\r\n"
+                     b"Content-Length: %d\r\n\r\n%s" % (len(err), err))
+        return
+
+    await asyncio.sleep(args.ttft_ms / 1e3)
+    if not body.get("stream"):
+        out = json.dumps({"id": cid, "object": "chat.completion", "model": model, "choices": [
+            {"index": 0, "message": {"role": "assistant", "content": "".join(pieces)}, "finish_reason": "stop"}]}).encode()
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n%s" % (len(out), out))
+        return
+
+    writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nTransfer-Encoding: chunked\r\n\r\n")
+    gap = 1 / args.tokens_per_s if args.tokens_per_s else 0
+    for i, piece in enumerate(pieces):
+        if i:
+            await asyncio.sleep(gap)
+        writer.write(_sse({"id": cid, "object": "chat.completion.chunk", "model": model,
+                           "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]}))
+        await writer.drain()
+    writer.write(_sse({"id": cid, "object": "chat.completion.chunk", "model": model,
+                       "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}))
+    writer.write(_chunk(b"data: [DONE]\n\n") + b"0\r\n\r\n")
+
+
+async def _serve(reader, writer, args):
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            lines = head.decode("latin-1").split("\r\n")
+            method, target, _ = lines[0].split(" ", 2)
+            headers = {k.strip().lower(): v.strip() for k, _, v in (l.partition(":") for l in lines[1:] if l)}
+            raw = await reader.readexactly(int(headers.get("content-length") or 0))
+            t0 = time.perf_counter()
+            if method == "POST" and target.rstrip("/").endswith("/chat/completions"):
+                await _respond(writer, args, json.loads(raw or b"{}"))
+            else:
+                writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+            log.info("%s %s %.0f ms", method, target, (time.perf_counter() - t0) * 1e3)
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def main_async(args):
+    server = await asyncio.start_server(lambda r, w: _serve(r, w, args), args.host, args.port)
+    log.info("mock %r on http://%s:%d/v1", args.name, args.host, args.port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mock OpenAI-compatible streaming endpoint")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8650)
+    parser.add_argument("--name", default="mock")
+    parser.add_argument("--ttft-ms", type=float, default=300)
+    parser.add_argument("--tokens-per-s", type=float, default=40)
+    parser.add_argument("--tokens", type=int, default=60, help="words per reply")
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    try:
+        asyncio.run(main_async(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
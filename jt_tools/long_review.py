@@ -0,0 +1,155 @@
+# jt_tools/long_review.py
+# Long-draft Quick Review: budgeted parts, one prompt per part, then a synthesis (no Streamlit)
+#
+# A draft over LONG_DRAFT_TOKENS (JT_LONG_DRAFT_TOKENS) is too big to review
+# well in one prompt, so plan() splits it into parts of at most PART_TOKENS
+# (JT_PART_TOKENS) and builds one short review prompt per part plus a
+# synthesis prompt that checks hed/lede alignment and blindsides across the
+# whole piece from the parts' notes. Every part prompt carries the headline
+# and lede for context, so the parts are independent and can run in
+# parallel.
+#
+# split_draft() makes one streaming pass over the text. It breaks between
+# paragraphs, early at a section break (a Markdown heading, "***", "---" or
+# an all-caps subhead) once the current part is half full, and only splits a
+# paragraph that is over budget on its own: at sentence ends, and a sentence
+# that is still over budget between words.
+#
+# run() sends the part prompts to a model backend concurrently (at most
+# PARALLEL_PARTS at a time, each reply capped at PART_REPLY_TOKENS, so every
+# call's latency is bounded by a small input and a short reply), then the
+# synthesis with the notes filled in.
+
+import os
+import re
+from typing import Iterator
+
+from jt_tools import llm, tokens
+from jt_tools.templates import quick_review_part_prompt, quick_review_synthesis_prompt
+
+LONG_DRAFT_TOKENS = int(os.environ.get("JT_LONG_DRAFT_TOKENS", "4000"))
+PART_TOKENS = int(os.environ.get("JT_PART_TOKENS", "1500"))
+PART_REPLY_TOKENS = 400
+PARALLEL_PARTS = int(os.environ.get("JT_PARALLEL_PARTS", "4"))
+OPENING_WORDS = 120
+
+_PARAGRAPH = re.compile(r"[^\n]*\S[^\n]*(?:\n[^\n]*\S[^\n]*)*")  # a run of non-blank lines
+_SECTION = re.compile(  # matched against a paragraph's first line
+    r"#{1,6}\s|(?:\*\s*){3,}$|(?:-\s*){3,}$|(?:_\s*){3,}$|(?=[^\n]*[A-Z])[A-Z0-9][A-Z0-9 ,:;'&/-]{2,60}$",
+    re.MULTILINE,
+)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|(?<=[.!?][\"'”’)\]])\s+")
+
+
+def is_long(draft: str) -> bool:
+    return tokens.estimate(draft) > LONG_DRAFT_TOKENS
+
+
+# ---------- Splitting ----------
+
+def _units(draft: str, budget: int) -> Iterator[tuple[str, str, bool, int]]:
+    """(text, separator before it, starts a section, tokens) per paragraph, or per
+    sentence / word run of a paragraph that does not fit the budget on its own."""
+    for m in _PARAGRAPH.finditer(draft):
+        para = m.group().strip()
+        section = _SECTION.match(para) is not None
+        n = tokens.count(para)
+        if n <= budget:
+            yield para, "\n\n", section, n
+            continue
+        sep = "\n\n"
+        for sentence in _SENTENCE_END.split(para):
+            n = tokens.count(sentence)
+            if n <= budget:
+                yield sentence, sep, section, n
+            else:
+                words = sentence.split()
+                step = max(1, len(words) * budget // n)
+                for i in range(0, len(words), step):
+                    run = " ".join(words[i:i + step])
+                    yield run, sep, section, tokens.count(run)
+                    sep, section = " ", False
+            sep, section = " ", False
+
+
+def split_draft(draft: str, budget: int = PART_TOKENS) -> Iterator[str]:
+    """Yield the draft in parts of at most about `budget` tokens, in one pass."""
+    parts: list[str] = []
+    size = 0
+    for text, sep, section, n in _units(draft, budget):
+        if parts and (size + n > budget or (section and size >= budget // 2)):
+            yield "".join(parts)
+            parts, size = [], 0
+        parts.append(sep + text if parts else text)
+        size += n
+    if parts:
+        yield "".join(parts)
+
+
+def opening(draft: str, words: int = OPENING_WORDS) -> str:
+    """The headline and lede: whole leading paragraphs up to about `words` words."""
+    out, count = [], 0
+    for m in _PARAGRAPH.finditer(draft):
+        para = m.group().strip()
+        out.append(para)
+        count += len(para.split())
+        if count >= words:
+            break
+    text = "\n\n".join(out)
+    split = text.split()
+    return text if len(split) <= words * 2 else " ".join(split[:words * 2]) + " …"
+
+
+# ---------- Prompts ----------
+
+class Plan:
+    """The parts of one draft, a review prompt per part, and the synthesis inputs."""
+
+    __slots__ = ("parts", "prompts", "fields")
+
+    def __init__(self, parts: list[str], prompts: list[str], fields: dict):
+        self.parts = parts
+        self.prompts = prompts
+        self.fields = fields
+
+    def synthesis(self, notes: tuple[str, ...] = ()) -> str:
+        """The synthesis prompt, with the parts' replies if given (else a paste placeholder)."""
+        return quick_review_synthesis_prompt(total=len(self.parts), part_notes=tuple(notes), **self.fields)
+
+
+def plan(*, level: str, draft: str, budget: int = PART_TOKENS, **fields: str) -> Plan:
+    """Split `draft` and build its part prompts; `fields` are quick_review_prompt()'s other fields."""
+    shared = {"level": level, "opening": opening(draft), **fields}
+    parts = list(split_draft(draft, budget))
+    prompts = [quick_review_part_prompt(part=p, index=i, total=len(parts), **shared)
+               for i, p in enumerate(parts, 1)]
+    return Plan(parts, prompts, shared)
+
+
+# ---------- Running ----------
+
+def run(p: Plan, backend: llm.Backend | None = None) -> Iterator[tuple[str, int, object]]:
+    """Review every part concurrently, then the synthesis; yield events as they arrive.
+
+    ("part", i, event) wraps llm.run_many()'s (kind, value) for part i; then
+    ("synthesis", 0, event) likewise. Parts that fail are passed to the
+    synthesis as "[not reviewed: ...]". Closing the iterator cancels the calls.
+    """
+    notes = [""] * len(p.prompts)
+    events = llm.run_many([(prompt, backend) for prompt in p.prompts], limit=PARALLEL_PARTS,
+                          label="long_review", max_tokens=PART_REPLY_TOKENS)
+    try:
+        for i, kind, value in events:
+            if kind == "text":
+                notes[i] += value
+            elif kind == "error":
+                notes[i] = f"[not reviewed: {value}]"
+            yield "part", i, (kind, value)
+    finally:
+        events.close()
+    events = llm.run_many([(p.synthesis(tuple(notes)), backend)])
+    try:
+        for _, kind, value in events:
+            yield "synthesis", 0, (kind, value)
+    finally:
+        events.close()
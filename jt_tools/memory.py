@@ -0,0 +1,283 @@
+# jt_tools/memory.py
+# Memory governor: per-session byte accounting, size caps, idle eviction
+#
+# Every script run ends with track(), which records how many bytes this
+# session holds in the governed keys (drafts, transcripts, submitted forms)
+# and when it was last active. A background sweeper looks at sessions that
+# have been idle for JT_IDLE_EVICT_S and hold at least EVICT_MIN_BYTES:
+#   - widget values (the draft / transcript text areas) are dropped; the
+#     browser still has the text and sends it back with the next rerun
+#   - stored form data is spilled to a compressed file (JT_EVICT_MODE=spill,
+#     the default) in a directory only this user can read (JT_SPILL_DIR, or
+#     a fresh temp dir per process, removed at exit) and read back by
+#     rehydrate() at the start of the session's next run, or discarded
+#     (JT_EVICT_MODE=drop); a session that ends leaves no spill files behind
+# memory_report() aggregates all of it for the process.
+#
+# Entries are keyed by session id and hold the latest run's session state
+# wrapper (Streamlit makes a new one per script runner, around the session's
+# one lasting SessionState). An entry is forgotten once the runtime no longer
+# knows the session; the sweeper changes state only under the wrapper's lock,
+# and never while a run is in progress.
+
+import atexit
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from jt_tools import records
+from jt_tools.session_store import dumps, loads
+from jt_tools.validation import MAX_DRAFT_CHARS, MAX_TRANSCRIPT_CHARS
+
+log = logging.getLogger("jt.memory")
+
+IDLE_EVICT_S = float(os.environ.get("JT_IDLE_EVICT_S", 15 * 60))
+EVICT_MIN_BYTES = int(os.environ.get("JT_EVICT_MIN_BYTES", 16 * 1024))
+EVICT_MODE = os.environ.get("JT_EVICT_MODE", "spill")
+SPILL_DIR = os.environ.get("JT_SPILL_DIR") or None  # None: mkdtemp() on first spill
+SWEEP_INTERVAL_S = 60.0
+
+# Text areas whose values the browser re-sends on every rerun.
+WIDGET_KEYS = ("qr_q1_draft", "workshop_transcript")
+# Submitted data that only the server holds.
+STORED_KEYS = ("qr_form_data", *records.SESSION_KEYS)
+
+
+class Spilled:
+    """Placeholder left in session state for a value moved to disk."""
+
+    __slots__ = ("path", "nbytes")
+
+    def __init__(self, path: str, nbytes: int):
+        self.path = path
+        self.nbytes = nbytes
+
+    def __repr__(self):
+        return f"Spilled({self.nbytes} bytes)"
+
+
+class _Entry:
+    __slots__ = ("state", "bytes", "last_seen", "running", "lock")
+
+    def __init__(self, state):
+        self.state = state  # this session's SafeSessionState, refreshed every run
+        self.bytes = 0
+        self.last_seen = time.time()
+        self.running = False
+        self.lock = threading.Lock()
+
+
+_SESSIONS: dict[str, _Entry] = {}
+_LOCK = threading.Lock()
+_STATS = {"evictions": 0, "evicted_bytes": 0, "spills": 0, "spilled_bytes": 0, "rehydrations": 0, "dropped": 0}
+_sweeper: threading.Thread | None = None
+
+
+def _bump(stat: str, n: int = 1):
+    with _LOCK:
+        _STATS[stat] += n
+
+
+# ---------- Accounting ----------
+
+def value_nbytes(value) -> int:
+    """Approximate bytes held by one governed value."""
+    if isinstance(value, str):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(value_nbytes(v) for v in value.values())
+    if isinstance(value, records.FormRecord):
+        return value.nbytes()
+    if isinstance(value, Spilled):
+        return sys.getsizeof(value)
+    return sys.getsizeof(value) if value is not None else 0
+
+
+def session_nbytes(state) -> int:
+    return sum(value_nbytes(state[k]) for k in (*WIDGET_KEYS, *STORED_KEYS) if k in state)
+
+
+# ---------- Per-run hooks ----------
+
+def _entry() -> tuple[str, _Entry] | tuple[None, None]:
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None, None
+    with _LOCK:
+        entry = _SESSIONS.get(ctx.session_id)
+        if entry is None:
+            entry = _SESSIONS[ctx.session_id] = _Entry(ctx.session_state)
+    entry.state = ctx.session_state
+    return ctx.session_id, entry
+
+
+def _alive(sid: str) -> bool:
+    # Without a runtime (tests, bare mode) sessions live as long as the process.
+    return not Runtime.exists() or Runtime.instance().is_active_session(sid)
+
+
+def rehydrate():
+    """Start of a run: mark the session busy and read back anything spilled."""
+    sid, entry = _entry()
+    if entry is None:
+        return
+    state = entry.state
+    with entry.lock:
+        entry.running = True
+        entry.last_seen = time.time()
+        for key in STORED_KEYS:
+            value = state[key] if key in state else None
+            if not isinstance(value, Spilled):
+                continue
+            try:
+                with open(value.path, "rb") as f:
+                    state[key] = loads(f.read())["v"]
+                os.remove(value.path)
+                _bump("rehydrations")
+            except (OSError, ValueError):
+                log.exception("session %s: spilled %s is gone; dropping it", sid, key)
+                del state[key]
+
+
+def track():
+    """End of a run: record this session's footprint and mark it idle."""
+    global _sweeper
+    sid, entry = _entry()
+    if entry is None:
+        return
+    with entry.lock:
+        entry.bytes = session_nbytes(entry.state)
+        entry.last_seen = time.time()
+        entry.running = False
+    if _sweeper is None:
+        with _LOCK:
+            if _sweeper is None:
+                _sweeper = threading.Thread(target=_sweep_loop, name="jt-memory-sweep", daemon=True)
+                _sweeper.start()
+
+
+# ---------- Eviction ----------
+
+def _spill_dir() -> str:
+    global SPILL_DIR
+    with _LOCK:
+        if SPILL_DIR is None:
+            SPILL_DIR = tempfile.mkdtemp(prefix="jt_spill-")  # mode 0700
+            atexit.register(shutil.rmtree, SPILL_DIR, ignore_errors=True)
+        else:
+            os.makedirs(SPILL_DIR, mode=0o700, exist_ok=True)
+        return SPILL_DIR
+
+
+def _spill(sid: str, key: str, value) -> Spilled:
+    path = os.path.join(_spill_dir(), f"{sid}.{key}.jt")
+    blob = dumps({"v": value})
+    with open(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as f:
+        f.write(blob)
+    _bump("spills")
+    _bump("spilled_bytes", len(blob))
+    return Spilled(path, len(blob))
+
+
+def evict(sid: str, entry: _Entry) -> int:
+    """Release the governed values of one idle session. Returns bytes released."""
+    state = entry.state
+    released = 0
+    with entry.lock, state._lock:
+        if entry.running:
+            return 0
+        for key in WIDGET_KEYS:
+            if key in state:
+                released += value_nbytes(state[key])
+                del state[key]
+        for key in STORED_KEYS:
+            if key not in state or isinstance(state[key], Spilled):
+                continue
+            value = state[key]
+            released += value_nbytes(value)
+            if EVICT_MODE == "spill":
+                try:
+                    state[key] = _spill(sid, key, value)
+                    continue
+                except OSError:
+                    log.exception("session %s: spill of %s failed; dropping it", sid, key)
+            del state[key]
+            _bump("dropped")
+        entry.bytes = session_nbytes(state)
+    _bump("evictions")
+    _bump("evicted_bytes", released)
+    return released
+
+
+def _forget(sid: str, entry: _Entry):
+    """Drop a session that has ended, deleting whatever it still has on disk."""
+    with entry.lock:
+        state = entry.state
+        for key in STORED_KEYS:
+            value = state[key] if key in state else None
+            if isinstance(value, Spilled):
+                try:
+                    os.remove(value.path)
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    log.exception("session %s: cannot delete spilled %s", sid, key)
+        with _LOCK:
+            _SESSIONS.pop(sid, None)
+
+
+def sweep(now: float | None = None) -> int:
+    """One pass: forget dead sessions, evict big idle ones. Returns bytes released."""
+    now = time.time() if now is None else now
+    with _LOCK:
+        items = list(_SESSIONS.items())
+    released = 0
+    for sid, entry in items:
+        if not _alive(sid):
+            _forget(sid, entry)
+            continue
+        if entry.bytes >= EVICT_MIN_BYTES and now - entry.last_seen >= IDLE_EVICT_S and not entry.running:
+            released += evict(sid, entry)
+    if released:
+        log.info("evicted %d bytes from idle sessions", released)
+    return released
+
+
+def _sweep_loop():
+    while True:
+        time.sleep(SWEEP_INTERVAL_S)
+        try:
+            sweep()
+        except Exception:
+            log.exception("memory sweep failed")
+
+
+# ---------- Report ----------
+
+def memory_report() -> dict:
+    """Process-wide view: bytes per session, idle/large sessions, eviction totals."""
+    now = time.time()
+    with _LOCK:
+        entries = list(_SESSIONS.values())
+        stats = dict(_STATS)
+    sizes = sorted(e.bytes for e in entries)
+    return {
+        "sessions": len(entries),
+        "total_bytes": sum(sizes),
+        "p50_bytes": statistics.median(sizes) if sizes else 0,
+        "max_bytes": sizes[-1] if sizes else 0,
+        "idle_sessions": sum(1 for e in entries if now - e.last_seen >= IDLE_EVICT_S),
+        "over_evict_min": sum(1 for s in sizes if s >= EVICT_MIN_BYTES),
+        "caps": {"draft_chars": MAX_DRAFT_CHARS, "transcript_chars": MAX_TRANSCRIPT_CHARS},
+        "idle_evict_s": IDLE_EVICT_S,
+        "evict_mode": EVICT_MODE,
+        **stats,
+    }
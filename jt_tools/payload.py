@@ -0,0 +1,62 @@
+# jt_tools/payload.py
+# Bytes-per-rerun accounting for what each page sends to the browser
+#
+# measure(page) wraps one page render and sums the serialized size of every
+# ForwardMsg the script run enqueues for the session (deltas, widget state,
+# component args). Totals are logged on "jt.payload" and kept per page.
+
+import contextlib
+import logging
+import threading
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+log = logging.getLogger("jt.payload")
+
+_STATS: dict[str, dict] = {}
+_LOCK = threading.Lock()
+
+
+def _record(page: str, nbytes: int, nmsgs: int):
+    with _LOCK:
+        s = _STATS.setdefault(page, {"runs": 0, "bytes": 0, "max_bytes": 0, "last_bytes": 0})
+        s["runs"] += 1
+        s["bytes"] += nbytes
+        s["last_bytes"] = nbytes
+        s["max_bytes"] = max(s["max_bytes"], nbytes)
+    log.info("page %s sent %d bytes in %d messages", page, nbytes, nmsgs)
+
+
+@contextlib.contextmanager
+def measure(page: str):
+    """Count bytes enqueued to the browser while the block runs."""
+    ctx = get_script_run_ctx()
+    orig = getattr(ctx, "_enqueue", None)
+    if orig is None:  # bare mode / internals changed: nothing to hook
+        yield
+        return
+
+    nbytes = 0
+    nmsgs = 0
+
+    def counting_enqueue(msg):
+        nonlocal nbytes, nmsgs
+        nbytes += msg.ByteSize()
+        nmsgs += 1
+        orig(msg)
+
+    ctx._enqueue = counting_enqueue
+    try:
+        yield
+    finally:
+        ctx._enqueue = orig
+        _record(page, nbytes, nmsgs)
+
+
+def payload_stats() -> dict[str, dict]:
+    """Per page: runs, total bytes, mean/max/last bytes per rerun."""
+    with _LOCK:
+        return {
+            page: {**s, "mean_bytes": s["bytes"] / s["runs"] if s["runs"] else 0}
+            for page, s in _STATS.items()
+        }
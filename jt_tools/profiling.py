@@ -0,0 +1,161 @@
+# jt_tools/profiling.py
+# On-demand cProfile + tracemalloc capture around one routed page render
+#
+# Off unless an operator turns it on:
+#   JT_PROFILE=1                  profile every script run in this process
+#   ?jt_profile=<JT_PROFILE_TOKEN> profile every run of this browser session
+#   ?jt_profile=off               stop profiling this session
+# Each captured run leaves three files in JT_PROFILE_DIR (created 0700:
+# profiles hold code paths and values from live requests), named
+# "<utc time>-<page>-<session>": .prof (pstats, open with snakeviz/pstats),
+# .tracemalloc (tracemalloc.Snapshot.dump) and .txt (top functions and
+# allocation sites). Only the newest JT_PROFILE_KEEP captures are kept.
+# The hidden admin page (jt_tools.admin) lists them for download.
+
+import contextlib
+import cProfile
+import hmac
+import io
+import logging
+import os
+import pstats
+import re
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+log = logging.getLogger("jt.profiling")
+
+PROFILE_ALL = os.environ.get("JT_PROFILE", "") in ("1", "true", "yes")
+PROFILE_TOKEN = os.environ.get("JT_PROFILE_TOKEN", "")
+ADMIN_TOKEN = os.environ.get("JT_ADMIN_TOKEN", "")
+PROFILE_DIR = os.environ.get("JT_PROFILE_DIR") or os.path.join(tempfile.gettempdir(), "jt_profiles")
+PROFILE_KEEP = int(os.environ.get("JT_PROFILE_KEEP", "50"))
+QUERY_PARAM = "jt_profile"
+ADMIN_PARAM = "jt_admin"
+TOP_N = 40
+
+# cProfile allows one active profiler per process; concurrent profiled runs
+# queue here rather than failing.
+_PROFILE_LOCK = threading.Lock()
+
+
+def token_ok(given: str | None, expected: str) -> bool:
+    return bool(expected) and bool(given) and hmac.compare_digest(given, expected)
+
+
+def admin_requested() -> bool:
+    """Consume ?jt_admin; True once a valid JT_ADMIN_TOKEN has been given in this session."""
+    given = st.query_params.get(ADMIN_PARAM)
+    if given is not None:
+        if token_ok(given, ADMIN_TOKEN):
+            st.session_state._jt_admin = True
+        else:
+            log.warning("rejected %s query param", ADMIN_PARAM)
+        del st.query_params[ADMIN_PARAM]
+        return st.session_state.get("_jt_admin", False)
+    return False
+
+
+def is_admin() -> bool:
+    return st.session_state.get("_jt_admin", False)
+
+
+def _session_enabled() -> bool:
+    """Apply ?jt_profile to this session; True if its runs should be profiled."""
+    if PROFILE_ALL:
+        return True
+    given = st.query_params.get(QUERY_PARAM)
+    if given == "off":
+        st.session_state.pop("_jt_profile", None)
+        del st.query_params[QUERY_PARAM]
+    elif given is not None:
+        if token_ok(given, PROFILE_TOKEN):
+            st.session_state._jt_profile = True
+        else:
+            log.warning("rejected %s query param", QUERY_PARAM)
+        del st.query_params[QUERY_PARAM]  # keep the token out of shared links
+    return st.session_state.get("_jt_profile", False)
+
+
+@contextlib.contextmanager
+def capture(page: str):
+    """Profile the block if profiling is on for this session; otherwise a no-op."""
+    if not _session_enabled():
+        yield
+        return
+
+    ctx = get_script_run_ctx()
+    session = re.sub(r"[^A-Za-z0-9]", "", ctx.session_id if ctx else "nosession")[:8]
+    with _PROFILE_LOCK:
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(10)
+        profiler = cProfile.Profile()
+        t0 = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - t0
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+            try:
+                _dump(page, session, profiler, snapshot, elapsed, peak)
+            except OSError:
+                log.exception("could not write profile for page %s", page)
+
+
+def _dump(page, session, profiler, snapshot, elapsed, peak):
+    os.makedirs(PROFILE_DIR, mode=0o700, exist_ok=True)
+    stem = os.path.join(PROFILE_DIR, f"{time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())}-{page}-{session}")
+    profiler.dump_stats(stem + ".prof")
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+    snapshot.dump(stem + ".tracemalloc")
+
+    out = io.StringIO()
+    out.write(f"page {page}  session {session}  wall {elapsed * 1e3:.1f} ms  traced peak {peak / 1024:.1f} KiB\n\n")
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(TOP_N)
+    out.write(f"\nTop {TOP_N} allocation sites (still allocated at end of run):\n")
+    for stat in snapshot.statistics("lineno")[:TOP_N]:
+        out.write(f"  {stat}\n")
+    with open(stem + ".txt", "w", encoding="utf-8") as f:
+        f.write(out.getvalue())
+    log.info("profiled page %s in %.1f ms -> %s.*", page, elapsed * 1e3, stem)
+    _prune()
+
+
+def _prune():
+    caps = captures()
+    for cap in caps[PROFILE_KEEP:]:
+        for path in cap["files"].values():
+            with contextlib.suppress(OSError):
+                os.remove(path)
+
+
+def captures() -> list[dict]:
+    """Captured runs, newest first: {name, page, mtime, bytes, files: {ext: path}}."""
+    if not os.path.isdir(PROFILE_DIR):
+        return []
+    grouped: dict[str, dict] = {}
+    for entry in os.scandir(PROFILE_DIR):
+        stem, ext = os.path.splitext(entry.name)
+        if ext not in (".prof", ".tracemalloc", ".txt"):
+            continue
+        cap = grouped.setdefault(stem, {"name": stem, "page": stem.split("-", 1)[-1].rsplit("-", 1)[0],
+                                        "mtime": 0.0, "bytes": 0, "files": {}})
+        info = entry.stat()
+        cap["files"][ext] = entry.path
+        cap["bytes"] += info.st_size
+        cap["mtime"] = max(cap["mtime"], info.st_mtime)
+    return sorted(grouped.values(), key=lambda c: c["name"], reverse=True)
@@ -3,38 +3,12 @@
 # v1.0
 
 import streamlit as st
-import textwrap
-import html
-import uuid
 
-
-def go_to(page: str):
-    st.session_state.page = page
-    st.rerun()
-
-
-def copy_button_js(text_to_copy: str, button_text: str = "Copy to Clipboard"):
-    """Safe copy-to-clipboard: escapes content and uses unique IDs each call."""
-    unique_key = uuid.uuid4().hex[:8]
-    unique_id = f"copy-btn-{unique_key}"
-    text_area_id = f"text-area-{unique_key}"
-    safe = html.escape(text_to_copy or "", quote=True)
-    st.components.v1.html(
-        f"""
-        <textarea id="{text_area_id}" style="opacity:0;position:absolute;height:0;width:0;">{safe}</textarea>
-        <button id="{unique_id}" onclick="
-            const text = document.getElementById('{text_area_id}').value;
-            if (!navigator.clipboard) {{ return; }}
-            navigator.clipboard.writeText(text).then(() => {{
-                const btn = document.getElementById('{unique_id}');
-                const original = btn.innerText;
-                btn.innerText = 'Copied!';
-                setTimeout(() => {{ btn.innerText = original; }}, 1500);
-            }});
-        ">{button_text}</button>
-        """,
-        height=40,
-    )
+from jt_tools import long_review, tokens
+from jt_tools.components import counted_text_area, prompt_panel, prompt_size, run_here, run_long_review
+from jt_tools.router import form_completed, go_to, level_radio, nav_button
+from jt_tools.templates import quick_review_prompt
+from jt_tools.validation import MAX_DRAFT_CHARS, quick_review_fields, validate_quick_review
 
 
 def render_quick_review():
@@ -44,13 +18,32 @@ def render_quick_review():
     if "quick_review_page" not in st.session_state:
         st.session_state.quick_review_page = "questionnaire"
     
-    if st.session_state.quick_review_page == "questionnaire":
-        _render_questionnaire()
-    elif st.session_state.quick_review_page == "recipe":
+    if st.session_state.quick_review_page == "recipe":
         _render_recipe()
     else:
         st.session_state.quick_review_page = "questionnaire"
-        st.rerun()
+        _render_questionnaire()
+
+
+def _submit_questionnaire():
+    """Form callback: validate and hand off to the recipe page in the same run."""
+    q1_draft = st.session_state.get("qr_q1_draft")
+    q2_publication = st.session_state.get("qr_q2_publication")
+    q3_story_purpose = st.session_state.get("qr_q3_story_purpose")
+    q4_criticized = st.session_state.get("qr_q4_criticized")
+    q5_unsure = st.session_state.get("qr_q5_unsure")
+
+    errors = validate_quick_review(draft=q1_draft, story_purpose=q3_story_purpose)
+    if errors:
+        st.session_state.qr_error = errors[0]
+    else:
+        st.session_state.pop("qr_error", None)
+        st.session_state.qr_form_data = quick_review_fields(
+            draft=q1_draft, publication=q2_publication, story_purpose=q3_story_purpose,
+            criticized=q4_criticized, unsure=q5_unsure,
+        )
+        form_completed("quick_review")
+        go_to("quick_review", quick_review_page="recipe")
 
 
 def _render_questionnaire():
@@ -63,15 +56,7 @@ def _render_questionnaire():
     st.markdown("---")
     
     # Experience level selector
-    level = st.radio(
-        "Your experience level (affects tone):",
-        ["High School journalist", "Undergraduate journalist", "Grad school journalist", "Working journalist"],
-        index=["High School journalist", "Undergraduate journalist", "Grad school journalist", "Working journalist"]
-            .index(st.session_state.get("journalism_level", "High School journalist")),
-        horizontal=True,
-        key="qr_level_selector"
-    )
-    st.session_state.journalism_level = level
+    level_radio("Your experience level (affects tone):", key="qr_level_selector")
     
     st.markdown("---")
     st.markdown("### Five quick questions, then you'll get a prompt for your review.")
@@ -80,69 +65,88 @@ def _render_questionnaire():
     with st.form("quick_review_form"):
         with st.container(border=True):
             # Question 1: The draft
-            q1_draft = st.text_area(
+            counted_text_area(
                 "**1. Paste your draft here:**",
                 height=300,
-                help="Include headline if you have one."
+                help="Include headline if you have one.",
+                max_chars=MAX_DRAFT_CHARS,
+                key="qr_q1_draft",
             )
             
             st.markdown("---")
             
             # Question 2: Publication
-            q2_publication = st.text_input(
+            st.text_input(
                 "**2. What publication is this for?**",
-                placeholder="e.g., school paper, class assignment, local news site"
+                placeholder="e.g., school paper, class assignment, local news site",
+                key="qr_q2_publication",
             )
             
             st.markdown("---")
             
             # Question 3: What's the story
-            q3_story_purpose = st.text_area(
+            st.text_area(
                 "**3. In one sentence: what is this story about and why does it matter?**",
                 height=80,
-                help="This helps check if your headline and lede deliver on your intent."
+                help="This helps check if your headline and lede deliver on your intent.",
+                key="qr_q3_story_purpose",
             )
             
             st.markdown("---")
             
             # Question 4: Blindside check
-            q4_criticized = st.text_area(
+            st.text_area(
                 "**4. Is there anyone in this story who might feel criticized or exposed?**",
                 height=80,
-                help="Think about anyone quoted, named, or affected by the story's subject."
+                help="Think about anyone quoted, named, or affected by the story's subject.",
+                key="qr_q4_criticized",
             )
             
             st.markdown("---")
             
             # Question 5: Biggest worry
-            q5_unsure = st.text_area(
+            st.text_area(
                 "**5. What's the one thing you're most unsure about?**",
                 height=80,
-                help="Could be a fact, a quote, the structure, the headline—anything."
+                help="Could be a fact, a quote, the structure, the headline—anything.",
+                key="qr_q5_unsure",
             )
         
-        submitted = st.form_submit_button("Generate Quick Review Prompt", type="primary", use_container_width=True)
-        
-        if submitted:
-            if not q1_draft or not q1_draft.strip():
-                st.error("Please paste your draft before continuing.")
-            elif not q3_story_purpose or not q3_story_purpose.strip():
-                st.error("Please describe what your story is about (Question 3).")
-            else:
-                st.session_state.qr_form_data = dict(
-                    draft=q1_draft.strip(),
-                    publication=q2_publication.strip() if q2_publication else "Not specified",
-                    story_purpose=q3_story_purpose.strip(),
-                    criticized=q4_criticized.strip() if q4_criticized else "None identified",
-                    unsure=q5_unsure.strip() if q5_unsure else "Nothing specific",
-                )
-                st.session_state.quick_review_page = "recipe"
-                st.rerun()
+        st.form_submit_button(
+            "Generate Quick Review Prompt", type="primary", use_container_width=True,
+            on_click=_submit_questionnaire,
+        )
+        if "qr_error" in st.session_state:
+            st.error(st.session_state.pop("qr_error"))
     
     st.markdown("---")
-    if st.button("← Back to Portal"):
-        st.session_state.quick_review_page = "questionnaire"  # Reset for next time
-        go_to("portal")
+    # Reset quick_review_page for next time
+    nav_button("← Back to Portal", "portal", {"quick_review_page": "questionnaire"})
+
+
+def _render_long_draft(level: str, data: dict):
+    """Long-draft mode: one prompt per part of the draft, then a prompt that combines them."""
+    st.markdown("---")
+    st.subheader("Long-Draft Mode")
+    st.markdown(
+        f"Your draft is about **{tokens.estimate(data['draft']):,} tokens**, "
+        "long enough that many AI tools skim it or cut it off. Instead, you can review it in parts: paste "
+        "each part's prompt into a **new** chat, then paste the replies into the final prompt, which checks "
+        "your hed, lede and blindsides across the whole story. The parts don't depend on each other, so you "
+        "can run them at the same time."
+    )
+    # Every part prompt repeats a slice of the draft; build and send them only on request.
+    if not st.toggle("Review it in parts", key="qr_long_mode"):
+        return
+    plan = long_review.plan(level=level, **data)
+    n = len(plan.parts)
+    for i, prompt in enumerate(plan.prompts, 1):
+        first_words = " ".join(plan.parts[i - 1].split()[:8])
+        with st.expander(f"Part {i} of {n}: {first_words}…"):
+            prompt_panel(prompt, key=f"qr_part_{i}", height=320, filename=f"quick-review-part-{i}.md")
+    with st.expander(f"Final step: combine the {n} parts"):
+        prompt_panel(plan.synthesis(), key="qr_synthesis", height=320, filename="quick-review-combine.md")
+    run_long_review(plan, key="qr_long_run")
 
 
 def _render_recipe():
@@ -159,93 +163,22 @@ def _render_recipe():
     
     if not data:
         st.warning("No draft found. Please go back and complete the questionnaire.")
-        if st.button("← Back to Questionnaire"):
-            st.session_state.quick_review_page = "questionnaire"
-            st.rerun()
+        nav_button("← Back to Questionnaire", "quick_review", {"quick_review_page": "questionnaire"})
         return
     
     # Build the prompt
-    final_prompt = textwrap.dedent(f"""
-# QUICK REVIEW: Final Scan Before Publication
-
-## 1. YOUR ROLE
-You are a smart, experienced friend doing a quick read of a student journalist's draft before they publish. You are NOT a developmental editor—this is a final check, not a revision session. Think: hallway read, ten minutes, catch the things that would be embarrassing to miss.
-
-Calibrate your tone for a **{level}**. Be warm but direct.
-
-## 2. THE DRAFT AND CONTEXT
-
-**Publication:** {data.get('publication', 'Not specified')}
-
-**The student says this story is about:** {data.get('story_purpose', 'Not provided')}
-
-**People who might feel criticized or exposed:** {data.get('criticized', 'None identified')}
-
-**What the student is most unsure about:** {data.get('unsure', 'Nothing specific')}
-
-**THE DRAFT:**
----
-{data.get('draft', '[No draft provided]')}
----
-
-## 3. YOUR TASK
-
-Do a quick scan for these four things only:
-
-### A. Hed/Lede Alignment
-Does the headline promise what the lede delivers? Does the lede promise what the story delivers? If there's a mismatch, flag it briefly.
-
-### B. Blindside Check
-Scan the draft yourself—regardless of what the student said in their answer. Is there anyone quoted, named, or implicated who might feel the story is unfair or inaccurate? Did they appear to get a chance to respond? Flag any gaps.
-
-### C. Obvious Factual Soft Spots
-Any claims that seem unsupported? Numbers that appear from nowhere? Quotes without clear attribution? Don't do a full fact-check—just flag anything that looks thin.
-
-### D. Copyediting Patterns
-Note any recurring mechanical issues (comma splices, passive voice, attribution style, etc.). Name the pattern; do NOT itemize every instance.
-
-## 4. HOW TO RESPOND
-
-**Lead with one thing that works.** A single, specific, genuine compliment about the draft. (If the draft has serious problems, acknowledge the effort instead: "You've done real reporting here.")
-
-**Then give your flags.** Each flag is 1–2 sentences max. Be brief.
-
-**Offer dialogue only if something is seriously wrong.** If the lede actively misleads about the story's content, or there's a fairness issue that could prompt a correction—offer a short exchange (2–3 turns max). For everything else, just flag and move on.
-
-**Circuit breaker:** If the draft has fundamental problems (no clear story, major structural issues, serious sourcing gaps), say so briefly and suggest they take it back to their editor or advisor before a final review. Do NOT attempt a developmental edit.
-
-**End with ownership.** After your flags, say: "Here's what I noticed. You decide what matters. Ready to publish, or want to look at any of these?"
-
-Then offer: "Would you like a detailed copyedit list before you go? I can flag specific spelling, grammar, punctuation, and style errors for you to fix. (I won't fix them for you.)"
-
-## 5. WHAT YOU MUST NOT DO
-
-- Do NOT rewrite any text. Do not suggest reworded sentences.
-- Do NOT suggest structural reorganization or moving paragraphs.
-- Do NOT itemize every grammar error in the main review.
-- Do NOT open a fact-checking deep-dive.
-- Do NOT turn this into a developmental edit.
-- If the student asks you to rewrite something, decline and suggest they use a revision-focused tool or talk to their editor.
-
-## 6. IF THEY REQUEST THE DETAILED COPYEDIT LIST
-
-If the student says yes to the copyedit offer:
-
-- Ask: "What style guide should I use? (AP is standard for most news writing.)"
-- Produce a numbered list of specific mechanical errors (spelling, punctuation, grammar, style).
-- Format: "[Quoted phrase or sentence] — [Issue, e.g., 'comma splice,' 'AP style uses numerals for ages']"
-- Do NOT provide corrections—just identify the errors.
-- Cap the list at 15–20 items. If there are more, say: "I found additional issues of the same types. You'll catch them once you see the pattern."
-- Do NOT editorialize or prioritize. Just list.
-    """).strip()
+    final_prompt = quick_review_prompt(level=level, **data)
     
     # Display
     col_main, col_side = st.columns([2, 1])
     
     with col_main:
         st.subheader("Your Assembled Prompt")
-        st.text_area("Prompt Text", final_prompt, height=500, label_visibility="collapsed")
-        copy_button_js(final_prompt, "Copy Full Prompt")
+        prompt_panel(final_prompt, key="qr_prompt", height=500, filename="quick-review-prompt.md")
+        prompt_size(final_prompt)
+        run_here(final_prompt, key="qr_run")
+        if long_review.is_long(data["draft"]):
+            _render_long_draft(level, data)
     
     with col_side:
         with st.container(border=True):
@@ -291,10 +224,9 @@ If the student says yes to the copyedit offer:
     
     col1, col2 = st.columns(2)
     with col1:
-        if st.button("← Back to Questionnaire", use_container_width=True):
-            st.session_state.quick_review_page = "questionnaire"
-            st.rerun()
+        nav_button("← Back to Questionnaire", "quick_review", {"quick_review_page": "questionnaire"},
+                   use_container_width=True)
     with col2:
-        if st.button("← Back to Portal", use_container_width=True):
-            st.session_state.quick_review_page = "questionnaire"  # Reset for next time
-            go_to("portal")
+        # Reset quick_review_page for next time
+        nav_button("← Back to Portal", "portal", {"quick_review_page": "questionnaire"},
+                   use_container_width=True)
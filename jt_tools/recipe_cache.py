@@ -0,0 +1,133 @@
+# jt_tools/recipe_cache.py
+# Process-wide, content-addressed cache for assembled prompts (no Streamlit)
+#
+# Keys are a hash of the normalized builder inputs (level, lens and every
+# form field), so a student who goes "Back to Questionnaire" and resubmits
+# the same answers gets the already-built string back — no rebuild, no new
+# multi-KB allocation. Entries are evicted LRU-first once the byte budget
+# is exceeded.
+
+import functools
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_ENTRY_OVERHEAD = 120  # key digest + OrderedDict node, roughly
+
+
+def _normalize(value):
+    """Canonical form of one builder input: trimmed text with LF newlines."""
+    if isinstance(value, str):
+        return value.replace("\r\n", "\n").strip()
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(v) for v in value)
+    return value
+
+
+def _feed(h, value):
+    if isinstance(value, tuple):
+        h.update(b"(")
+        for v in value:
+            _feed(h, v)
+        h.update(b")")
+    elif isinstance(value, str):
+        h.update(b"s%d:" % len(value))
+        h.update(value.encode("utf-8", "surrogatepass"))
+    else:
+        h.update(b"r:" + repr(value).encode())
+    h.update(b"\x00")
+
+
+def digest(kind: str, args: tuple, kwargs: dict) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(kind.encode())
+    h.update(b"\x00")
+    for a in args:
+        _feed(h, a)
+    for k in sorted(kwargs):
+        h.update(k.encode() + b"=")
+        _feed(h, kwargs[k])
+    return h.hexdigest()
+
+
+class RecipeCache:
+    """Thread-safe LRU of built prompts with a memory budget in bytes."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[str, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_build(self, key: str, build: Callable[[], str]) -> str:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        # Build outside the lock; two sessions racing on the same key both
+        # build, and the second put simply replaces the first.
+        value = build()
+        self._put(key, value)
+        return value
+
+    def _put(self, key: str, value: str):
+        size = sys.getsizeof(value) + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+RECIPES = RecipeCache(int(os.environ.get("JT_RECIPE_CACHE_BYTES", DEFAULT_MAX_BYTES)))
+
+
+def cached(kind: str):
+    """Decorator: serve a prompt builder from RECIPES, keyed by its normalized inputs.
+
+    The builder is called with the normalized inputs too, so a cache hit and a
+    fresh build always agree. The uncached builder stays on `__wrapped__`.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            args = tuple(_normalize(a) for a in args)
+            kwargs = {k: _normalize(v) for k, v in kwargs.items()}
+            key = digest(kind, args, kwargs)
+            return RECIPES.get_or_build(key, lambda: fn(*args, **kwargs))
+        return wrapper
+    return decorate
@@ -0,0 +1,119 @@
+# jt_tools/records.py
+# Typed form records for the pitch and Get Ready to Report forms (no Streamlit)
+#
+# One __slots__ class per form replaces the per-form dicts that all shared
+# st.session_state.form_data. Each record lives under its own session key,
+# has attribute access, packs to a positional JSON list (field names are
+# implied by the class), and reports its own memory footprint.
+
+import json
+import sys
+
+
+class FormRecord:
+    """Base for the per-form records. Subclasses set KIND, FIELDS and __slots__ = FIELDS."""
+
+    __slots__ = ()
+    KIND = ""
+    FIELDS: tuple[str, ...] = ()
+    SESSION_KEY = ""
+
+    def __init__(self, **values):
+        unknown = set(values) - set(self.FIELDS)
+        if unknown:
+            raise TypeError(f"{type(self).__name__} has no field(s) {', '.join(sorted(unknown))}")
+        for f in self.FIELDS:
+            setattr(self, f, values.get(f))
+
+    @classmethod
+    def from_state(cls, state, prefix: str | None = None):
+        """Build from widget keys named f"{prefix}{field}" (prefix defaults to f"{KIND}_")."""
+        prefix = f"{cls.KIND}_" if prefix is None else prefix
+        return cls(**{f: state.get(f"{prefix}{f}") for f in cls.FIELDS})
+
+    def to_dict(self) -> dict:
+        """Answered fields only, so builders fall back to their own defaults."""
+        return {f: v for f in self.FIELDS if (v := getattr(self, f)) is not None}
+
+    # ---------- Compact form ----------
+
+    def to_list(self) -> list:
+        return [getattr(self, f) for f in self.FIELDS]
+
+    @classmethod
+    def from_list(cls, values: list):
+        if len(values) != len(cls.FIELDS):
+            raise ValueError(f"{cls.__name__} expects {len(cls.FIELDS)} values, got {len(values)}")
+        return cls(**dict(zip(cls.FIELDS, values)))
+
+    def pack(self) -> bytes:
+        return json.dumps([self.KIND, *self.to_list()], separators=(",", ":"), ensure_ascii=False).encode()
+
+    @staticmethod
+    def unpack(blob: bytes) -> "FormRecord":
+        kind, *values = json.loads(blob)
+        return RECORDS[kind].from_list(values)
+
+    # ---------- Accounting ----------
+
+    def nbytes(self) -> int:
+        """Shallow size of the record plus its field values."""
+        return sys.getsizeof(self) + sum(sys.getsizeof(getattr(self, f)) for f in self.FIELDS)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and other.to_list() == self.to_list()
+
+    def __repr__(self):
+        answered = sum(1 for f in self.FIELDS if getattr(self, f))
+        return f"{type(self).__name__}({answered}/{len(self.FIELDS)} answered, {self.nbytes()} bytes)"
+
+
+class PitchForm(FormRecord):
+    KIND = "pitch"
+    SESSION_KEY = "pitch_form"
+    FIELDS = (
+        "pitch_text", "story_type_choice", "prior_coverage", "prior_coverage_effect",
+        "working_headline", "key_conflict", "target_audience", "sources",
+        "reporting_stage", "coaching_style",
+    )
+    __slots__ = FIELDS
+
+
+class EventForm(FormRecord):
+    KIND = "event"
+    SESSION_KEY = "event_form"
+    FIELDS = (
+        "q1_headline", "q2_where_when", "q3_key_people", "q4_why_now",
+        "q5_how_big", "q6_important", "q7_audience", "q8_work_done",
+        "q9_prior_coverage", "q10_prior_coverage_effect", "q11_work_left",
+        "q12_anxious_excited", "coaching_style",
+    )
+    __slots__ = FIELDS
+
+
+class ExploreForm(FormRecord):
+    KIND = "explore"
+    SESSION_KEY = "explore_form"
+    FIELDS = (
+        "q1_territory", "q2_hunch", "q3_curiosity", "q4_audience", "q5_know",
+        "q6_dont_know", "q7_prior_coverage", "q8_relationship_bias",
+        "q9_plan_ideas", "q10_first_step", "coaching_style",
+    )
+    __slots__ = FIELDS
+
+
+class ConfirmForm(FormRecord):
+    KIND = "confirm"
+    SESSION_KEY = "confirm_form"
+    FIELDS = ("q1_claim", "q2_source", "q3_stakes", "q4_evidence", "q5_risks", "coaching_style")
+    __slots__ = FIELDS
+
+
+RECORDS: dict[str, type[FormRecord]] = {r.KIND: r for r in (PitchForm, EventForm, ExploreForm, ConfirmForm)}
+GRR_RECORDS = {k: RECORDS[k] for k in ("event", "explore", "confirm")}
+SESSION_KEYS = tuple(r.SESSION_KEY for r in RECORDS.values())
+
+
+def session_nbytes(state) -> int:
+    """Bytes held by all form records in one session's state."""
+    return sum(rec.nbytes() for key in SESSION_KEYS if (rec := state.get(key)) is not None)
@@ -0,0 +1,262 @@
+# jt_tools/router.py
+# JT page router — page registry + single-run navigation
+#
+# Pages register a render callable under a name. Navigation happens in
+# button/form on_click callbacks (go_to), which Streamlit runs *before* the
+# script, so the target page renders in the same script run instead of the
+# old "set page + st.rerun()" double run. Sections that should rerun on
+# their own register with @fragment; those reruns skip run() entirely.
+
+import functools
+import importlib
+import logging
+import threading
+from collections import Counter
+from typing import Callable
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from jt_tools import memory, payload, profiling, session_store, telemetry
+from jt_tools.validation import LEVELS
+
+log = logging.getLogger("jt.router")
+
+# Page name -> render callable
+_PAGES: dict[str, Callable[[], None]] = {}
+
+# Tool name -> "module:function"; imported on first visit, not at startup
+_TOOLS: dict[str, str] = {}
+_TOOL_CACHE: dict[str, Callable[[], None]] = {}
+_TOOL_ERRORS: dict[str, Exception] = {}
+_TOOL_LOCK = threading.Lock()
+
+# Process-wide: "script runs per navigation" -> number of navigations
+_NAV_RUNS: Counter = Counter()
+_NAV_LOCK = threading.Lock()
+
+# Process-wide: form name -> completions and the runs they took
+_FORMS: dict[str, dict] = {}
+
+
+# ---------- Registry ----------
+
+def page(name: str):
+    """Decorator: register a render callable under a page name."""
+    def register(fn: Callable[[], None]):
+        _PAGES[name] = fn
+        return fn
+    return register
+
+
+def pages() -> list[str]:
+    return list(_PAGES)
+
+
+# ---------- Lazy tools (plugins) ----------
+
+def tool(name: str, target: str):
+    """Register a tool's render entry point as "package.module:function".
+
+    Nothing is imported here; load_tool() imports the module the first time
+    a page asks for it, so cold starts only pay for the portal.
+    """
+    _TOOLS[name] = target
+
+
+def load_tool(name: str) -> Callable[[], None] | None:
+    """Import (once per process) and return a tool's render function.
+
+    Returns None if the import failed; the exception is kept in tool_errors()
+    and is not retried on every rerun.
+    """
+    fn = _TOOL_CACHE.get(name)
+    if fn is not None or name in _TOOL_ERRORS:
+        return fn
+    with _TOOL_LOCK:
+        if name in _TOOL_CACHE or name in _TOOL_ERRORS:
+            return _TOOL_CACHE.get(name)
+        module_name, _, attr = _TOOLS[name].partition(":")
+        try:
+            with telemetry.span("import", name):
+                fn = getattr(importlib.import_module(module_name), attr)
+        except Exception as e:
+            _TOOL_ERRORS[name] = e
+            log.exception("tool %s (%s) failed to load", name, _TOOLS[name])
+            return None
+        fn = _TOOL_CACHE[name] = telemetry.timed(name, kind="tool")(fn)
+        return fn
+
+
+def tool_errors() -> dict[str, Exception]:
+    """Import failures recorded so far, by tool name."""
+    return dict(_TOOL_ERRORS)
+
+
+# ---------- Fragments ----------
+
+def fragment(name: str):
+    """Decorator: st.fragment whose isolated reruns are timed and measured as "<page>.<name>".
+
+    When the whole page renders, the fragment body runs inside the page's
+    own span and payload measurement; only its fragment-only reruns (a
+    widget inside it changed) are accounted separately.
+    """
+    def decorate(fn: Callable[..., None]):
+        @functools.wraps(fn)
+        def body(*args, **kwargs):
+            ctx = get_script_run_ctx()
+            if ctx is None or not ctx.fragment_ids_this_run:
+                return fn(*args, **kwargs)
+            key = f"{st.session_state.get('page')}.{name}"
+            dwell = st.session_state.get("_jt_dwell")
+            if dwell is not None:
+                dwell["fragment_runs"] += 1
+            memory.rehydrate()
+            try:
+                with telemetry.context(key, "fragment"), telemetry.span("fragment", key), payload.measure(key):
+                    fn(*args, **kwargs)
+            finally:
+                memory.track()
+        return st.fragment(body)
+    return decorate
+
+
+def _sync_level(key: str):
+    st.session_state.journalism_level = st.session_state[key]
+
+
+@fragment("level")
+def level_radio(label: str, key: str, levels=LEVELS):
+    """Experience-level radio that reruns only itself and keeps journalism_level in step."""
+    current = st.session_state.get("journalism_level", levels[0])
+    st.radio(label, levels, index=levels.index(current) if current in levels else 0,
+             horizontal=True, key=key, on_change=_sync_level, args=(key,))
+
+
+# ---------- Navigation ----------
+
+def go_to(page: str, **state):
+    """Navigate to `page`, optionally setting extra session keys first.
+
+    Meant to be used as an on_click callback, e.g.
+    st.button("Back", on_click=go_to, args=("portal",)).
+    """
+    for k, v in state.items():
+        st.session_state[k] = v
+    st.session_state._jt_nav = {"from": st.session_state.get("page"), "to": page, "runs": 0}
+    st.session_state.page = page
+
+
+def nav_button(label: str, page: str, state: dict | None = None, **kwargs) -> bool:
+    """st.button that navigates to `page` via callback (one script run)."""
+    return st.button(label, on_click=go_to, args=(page,), kwargs=state or {}, **kwargs)
+
+
+def _record_nav(nav: dict):
+    with _NAV_LOCK:
+        _NAV_RUNS[nav["runs"]] += 1
+    log.info("nav %s -> %s took %d script run(s)", nav["from"], nav["to"], nav["runs"])
+
+
+def nav_stats() -> dict:
+    """Aggregate script runs per navigation across all sessions in this process."""
+    with _NAV_LOCK:
+        hist = dict(sorted(_NAV_RUNS.items()))
+    n = sum(hist.values())
+    runs = sum(k * v for k, v in hist.items())
+    return {
+        "navigations": n,
+        "runs": runs,
+        "mean_runs": (runs / n) if n else 0.0,
+        "histogram": hist,
+    }
+
+
+# ---------- Forms ----------
+
+def form_completed(form: str):
+    """Record that `form` was submitted successfully, with the runs it took.
+
+    Counts the full script runs on the form's page since the user arrived
+    (or since the last completion), including the submitting run, and the
+    fragment-only reruns in between. Call from the submit callback or from
+    the run that handles the submit.
+    """
+    dwell = st.session_state.get("_jt_dwell") or {"runs": 0, "fragment_runs": 0}
+    with _NAV_LOCK:
+        s = _FORMS.setdefault(form, {"completed": 0, "runs": 0, "fragment_runs": 0})
+        s["completed"] += 1
+        s["runs"] += dwell["runs"] + 1
+        s["fragment_runs"] += dwell["fragment_runs"]
+    # run() counts the current run when it ends; -1 brings this one back to 0.
+    st.session_state._jt_dwell = {"page": st.session_state.get("page"), "runs": -1, "fragment_runs": 0}
+
+
+def form_stats() -> dict[str, dict]:
+    """Per form: completions and mean full / fragment-only runs per completion."""
+    with _NAV_LOCK:
+        forms = {k: dict(v) for k, v in _FORMS.items()}
+    return {
+        form: {**s, "mean_runs": s["runs"] / s["completed"], "mean_fragment_runs": s["fragment_runs"] / s["completed"]}
+        for form, s in forms.items()
+    }
+
+
+def _count_dwell(page: str):
+    dwell = st.session_state.get("_jt_dwell")
+    if dwell is None or dwell["page"] != page:
+        st.session_state._jt_dwell = {"page": page, "runs": 1, "fragment_runs": 0}
+    else:
+        dwell["runs"] += 1
+
+
+# ---------- Run ----------
+
+def _rerun_cause(nav: dict | None) -> str:
+    """Why this script run happened, for telemetry tags.
+
+    load: first run of the browser session; nav: a go_to() callback;
+    rerun: a follow-up run of the same navigation (st.rerun);
+    interaction: any other widget change.
+    """
+    if "_jt_seen" not in st.session_state:
+        st.session_state._jt_seen = True
+        return "load"
+    if nav is not None:
+        return "nav" if nav["runs"] == 1 else "rerun"
+    return "interaction"
+
+
+def run(default: str = "portal"):
+    """Render the current page. Call once per script run, after page registration."""
+    session_store.restore()
+    memory.rehydrate()
+    if "page" not in st.session_state or st.session_state.page not in _PAGES:
+        st.session_state.page = default
+
+    nav = st.session_state.get("_jt_nav")
+    if nav is not None:
+        nav["runs"] += 1
+
+    page = st.session_state.page
+    completed = False
+    try:
+        with (
+            telemetry.context(page, _rerun_cause(nav)),
+            telemetry.span("page", page),
+            payload.measure(page),
+            profiling.capture(page),
+        ):
+            _PAGES[page]()
+        completed = True
+    finally:
+        # A page that still calls st.rerun() leaves the nav open, so the
+        # follow-up run is counted against the same navigation.
+        if nav is not None and completed:
+            _record_nav(nav)
+            del st.session_state["_jt_nav"]
+        if completed:
+            _count_dwell(page)
+            session_store.persist()
+        memory.track()
@@ -0,0 +1,312 @@
+# jt_tools/session_store.py
+# Pluggable persistence for the navigation/form keys of st.session_state
+#
+# A browser session is identified by a random token in the "s" query param,
+# so it survives a reload, a worker restart, or the load balancer sending the
+# next request to a different worker. At the end of each script run the
+# persisted keys are snapshotted; unchanged snapshots are skipped and changed
+# ones go into a write-behind buffer that a background thread flushes in
+# batches (latest snapshot per session wins). A fresh Streamlit session with
+# a known token restores the keys before the first page renders.
+#
+# The token is a credential: whoever has the URL gets the saved state. It is
+# therefore used once. restore() moves the state to a fresh token and deletes
+# the old entry, so a copied link or a duplicated tab opened later finds
+# nothing, and two tabs never write to the same entry. The Quick Review draft
+# (qr_form_data) is never persisted; a reload asks for it again.
+#
+# Backends (JT_SESSION_STORE):
+#   ""                      disabled (default): state stays in-process only
+#   "memory"                process-local dict with TTL; a stand-in for Redis
+#   "sqlite:///path/to.db"  one file shared by every worker on the host (WAL)
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import secrets
+import sqlite3
+import threading
+import time
+import zlib
+
+import streamlit as st
+
+from jt_tools import records
+
+log = logging.getLogger("jt.session_store")
+
+PERSISTED_KEYS = ("page", *records.SESSION_KEYS, "reporting_path", "journalism_level")
+QUERY_PARAM = "s"
+DEFAULT_TTL_S = 7 * 24 * 3600
+FLUSH_INTERVAL_S = float(os.environ.get("JT_SESSION_FLUSH_S", "1.0"))
+MAX_BATCH = 256
+
+_SID = re.compile(r"^[A-Za-z0-9_-]{16,64}$")
+_COMPRESS_OVER = 512  # bytes; short snapshots compress worse than they start
+
+
+# ---------- Serialization ----------
+
+def _encode(value):
+    if isinstance(value, records.FormRecord):
+        return {"__rec__": value.KIND, "v": value.to_list()}
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _decode(obj: dict):
+    if "__rec__" in obj:
+        return records.RECORDS[obj["__rec__"]].from_list(obj["v"])
+    return obj
+
+
+def dumps(state: dict) -> bytes:
+    """Compact JSON (form records as positional lists); zlib'd (b"z" prefix) once it is worth it."""
+    raw = json.dumps(state, separators=(",", ":"), ensure_ascii=False, sort_keys=True, default=_encode).encode()
+    if len(raw) > _COMPRESS_OVER:
+        packed = zlib.compress(raw, 6)
+        if len(packed) < len(raw):
+            return b"z" + packed
+    return b"j" + raw
+
+
+def loads(blob: bytes) -> dict:
+    tag, body = blob[:1], blob[1:]
+    if tag == b"z":
+        body = zlib.decompress(body)
+    elif tag != b"j":
+        raise ValueError(f"unknown session blob tag {tag!r}")
+    return json.loads(body, object_hook=_decode)
+
+
+# ---------- Backends ----------
+
+class MemoryStore:
+    """In-process store with expiry. Same get/put-many contract a Redis backend would have."""
+
+    def __init__(self, ttl_s: float = DEFAULT_TTL_S):
+        self.ttl_s = ttl_s
+        self._data: dict[str, tuple[bytes, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, sid: str) -> bytes | None:
+        with self._lock:
+            entry = self._data.get(sid)
+            if entry is None:
+                return None
+            if entry[1] < time.time():
+                del self._data[sid]
+                return None
+            return entry[0]
+
+    def put_many(self, items: dict[str, bytes]):
+        expires = time.time() + self.ttl_s
+        with self._lock:
+            for sid, blob in items.items():
+                self._data[sid] = (blob, expires)
+
+    def delete(self, sid: str):
+        with self._lock:
+            self._data.pop(sid, None)
+
+    def close(self):
+        pass
+
+
+class SQLiteStore:
+    """One table in a WAL-mode SQLite file; safe to share between worker processes."""
+
+    def __init__(self, path: str, ttl_s: float = DEFAULT_TTL_S):
+        self.path = path
+        self.ttl_s = ttl_s
+        self._local = threading.local()
+        with self._conn() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS jt_sessions ("
+                " sid TEXT PRIMARY KEY, data BLOB NOT NULL, expires REAL NOT NULL)"
+            )
+            db.execute("DELETE FROM jt_sessions WHERE expires < ?", (time.time(),))
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 connections are per thread: script threads read, the flusher writes.
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=5.0)
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def get(self, sid: str) -> bytes | None:
+        row = self._conn().execute(
+            "SELECT data FROM jt_sessions WHERE sid = ? AND expires >= ?", (sid, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def put_many(self, items: dict[str, bytes]):
+        expires = time.time() + self.ttl_s
+        with self._conn() as db:  # one transaction per batch
+            db.executemany(
+                "INSERT INTO jt_sessions (sid, data, expires) VALUES (?, ?, ?)"
+                " ON CONFLICT(sid) DO UPDATE SET data = excluded.data, expires = excluded.expires",
+                [(sid, blob, expires) for sid, blob in items.items()],
+            )
+
+    def delete(self, sid: str):
+        with self._conn() as db:
+            db.execute("DELETE FROM jt_sessions WHERE sid = ?", (sid,))
+
+    def close(self):
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
+
+
+def from_url(url: str):
+    """Backend for a JT_SESSION_STORE value, or None when persistence is off."""
+    if not url:
+        return None
+    if url == "memory":
+        return MemoryStore()
+    if url.startswith("sqlite:///"):
+        return SQLiteStore(url[len("sqlite:///"):])
+    raise ValueError(f"unsupported JT_SESSION_STORE {url!r} (use 'memory' or 'sqlite:///path')")
+
+
+# ---------- Write-behind buffer ----------
+
+class WriteBehind:
+    """Collects snapshots per session and flushes them to the backend in batches."""
+
+    def __init__(self, backend, interval_s: float = FLUSH_INTERVAL_S):
+        self.backend = backend
+        self.interval_s = interval_s
+        self._pending: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.writes = 0
+        self.batches = 0
+        self.coalesced = 0
+
+    def put(self, sid: str, blob: bytes):
+        with self._lock:
+            if sid in self._pending:
+                self.coalesced += 1
+            self._pending[sid] = blob
+            full = len(self._pending) >= MAX_BATCH
+        if self._thread is None:
+            self._start()
+        if full:
+            self._wake.set()
+
+    def get(self, sid: str) -> bytes | None:
+        with self._lock:
+            blob = self._pending.get(sid)
+        return blob if blob is not None else self.backend.get(sid)
+
+    def delete(self, sid: str):
+        with self._lock:
+            self._pending.pop(sid, None)
+        self.backend.delete(sid)
+
+    def flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        try:
+            self.backend.put_many(batch)
+        except Exception:
+            log.exception("session store flush of %d session(s) failed", len(batch))
+            with self._lock:  # keep newer snapshots that arrived meanwhile
+                self._pending = {**batch, **self._pending}
+            return
+        self.writes += len(batch)
+        self.batches += 1
+
+    def _start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._loop, name="jt-session-flush", daemon=True)
+            self._thread.start()
+        atexit.register(self.flush)
+
+    def _loop(self):
+        while True:
+            self._wake.wait(self.interval_s)
+            self._wake.clear()
+            self.flush()
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending = len(self._pending)
+        return {"pending": pending, "writes": self.writes, "batches": self.batches, "coalesced": self.coalesced}
+
+
+_BACKEND = from_url(os.environ.get("JT_SESSION_STORE", ""))
+STORE = WriteBehind(_BACKEND) if _BACKEND is not None else None
+
+
+# ---------- Streamlit glue ----------
+
+def _browser_id() -> str:
+    sid = st.query_params.get(QUERY_PARAM)
+    if not sid or not _SID.match(sid):
+        sid = secrets.token_urlsafe(16)
+        st.query_params[QUERY_PARAM] = sid
+    return sid
+
+
+def restore():
+    """Once per Streamlit session: load persisted keys for this browser, if any."""
+    if STORE is None or "_jt_sid" in st.session_state:
+        return
+    sid = st.session_state._jt_sid = _browser_id()
+    blob = STORE.get(sid)
+    if blob is None:
+        return
+    # Spend the token: this session saves under a fresh one from its first persist().
+    st.session_state._jt_sid = st.query_params[QUERY_PARAM] = secrets.token_urlsafe(16)
+    try:
+        STORE.delete(sid)
+    except Exception:
+        log.exception("cannot delete spent session %s", sid)
+    try:
+        state = loads(blob)
+    except Exception:
+        log.exception("dropping unreadable session %s", sid)
+        return
+    # First run of this Streamlit session: anything already set is a default
+    # from app.py's STATE block, so the persisted value wins.
+    for k in PERSISTED_KEYS:
+        if k in state:
+            st.session_state[k] = state[k]
+
+
+def persist():
+    """End of a script run: queue a snapshot of the persisted keys if it changed."""
+    if STORE is None:
+        return
+    sid = st.session_state.get("_jt_sid")
+    if sid is None:
+        return
+    state = {k: st.session_state[k] for k in PERSISTED_KEYS if k in st.session_state}
+    try:
+        blob = dumps(state)
+    except (TypeError, ValueError):
+        log.exception("session %s has non-JSON state; not persisted", sid)
+        return
+    tag = hashlib.blake2b(blob, digest_size=8).digest()
+    if st.session_state.get("_jt_saved") == tag:
+        return
+    STORE.put(sid, blob)
+    st.session_state._jt_saved = tag
+
+
+def store_stats() -> dict | None:
+    return STORE.stats() if STORE is not None else None
@@ -0,0 +1,232 @@
+# jt_tools/telemetry.py
+# Render-time instrumentation: timed spans, sampled JSONL events, Prometheus text (no Streamlit)
+#
+# Pages (router.run), tool entry points (router.load_tool) and the prompt
+# builders (templates) are wrapped in spans. Every span updates an in-process
+# histogram keyed by (kind, name, page, cause); the page and rerun cause come
+# from context set by the router, so a builder span knows which page called
+# it. A sample of spans (JT_TELEMETRY_SAMPLE, plus every span slower than
+# JT_TELEMETRY_SLOW_MS) is written as one JSON line to a size-rotated file,
+# if JT_TELEMETRY_FILE names one (off by default; created readable by its
+# owner only).
+# prometheus_text() renders the histograms in the text exposition format, and
+# if JT_METRICS_FILE is set they are also written there periodically (for a
+# node_exporter textfile collector or a sidecar scraper).
+
+import contextlib
+import contextvars
+import functools
+import json
+import logging
+import logging.handlers
+import os
+import random
+import threading
+import time
+from bisect import bisect_left
+
+log = logging.getLogger("jt.telemetry")
+
+SAMPLE_RATE = float(os.environ.get("JT_TELEMETRY_SAMPLE", "0.1"))
+SLOW_MS = float(os.environ.get("JT_TELEMETRY_SLOW_MS", "500"))
+EVENTS_FILE = os.environ.get("JT_TELEMETRY_FILE", "")
+EVENTS_MAX_BYTES = int(os.environ.get("JT_TELEMETRY_MAX_BYTES", 10 * 1024 * 1024))
+EVENTS_BACKUPS = 5
+METRICS_FILE = os.environ.get("JT_METRICS_FILE", "")
+METRICS_INTERVAL_S = float(os.environ.get("JT_METRICS_INTERVAL_S", "15"))
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_page = contextvars.ContextVar("jt_page", default="")
+_cause = contextvars.ContextVar("jt_cause", default="")
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+
+_HISTOGRAMS: dict[tuple[str, str, str, str], _Histogram] = {}
+_LOCK = threading.Lock()
+_events: logging.Logger | None = None
+_writer: threading.Thread | None = None
+
+
+# ---------- Recording ----------
+
+class _PrivateRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Creates the events file (and each one after a rollover) with mode 0600."""
+
+    def _open(self):
+        fd = os.open(self.baseFilename, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        return open(fd, self.mode, encoding=self.encoding, errors=self.errors)
+
+
+def _event_log() -> logging.Logger | None:
+    """Dedicated logger writing bare JSON lines to the rotating events file."""
+    global _events
+    if _events is None and EVENTS_FILE:
+        with _LOCK:
+            if _events is None:
+                logger = logging.getLogger("jt.telemetry.events")
+                logger.propagate = False
+                logger.setLevel(logging.INFO)
+                try:
+                    handler = _PrivateRotatingFileHandler(
+                        EVENTS_FILE, maxBytes=EVENTS_MAX_BYTES, backupCount=EVENTS_BACKUPS, encoding="utf-8",
+                    )
+                except OSError:
+                    log.exception("cannot open telemetry file %s; events disabled", EVENTS_FILE)
+                    logger.disabled = True
+                else:
+                    handler.setFormatter(logging.Formatter("%(message)s"))
+                    logger.addHandler(handler)
+                _events = logger
+    return _events
+
+
+def record(kind: str, name: str, seconds: float, **tags):
+    """Add one timing to the aggregates; write it out if sampled or slow."""
+    page, cause = tags.pop("page", None) or _page.get(), tags.pop("cause", None) or _cause.get()
+    key = (kind, name, page, cause)
+    with _LOCK:
+        hist = _HISTOGRAMS.get(key)
+        if hist is None:
+            hist = _HISTOGRAMS[key] = _Histogram()
+        hist.observe(seconds)
+    if METRICS_FILE and _writer is None:
+        _start_writer()
+
+    slow = seconds * 1e3 >= SLOW_MS
+    if slow or (SAMPLE_RATE and random.random() < SAMPLE_RATE):
+        events = _event_log()
+        if events is not None:
+            events.info(json.dumps({
+                "ts": round(time.time(), 3), "kind": kind, "name": name, "page": page, "cause": cause,
+                "ms": round(seconds * 1e3, 3), "slow": slow, **tags,
+            }, separators=(",", ":")))
+
+
+@contextlib.contextmanager
+def span(kind: str, name: str, **tags):
+    """Time the block; errors are tagged and re-raised."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        tags["error"] = type(e).__name__
+        raise
+    finally:
+        record(kind, name, time.perf_counter() - t0, **tags)
+
+
+def timed(name: str, kind: str = "builder"):
+    """Decorator: run the function inside span(kind, name)."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(kind, name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+@contextlib.contextmanager
+def context(page: str, cause: str):
+    """Tag every span in the block with the page being rendered and why it reran."""
+    page_token, cause_token = _page.set(page), _cause.set(cause)
+    try:
+        yield
+    finally:
+        _page.reset(page_token)
+        _cause.reset(cause_token)
+
+
+# ---------- Export ----------
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(kind, name, page, cause, le=None) -> str:
+    pairs = [("kind", kind), ("name", name), ("page", page), ("cause", cause)]
+    if le is not None:
+        pairs.append(("le", le))
+    return ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+
+
+def prometheus_text() -> str:
+    """Aggregates in the Prometheus text exposition format (version 0.0.4)."""
+    with _LOCK:
+        snapshot = [(key, list(h.counts), h.sum, h.count) for key, h in sorted(_HISTOGRAMS.items())]
+    lines = [
+        "# HELP jt_render_seconds Time spent rendering JT pages and tools and building prompts.",
+        "# TYPE jt_render_seconds histogram",
+    ]
+    for key, counts, total, count in snapshot:
+        running = 0
+        for bound, n in zip((*BUCKETS, "+Inf"), counts):
+            running += n
+            lines.append(f"jt_render_seconds_bucket{{{_labels(*key, le=bound)}}} {running}")
+        lines.append(f"jt_render_seconds_sum{{{_labels(*key)}}} {total:.6f}")
+        lines.append(f"jt_render_seconds_count{{{_labels(*key)}}} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: str = METRICS_FILE):
+    """Atomically replace `path` with the current aggregates."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(prometheus_text())
+    os.replace(tmp, path)
+
+
+def _start_writer():
+    global _writer
+    with _LOCK:
+        if _writer is not None:
+            return
+        _writer = threading.Thread(target=_write_loop, name="jt-metrics-writer", daemon=True)
+        _writer.start()
+
+
+def _write_loop():
+    while True:
+        time.sleep(METRICS_INTERVAL_S)
+        try:
+            write_prometheus()
+        except OSError:
+            log.exception("cannot write metrics file %s", METRICS_FILE)
+
+
+def summary() -> list[dict]:
+    """Per (kind, name, page, cause): count, mean and approximate p50/p99 in ms."""
+    with _LOCK:
+        snapshot = [(key, list(h.counts), h.sum, h.count) for key, h in _HISTOGRAMS.items()]
+
+    def quantile(counts, count, q):
+        target, running = q * count, 0
+        for bound, n in zip((*BUCKETS, float("inf")), counts):
+            running += n
+            if running >= target:
+                return bound
+        return float("inf")
+
+    rows = []
+    for (kind, name, page, cause), counts, total, count in snapshot:
+        rows.append({
+            "kind": kind, "name": name, "page": page, "cause": cause, "count": count,
+            "mean_ms": total / count * 1e3,
+            "p50_le_ms": quantile(counts, count, 0.50) * 1e3,
+            "p99_le_ms": quantile(counts, count, 0.99) * 1e3,
+        })
+    return sorted(rows, key=lambda r: r["mean_ms"] * r["count"], reverse=True)
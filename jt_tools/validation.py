@@ -0,0 +1,109 @@
+# jt_tools/validation.py
+# Input rules shared by the Streamlit pages and the headless API (no Streamlit)
+#
+# Each validate_*() returns the list of user-facing error messages (empty
+# when the input is acceptable), worded exactly as the pages show them.
+# prep_recipe() is the one place that maps interview-prep form answers onto
+# make_recipe(), so the UI and the API produce byte-identical prompts.
+
+import os
+
+from jt_tools.templates import GRR_TEMPLATES, make_recipe
+
+LEVELS = ("High School journalist", "Undergraduate journalist", "Grad school journalist", "Working journalist")
+PREP_LENSES = ("Standard News Editor", "Skeptical Editor", "Audience Advocate")
+
+MAX_DRAFT_CHARS = int(os.environ.get("JT_MAX_DRAFT_CHARS", 150_000))        # ~20k words of copy
+MAX_TRANSCRIPT_CHARS = int(os.environ.get("JT_MAX_TRANSCRIPT_CHARS", 60_000))
+
+
+def _blank(value) -> bool:
+    return not (value and str(value).strip())
+
+
+def validate_level(level) -> list[str]:
+    return [] if level in LEVELS else [f"Unknown level {level!r}; expected one of: {', '.join(LEVELS)}."]
+
+
+# ---------- Prepare for an Interview ----------
+
+def validate_prep(*, subject, aim, why, musts, pushbacks, constraints, ethics, level=LEVELS[0],
+                  lens=PREP_LENSES[0]) -> list[str]:
+    errors = validate_level(level)
+    if lens not in PREP_LENSES:
+        errors.append(f"Unknown lens {lens!r}; expected one of: {', '.join(PREP_LENSES)}.")
+    if _blank(subject):
+        errors.append("Please add the interview subject (name + role).")
+    if _blank(aim):
+        errors.append("Please add a one-sentence story aim.")
+    if _blank(why):
+        errors.append("Please explain why this person matters to the story.")
+    if not any((m or "").strip() for m in musts or ()):
+        errors.append("Provide at least one ‘must-learn’.")
+    if _blank(pushbacks):
+        errors.append("Add at least one expected pushback/resistance pattern.")
+    if _blank(constraints):
+        errors.append("Add time/format constraints (and recording plan).")
+    if _blank(ethics):
+        errors.append("Add an ethics note (OK to write ‘None’ if truly N/A).")
+    return errors
+
+
+def prep_recipe(*, level, lens, subject, aim, why, musts, pushbacks, constraints, ethics, team_up=None) -> str:
+    """Build the coaching recipe from validated interview-prep answers."""
+    return make_recipe(
+        level=level,
+        lens=lens if lens != "Standard News Editor" else "News Editor",
+        aim=aim,
+        why_person=f"{why} (Interview subject: {subject})",
+        musts=list(musts),
+        pushbacks=pushbacks,
+        constraints=constraints,
+        recording=constraints,
+        team_up=team_up,
+        ethics=ethics,
+    )
+
+
+# ---------- Quick Review ----------
+
+def validate_quick_review(*, draft, story_purpose) -> list[str]:
+    if _blank(draft):
+        return ["Please paste your draft before continuing."]
+    if len(draft) > MAX_DRAFT_CHARS:
+        return [f"Your draft is {len(draft):,} characters; the limit is {MAX_DRAFT_CHARS:,}. "
+                "Paste the section you most want reviewed."]
+    if _blank(story_purpose):
+        return ["Please describe what your story is about (Question 3)."]
+    return []
+
+
+def quick_review_fields(*, draft, story_purpose, publication=None, criticized=None, unsure=None) -> dict:
+    """Normalise validated answers into quick_review_prompt() keyword arguments."""
+    return dict(
+        draft=draft.strip(),
+        publication=publication.strip() if publication and publication.strip() else "Not specified",
+        story_purpose=story_purpose.strip(),
+        criticized=criticized.strip() if criticized and criticized.strip() else "None identified",
+        unsure=unsure.strip() if unsure and unsure.strip() else "Nothing specific",
+    )
+
+
+# ---------- Story Pitch / GRR / Workshop ----------
+
+def validate_pitch(*, pitch_text) -> list[str]:
+    return ["Please paste your story pitch before submitting."] if _blank(pitch_text) else []
+
+
+def validate_grr(path) -> list[str]:
+    if path not in GRR_TEMPLATES:
+        return [f"Unknown reporting path {path!r}; expected one of: {', '.join(GRR_TEMPLATES)}."]
+    return []
+
+
+def validate_transcript(transcript) -> list[str]:
+    if _blank(transcript):
+        return ["Please paste transcript highlights first."]
+    if len(transcript) > MAX_TRANSCRIPT_CHARS:
+        return [f"The transcript is {len(transcript):,} characters; the limit is {MAX_TRANSCRIPT_CHARS:,}."]
+    return []
@@ -0,0 +1,10 @@
+# tests/conftest.py
+# The repo is not an installed package: put its root (jt_tools) and the
+# benchmarks directory (legacy reference implementations) on sys.path.
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
@@ -0,0 +1,194 @@
+# tests/test_api.py
+# The headless prompt API: routes, validation, batch, ASGI and the stdlib server
+
+import asyncio
+import json
+
+import pytest
+
+from jt_tools import api
+from jt_tools.templates import quick_review_prompt
+from jt_tools.validation import quick_review_fields
+
+PREP = {
+    "subject": "Dana Ruiz, city budget director",
+    "aim": "Why the library budget was cut",
+    "why": "She wrote the budget",
+    "musts": ["Who asked for the cut"],
+    "pushbacks": "Refers questions to the mayor",
+    "constraints": "TIME: 10-minute phone call, recording OK",
+    "ethics": "None",
+}
+DRAFT = "The council voted 5-2 on Tuesday to close the Elm Street library branch. " * 5
+
+VALID = {
+    "prep": PREP,
+    "quick_review": {"draft": DRAFT, "story_purpose": "Tell readers what closes and when"},
+    "pitch": {"pitch_text": "A story about the library closing.", "coaching_style": "Direct"},
+    "reviewer": {"transcript": "Q: What do you know?\nA: Not much yet.\n" * 10},
+    "grr/event": {"q1_headline": "Library vote"},
+    "grr/explore": {"q1_territory": "Library funding"},
+    "grr/confirm": {"q1_claim": "The branch loses money"},
+}
+
+
+def _call(method: str, path: str, body=None, raw: bytes | None = None) -> tuple[int, dict]:
+    status, ctype, out = api.handle(method, path, raw if raw is not None else json.dumps(body).encode())
+    assert ctype == "application/json"
+    return status, json.loads(out)
+
+
+# ---------- Routes ----------
+
+def test_every_tool_has_a_route():
+    assert set(VALID) == set(api.TOOLS)
+
+
+@pytest.mark.parametrize("tool", sorted(VALID))
+def test_valid_request_returns_a_prompt(tool):
+    status, payload = _call("POST", f"/v1/{tool}", VALID[tool])
+    assert status == 200, payload
+    assert isinstance(payload["prompt"], str) and len(payload["prompt"]) > 200
+
+
+def test_api_prompt_matches_the_page_builder():
+    status, payload = _call("POST", "/v1/quick_review/?utm=lms", {**VALID["quick_review"], "level": "Working journalist"})
+    assert status == 200
+    fields = quick_review_fields(draft=DRAFT, story_purpose=VALID["quick_review"]["story_purpose"])
+    assert payload["prompt"] == quick_review_prompt(level="Working journalist", **fields)
+
+
+def test_health_and_metrics():
+    assert _call("GET", "/healthz", raw=b"") == (200, {"ok": True})
+    status, ctype, _ = api.handle("GET", "/metrics", b"")
+    assert status == 200 and ctype.startswith("text/plain")
+
+
+@pytest.mark.parametrize("method, path, status", [
+    ("GET", "/nowhere", 404),
+    ("POST", "/v1/nope", 404),
+    ("POST", "/v1/grr/nope", 404),
+    ("GET", "/v1/pitch", 405),
+])
+def test_bad_routes(method, path, status):
+    assert _call(method, path, {})[0] == status
+
+
+# ---------- Validation ----------
+
+@pytest.mark.parametrize("tool", ["prep", "quick_review", "pitch", "reviewer"])  # GRR has no required fields
+def test_empty_body_is_a_422_worded_like_the_pages(tool):
+    status, payload = _call("POST", f"/v1/{tool}", {})
+    assert status == 422
+    assert payload["errors"] and all(isinstance(e, str) and e.endswith(".") for e in payload["errors"])
+
+
+@pytest.mark.parametrize("body, error", [
+    ({**PREP, "colour": "red"}, "Unknown field 'colour'."),
+    ({**PREP, "aim": 3}, "Field 'aim' must be a string."),
+    ({**PREP, "musts": ["a", "b", "c", "d"]}, "Field 'musts' must be a list of up to 3 strings."),
+    ({**PREP, "musts": "a"}, "Field 'musts' must be a list of up to 3 strings."),
+    ({**PREP, "level": "Professor"}, "Unknown level 'Professor'"),
+    ({**PREP, "lens": "Friendly"}, "Unknown lens 'Friendly'"),
+])
+def test_prep_validation(body, error):
+    status, payload = _call("POST", "/v1/prep", body)
+    assert status == 422
+    assert any(e.startswith(error) for e in payload["errors"]), payload
+
+
+def test_null_fields_count_as_missing():
+    assert _call("POST", "/v1/pitch", {"pitch_text": "A pitch.", "sources": None})[0] == 200
+
+
+@pytest.mark.parametrize("raw, status", [(b"{not json", 400), (b"\xff", 400), (b"[1, 2]", 422), (b"", 422)])
+def test_malformed_bodies(raw, status):
+    assert _call("POST", "/v1/pitch", raw=raw)[0] == status
+
+
+# ---------- Batch ----------
+
+def test_batch_mixes_results_and_errors_in_order():
+    items = [{"tool": "pitch", **VALID["pitch"]}, {"tool": "pitch"}, {"tool": "nope"}, "not an object"]
+    status, payload = _call("POST", "/v1/batch", {"items": items})
+    assert status == 200
+    first, second, third, fourth = payload["results"]
+    assert "prompt" in first
+    assert second["errors"] == ["Please paste your story pitch before submitting."]
+    assert third["errors"][0].startswith("Unknown tool 'nope'")
+    assert fourth["errors"][0].startswith("Unknown tool None")
+
+
+def test_batch_limits(monkeypatch):
+    assert _call("POST", "/v1/batch", {"items": "x"})[0] == 422
+    monkeypatch.setattr(api, "MAX_BATCH", 2)
+    assert _call("POST", "/v1/batch", {"items": [{}, {}, {}]})[0] == 413
+
+
+# ---------- ASGI ----------
+
+def _asgi(path: str, chunks: list[bytes]) -> tuple[int, bytes]:
+    messages = [{"type": "http.request", "body": c, "more_body": i < len(chunks) - 1} for i, c in enumerate(chunks)]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(api.app({"type": "http", "method": "POST", "path": path}, receive, send))
+    return sent[0]["status"], sent[1]["body"]
+
+
+def test_asgi_reassembles_a_chunked_body():
+    body = json.dumps(VALID["pitch"]).encode()
+    status, out = _asgi("/v1/pitch", [body[:10], body[10:]])
+    assert status == 200 and "prompt" in json.loads(out)
+
+
+def test_asgi_rejects_an_oversized_body(monkeypatch):
+    monkeypatch.setattr(api, "MAX_BODY", 16)
+    assert _asgi("/v1/pitch", [b"x" * 10, b"x" * 10])[0] == 413
+
+
+# ---------- Stdlib server ----------
+
+class _Writer:
+    def __init__(self):
+        self.out = b""
+        self.closed = False
+
+    def write(self, data: bytes):
+        self.out += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def _serve(request: bytes) -> bytes:
+    async def go():
+        reader = asyncio.StreamReader()
+        reader.feed_data(request)
+        reader.feed_eof()
+        writer = _Writer()
+        await api._serve_connection(reader, writer)
+        assert writer.closed
+        return writer.out
+    return asyncio.run(go())
+
+
+def test_server_answers_a_request():
+    body = json.dumps(VALID["pitch"]).encode()
+    out = _serve(b"POST /v1/pitch HTTP/1.1\r\nContent-Length: %d\r\nConnection: close\r\n\r\n" % len(body) + body)
+    assert out.startswith(b"HTTP/1.1 200 OK\r\n") and b'"prompt"' in out
+
+
+@pytest.mark.parametrize("length", [b"abc", b"-5", b"1e3"])
+def test_server_rejects_a_bad_content_length(length):
+    out = _serve(b"POST /v1/pitch HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n{}")
+    assert out.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+    assert out.endswith(b'{"errors":["Bad Content-Length."]}')
@@ -0,0 +1,83 @@
+# tests/test_constraints.py
+# parse_constraints() against the regex cascade it replaced, plus the structured fields
+
+import pytest
+
+from bench_constraints import CORPUS, legacy_infer_time_mode
+from jt_tools.constraints import AUDIO_RECORDING, NO_RECORDING, VIDEO_RECORDING, parse_constraints
+from jt_tools.templates import make_recipe
+
+EXTRA = [
+    # hyphenated durations
+    "10-minute call", "15-minute phone call", "5-min chat", "a 20-minute sit-down", "8 – minute window",
+    "a 60-minute interview", "3-hour ride-along", "7-min", "the 10-min window",
+    # numbers, ranges, qualifiers
+    "45 minutes", "10 minutes", "11 minutes", "1 hour", "2 hrs", "90 min", "5m", "30-45 minutes",
+    "10 to 20 min", "15–20 minutes", "between 20 and 30 minutes", "under 10 minutes", "~10 min",
+    "approx 10 mins", "under 2 hours", "approx 3 hours", "~1 hour", "approximately 2 hrs", "ten minutes tops", "five min", "about forty minutes", "twenty minutes", "Half an hour",
+    # hints and nothing at all
+    "quickly after class", "available after school", "press gaggle", "stand-up", "Q&A", "door stop",
+    "informal chat at lunch", "after the meeting on Tuesday", "", "no idea yet",
+    "We'll meet at the office for 40 minutes", "public records request, 45 minutes", "record the call, 25 min",
+]
+
+
+@pytest.mark.parametrize("text", CORPUS + EXTRA)
+def test_mode_matches_legacy_cascade(text):
+    assert parse_constraints(text).mode == legacy_infer_time_mode(text)
+
+
+@pytest.mark.parametrize("text, minutes", [
+    ("10-minute call", 10), ("15-minute phone call", 15), ("5-min chat", 5), ("a 60-minute interview", 60),
+])
+def test_hyphenated_duration_is_one_value(text, minutes):
+    info = parse_constraints(text)
+    assert (info.min_minutes, info.max_minutes) == (minutes, minutes)
+    assert info.time_label == f"{minutes} minutes"
+
+
+@pytest.mark.parametrize("text, minutes", [
+    ("under 2 hours", 120), ("approx 3 hours", 180), ("~1 hour", 60), ("approximately 2 hrs", 120),
+    ("under 10 minutes", 10), ("approx 10 mins", 10),
+])
+def test_qualified_duration(text, minutes):
+    info = parse_constraints(text)
+    assert (info.min_minutes, info.max_minutes) == (minutes, minutes)
+    assert info.time_label == f"{minutes} minutes"
+
+
+def test_range():
+    info = parse_constraints("Phone interview, maybe 20 to 30 mins.")
+    assert (info.min_minutes, info.max_minutes, info.format) == (20, 30, "phone")
+    assert info.time_label == "20–30 minutes"
+
+
+@pytest.mark.parametrize("text, recording", [
+    ("public records request, 45 minutes", None),
+    ("records show the vote was moved", None),
+    ("recording via zoom with permission", VIDEO_RECORDING),
+    ("plan to record on phone", AUDIO_RECORDING),
+    ("he said no recording", NO_RECORDING),
+    ("can't record, will take notes", NO_RECORDING),
+    ("notebook plus recorder as backup", AUDIO_RECORDING),
+])
+def test_recording(text, recording):
+    assert parse_constraints(text).recording == recording
+
+
+def test_recipe_time_line_uses_hyphenated_duration():
+    recipe = make_recipe(
+        level="High School journalist", lens="Standard News Editor", aim="a", why_person="b",
+        musts=["c"], pushbacks="", constraints="10-minute call", recording="", team_up=None, ethics="",
+    )
+    assert "TIME: 10 minutes" in recipe
+    assert "MODE: SHORT" in recipe
+
+
+def test_recipe_time_line_uses_qualified_hours():
+    recipe = make_recipe(
+        level="High School journalist", lens="Standard News Editor", aim="a", why_person="b",
+        musts=["c"], pushbacks="", constraints="under 2 hours, in person", recording="", team_up=None, ethics="",
+    )
+    assert "TIME: 120 minutes" in recipe
+    assert "MODE: NORMAL" in recipe
@@ -0,0 +1,107 @@
+# tests/test_memory.py
+# Memory governor: idle eviction, spill/rehydrate, and spill file cleanup
+
+import gc
+import os
+import shutil
+import time
+from types import SimpleNamespace
+
+import pytest
+from streamlit.runtime.state.safe_session_state import SafeSessionState
+from streamlit.runtime.state.session_state import SessionState
+
+from jt_tools import memory
+
+BIG_FORM = {"draft": "x" * 64_000, "publication": "The Daily"}
+
+
+@pytest.fixture
+def governor(monkeypatch, tmp_path):
+    monkeypatch.setattr(memory, "_SESSIONS", {})
+    monkeypatch.setattr(memory, "_sweeper", object())  # no background thread
+    monkeypatch.setattr(memory, "SPILL_DIR", str(tmp_path))
+    monkeypatch.setattr(memory, "EVICT_MODE", "spill")
+    return monkeypatch
+
+
+def _run(monkeypatch, state: SessionState, body=lambda s: None):
+    """One script run: like ScriptRunner, a fresh SafeSessionState around the lasting state."""
+    ctx = SimpleNamespace(session_id="s1", session_state=SafeSessionState(state, lambda: None))
+    monkeypatch.setattr(memory, "get_script_run_ctx", lambda: ctx)
+    memory.rehydrate()
+    body(ctx.session_state)
+    memory.track()
+    monkeypatch.setattr(memory, "get_script_run_ctx", lambda: None)
+
+
+def _fill(s):
+    if "qr_form_data" not in s:
+        s["qr_form_data"] = dict(BIG_FORM)
+        s["qr_q1_draft"] = BIG_FORM["draft"]
+
+
+def test_idle_session_is_evicted_and_rehydrated(governor):
+    state = SessionState()
+    _run(governor, state, _fill)
+    gc.collect()  # the run's wrapper is gone; the session is not
+
+    assert memory.memory_report()["sessions"] == 1
+    released = memory.sweep(now=time.time() + memory.IDLE_EVICT_S + 1)
+
+    assert released > 60_000
+    assert "qr_q1_draft" not in state
+    spilled = state["qr_form_data"]
+    assert isinstance(spilled, memory.Spilled)
+    assert memory.memory_report()["max_bytes"] < memory.EVICT_MIN_BYTES
+
+    seen = {}
+    _run(governor, state, lambda s: seen.update(form=s["qr_form_data"]))
+    assert seen["form"] == BIG_FORM
+    assert memory.memory_report()["rehydrations"] >= 1
+
+
+def test_recent_or_running_session_is_kept(governor):
+    state = SessionState()
+    _run(governor, state, _fill)
+    assert memory.sweep() == 0
+
+    entry = memory._SESSIONS["s1"]
+    entry.running = True
+    assert memory.sweep(now=time.time() + memory.IDLE_EVICT_S + 1) == 0
+    assert state["qr_form_data"] == BIG_FORM
+
+
+def test_spill_files_are_private(governor):
+    governor.setattr(memory, "SPILL_DIR", None)
+    spilled = memory._spill("s1", "qr_form_data", BIG_FORM)
+    try:
+        assert os.stat(os.path.dirname(spilled.path)).st_mode & 0o777 == 0o700
+        assert os.stat(spilled.path).st_mode & 0o777 == 0o600
+    finally:
+        shutil.rmtree(os.path.dirname(spilled.path))
+
+
+def test_ended_session_leaves_no_spill_files(governor, tmp_path):
+    state = SessionState()
+    _run(governor, state, _fill)
+    memory.sweep(now=time.time() + memory.IDLE_EVICT_S + 1)
+    path = state["qr_form_data"].path
+    assert os.path.exists(path)
+
+    governor.setattr(memory, "_alive", lambda sid: False)
+    memory.sweep()
+    assert not os.path.exists(path)
+    assert os.listdir(tmp_path) == []
+    assert memory.memory_report()["sessions"] == 0
+
+
+def test_own_spill_dir_is_removed_at_exit(governor):
+    hooks = []
+    governor.setattr(memory.atexit, "register", lambda fn, *args, **kwargs: hooks.append((fn, args, kwargs)))
+    governor.setattr(memory, "SPILL_DIR", None)
+    spilled = memory._spill("s1", "qr_form_data", BIG_FORM)
+    assert len(hooks) == 1
+    fn, args, kwargs = hooks[0]
+    fn(*args, **kwargs)
+    assert not os.path.exists(os.path.dirname(spilled.path))
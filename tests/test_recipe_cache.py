@@ -0,0 +1,92 @@
+# tests/test_recipe_cache.py
+# RecipeCache byte-budget LRU, and key normalisation in cached()
+
+import sys
+
+import pytest
+
+from jt_tools import recipe_cache
+from jt_tools.recipe_cache import RecipeCache, cached, digest
+
+
+def _size(value: str) -> int:
+    return sys.getsizeof(value) + recipe_cache._ENTRY_OVERHEAD
+
+
+def test_hit_returns_the_built_value_without_rebuilding():
+    cache = RecipeCache()
+    builds = []
+    build = lambda: builds.append(1) or "prompt"
+    assert cache.get_or_build("k", build) == "prompt"
+    assert cache.get_or_build("k", build) == "prompt"
+    assert len(builds) == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_byte_budget_evicts_least_recently_used_first():
+    value = "x" * 1000
+    cache = RecipeCache(max_bytes=_size(value) * 3)
+    for k in "abc":
+        cache.get_or_build(k, lambda: value)
+    cache.get_or_build("a", lambda: value)  # a is now the most recent
+    cache.get_or_build("d", lambda: value)
+
+    stats = cache.stats()
+    assert stats["entries"] == 3 and stats["evictions"] == 1
+    assert stats["bytes"] == _size(value) * 3 <= stats["max_bytes"]
+    assert cache.get_or_build("a", lambda: "rebuilt") == value
+    assert cache.get_or_build("b", lambda: "rebuilt") == "rebuilt"
+
+
+def test_value_over_the_whole_budget_is_not_stored():
+    cache = RecipeCache(max_bytes=100)
+    assert cache.get_or_build("k", lambda: "x" * 1000) == "x" * 1000
+    assert cache.stats()["entries"] == 0 and cache.stats()["bytes"] == 0
+
+
+def test_replacing_a_key_keeps_the_byte_count_exact():
+    cache = RecipeCache()
+    cache._put("k", "short")
+    cache._put("k", "a much longer value")
+    assert cache.stats()["bytes"] == _size("a much longer value")
+    cache.clear()
+    assert cache.stats()["bytes"] == 0
+
+
+@pytest.fixture
+def builder(monkeypatch):
+    monkeypatch.setattr(recipe_cache, "RECIPES", RecipeCache())
+    calls = []
+
+    @cached("test")
+    def build(level, *, draft, tags=()):
+        calls.append((level, draft, tags))
+        return f"{level}|{draft}|{','.join(tags)}"
+
+    return build, calls
+
+
+def test_cached_normalizes_whitespace_and_newlines(builder):
+    build, calls = builder
+    first = build("HS", draft="line one\nline two", tags=["a", "b"])
+    again = build("  HS\r\n", draft="line one\r\nline two  ", tags=("a ", "b"))
+    assert first == again == "HS|line one\nline two|a,b"
+    assert len(calls) == 1
+    assert calls[0] == ("HS", "line one\nline two", ("a", "b"))  # the builder sees normalized input
+
+
+def test_cached_keys_on_every_input(builder):
+    build, calls = builder
+    build("HS", draft="d")
+    build("College", draft="d")
+    build("HS", draft="d2")
+    build("HS", draft="d", tags=("t",))
+    assert len(calls) == 4
+    assert build.__wrapped__("HS", draft=" raw ") == "HS| raw |"
+
+
+def test_digest_separates_kinds_and_field_boundaries():
+    assert digest("a", ("x",), {}) != digest("b", ("x",), {})
+    assert digest("k", ("ab", "c"), {}) != digest("k", ("a", "bc"), {})
+    assert digest("k", (), {"a": "1", "b": "2"}) == digest("k", (), {"b": "2", "a": "1"})
+    assert digest("k", (1,), {}) != digest("k", ("1",), {})
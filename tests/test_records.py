@@ -0,0 +1,53 @@
+# tests/test_records.py
+# Typed form records: pack/unpack, from_state, slots and accounting
+
+import pytest
+
+from jt_tools import records
+from jt_tools.records import RECORDS, EventForm, FormRecord, PitchForm
+
+
+def _filled(cls: type[FormRecord]) -> FormRecord:
+    return cls(**{f: f"{f} — “answer” é" for f in cls.FIELDS})
+
+
+@pytest.mark.parametrize("kind", sorted(RECORDS))
+def test_pack_unpack_round_trip(kind):
+    rec = _filled(RECORDS[kind])
+    back = FormRecord.unpack(rec.pack())
+    assert type(back) is type(rec) and back == rec
+
+
+def test_pack_is_positional_and_keeps_unanswered_fields():
+    rec = PitchForm(pitch_text="x", coaching_style="Gentle")
+    blob = rec.pack()
+    assert blob.startswith(b'["pitch","x",null')
+    assert b"pitch_text" not in blob
+    assert FormRecord.unpack(blob).to_dict() == {"pitch_text": "x", "coaching_style": "Gentle"}
+
+
+def test_unpack_rejects_wrong_arity_and_unknown_kind():
+    with pytest.raises(ValueError):
+        FormRecord.unpack(b'["pitch","only one"]')
+    with pytest.raises(KeyError):
+        FormRecord.unpack(b'["nope"]')
+
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(TypeError):
+        EventForm(q1_headline="x", pitch_text="wrong form")
+
+
+def test_from_state_reads_prefixed_widget_keys():
+    state = {"event_q1_headline": "Budget vote", "event_coaching_style": "Direct", "other": 1}
+    rec = EventForm.from_state(state)
+    assert rec.to_dict() == {"q1_headline": "Budget vote", "coaching_style": "Direct"}
+    assert EventForm.from_state({"x_q1_headline": "y"}, prefix="x_").q1_headline == "y"
+
+
+def test_records_have_no_instance_dict_and_report_their_size():
+    rec = _filled(EventForm)
+    assert not hasattr(rec, "__dict__")
+    assert rec.nbytes() > sum(len(getattr(rec, f)) for f in EventForm.FIELDS)
+    state = {EventForm.SESSION_KEY: rec, PitchForm.SESSION_KEY: None}
+    assert records.session_nbytes(state) == rec.nbytes()
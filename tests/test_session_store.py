@@ -0,0 +1,192 @@
+# tests/test_session_store.py
+# Session store: serialization, backends, write-behind, and restore()/persist()
+
+import json
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from jt_tools import session_store
+from jt_tools.records import ConfirmForm, PitchForm
+from jt_tools.session_store import MemoryStore, SQLiteStore, WriteBehind, dumps, from_url, loads
+
+STATE = {
+    "page": "quick_review",
+    "journalism_level": "College journalist",
+    "qr_form_data": {"draft": "Café owners say “no” — 3 of them.", "publication": "The Daily"},
+    "pitch_form": PitchForm(pitch_text="A pitch", sources="Two council members"),
+}
+
+
+# ---------- Serialization ----------
+
+def test_round_trip_keeps_records_and_unicode():
+    assert loads(dumps(STATE)) == STATE
+
+
+def test_short_snapshots_stay_plain_and_long_ones_compress():
+    assert dumps({"page": "portal"})[:1] == b"j"
+    big = {"qr_form_data": {"draft": "The council voted. " * 200}}
+    blob = dumps(big)
+    assert blob[:1] == b"z" and len(blob) < len(json.dumps(big)) // 10
+    assert loads(blob) == big
+
+
+def test_records_are_stored_positionally():
+    assert b"pitch_text" not in dumps({"pitch_form": PitchForm(pitch_text="x")})
+
+
+def test_unknown_tag_and_foreign_objects_are_rejected():
+    with pytest.raises(ValueError):
+        loads(b"xsomething")
+    with pytest.raises(TypeError):
+        dumps({"page": object()})
+
+
+# ---------- Backends ----------
+
+def test_memory_store_expires(monkeypatch):
+    store = MemoryStore(ttl_s=10)
+    store.put_many({"a": b"j{}"})
+    assert store.get("a") == b"j{}"
+    monkeypatch.setattr(session_store.time, "time", lambda: 2e10)
+    assert store.get("a") is None
+
+
+def test_sqlite_store_round_trip(tmp_path):
+    store = from_url(f"sqlite:///{tmp_path / 'sessions.db'}")
+    assert isinstance(store, SQLiteStore)
+    store.put_many({"a": b"j1", "b": b"j2"})
+    store.put_many({"a": b"j3"})
+    assert (store.get("a"), store.get("b"), store.get("c")) == (b"j3", b"j2", None)
+    store.delete("a")
+    assert store.get("a") is None
+    store.close()
+
+
+def test_from_url():
+    assert from_url("") is None
+    assert isinstance(from_url("memory"), MemoryStore)
+    with pytest.raises(ValueError):
+        from_url("redis://localhost")
+
+
+def test_write_behind_coalesces_and_keeps_failed_batches():
+    class Flaky(MemoryStore):
+        fail = True
+
+        def put_many(self, items):
+            if self.fail:
+                raise OSError("disk full")
+            super().put_many(items)
+
+    backend = Flaky()
+    buffer = WriteBehind(backend, interval_s=3600)
+    buffer._thread = object()  # flush by hand
+    buffer.put("a", b"j1")
+    buffer.put("a", b"j2")
+    assert buffer.get("a") == b"j2" and buffer.stats()["coalesced"] == 1
+
+    buffer.flush()
+    assert backend.get("a") is None and buffer.stats()["pending"] == 1
+    backend.fail = False
+    buffer.flush()
+    assert backend.get("a") == b"j2"
+    assert buffer.stats() == {"pending": 0, "writes": 1, "batches": 1, "coalesced": 1}
+
+
+# ---------- restore() / persist() ----------
+
+def _app():
+    import streamlit as st
+
+    from jt_tools import session_store
+    from jt_tools.records import ConfirmForm
+
+    session_store.restore()
+    st.session_state.setdefault("page", "portal")
+    if st.session_state.get("fill"):
+        st.session_state.page = "grr"
+        st.session_state.confirm_form = ConfirmForm(q1_claim="The mayor lied", q3_stakes="High")
+        st.session_state.fill = False
+    session_store.persist()
+
+
+@pytest.fixture
+def store(monkeypatch):
+    buffer = WriteBehind(MemoryStore(), interval_s=3600)
+    buffer._thread = object()
+    monkeypatch.setattr(session_store, "STORE", buffer)
+    return buffer
+
+
+def _sid(at: AppTest) -> str:
+    sid = at.query_params[session_store.QUERY_PARAM]
+    return sid[0] if isinstance(sid, list) else sid
+
+
+def test_persist_then_restore_in_a_new_session(store):
+    first = AppTest.from_function(_app)
+    first.session_state["fill"] = True
+    first.run()
+    sid = _sid(first)
+    assert sid and store.stats()["pending"] == 1
+
+    store.flush()
+    second = AppTest.from_function(_app)
+    second.query_params[session_store.QUERY_PARAM] = sid
+    second.run()
+    assert second.session_state["page"] == "grr"
+    assert second.session_state["confirm_form"] == ConfirmForm(q1_claim="The mayor lied", q3_stakes="High")
+
+    # The token was spent: the state now lives under a fresh one only.
+    fresh = _sid(second)
+    assert fresh != sid and store.get(sid) is None
+    assert loads(store.get(fresh))["page"] == "grr"
+
+
+def test_a_copied_link_restores_nothing_once_used(store):
+    first = AppTest.from_function(_app)
+    first.session_state["fill"] = True
+    first.run()
+    store.flush()
+    link = _sid(first)
+
+    owner = AppTest.from_function(_app)
+    owner.query_params[session_store.QUERY_PARAM] = link
+    owner.run()
+    copy = AppTest.from_function(_app)
+    copy.query_params[session_store.QUERY_PARAM] = link
+    copy.run()
+    assert owner.session_state["page"] == "grr"
+    assert copy.session_state["page"] == "portal" and "confirm_form" not in copy.session_state
+    assert _sid(copy) != _sid(owner)
+
+
+def test_the_draft_is_never_persisted(store):
+    at = AppTest.from_function(_app)
+    at.session_state["qr_form_data"] = {"draft": "Secret draft"}
+    at.run()
+    assert b"Secret draft" not in store.get(_sid(at))
+
+
+def test_admin_request_wins_over_a_restored_page(store, monkeypatch):
+    from jt_tools import profiling
+
+    monkeypatch.setattr(profiling, "ADMIN_TOKEN", "t" * 24)
+    store.put("A" * 22, dumps({"page": "portal"}))
+    at = AppTest.from_file("../app.py", default_timeout=60)
+    at.query_params[session_store.QUERY_PARAM] = "A" * 22
+    at.query_params[profiling.ADMIN_PARAM] = "t" * 24
+    at.run()
+    assert not at.exception
+    assert at.session_state["page"] == "admin"
+
+
+def test_unchanged_state_is_not_queued_again(store):
+    at = AppTest.from_function(_app)
+    at.run()
+    store.flush()
+    at.run()
+    at.run()
+    assert store.stats()["pending"] == 0 and store.stats()["writes"] == 1
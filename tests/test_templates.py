@@ -0,0 +1,39 @@
+# tests/test_templates.py
+# Golden outputs: the interview-prep recipe, byte for byte
+#
+# The files in tests/golden/ marked as baseline were produced by the
+# original inline f-string builder; constraints with no time or format in
+# them render exactly as they always did. The parsed case pins the
+# FORMAT/TIME lines the constraints parser fills in.
+
+from pathlib import Path
+
+import pytest
+
+from jt_tools import templates
+
+GOLDEN = Path(__file__).parent / "golden"
+
+PREP_CASES = {
+    "prep_high_school_short": (dict(
+        level="High School journalist", lens="News Editor", aim="Why the library closed",
+        why_person="Budget director (Interview subject: Dana)", musts=["Who asked", "When", "who asked "],
+        pushbacks="Refers questions to the mayor", constraints="be brief, short slot", recording="Phone app",
+        team_up="Pair with Sam", ethics="A minor is involved"), True),
+    "prep_working_empty": (dict(
+        level="Working journalist", lens="Skeptical Editor", aim=" aim ", why_person="why", musts=[],
+        pushbacks="", constraints="", recording="", team_up=None, ethics=""), True),
+    "prep_undergrad_parsed": (dict(
+        level="Undergraduate journalist", lens="Audience Advocate", aim="What the closure costs readers",
+        why_person="Branch manager", musts=["Opening hours"], pushbacks="Cites policy",
+        constraints="about 45 minutes in person", recording="Recorder, with consent", team_up="",
+        ethics="None"), False),
+}
+
+
+@pytest.mark.parametrize("name", sorted(PREP_CASES))
+def test_prep_recipe_matches_golden(name):
+    kwargs, _ = PREP_CASES[name]
+    expected = (GOLDEN / f"{name}.txt").read_text(encoding="utf-8")
+    assert templates.make_recipe.__wrapped__.__wrapped__(**kwargs) == expected
+    assert templates.make_recipe(**kwargs) == expected  # through the recipe cache too